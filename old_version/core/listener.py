@@ -1,19 +1,28 @@
 """Global hotkey listener module."""
 
+import queue
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Optional, Dict, Set, Tuple
 
 from PyQt5.QtCore import QThread, pyqtSignal
 from pynput import keyboard
 
 from core.logger import get_logger
-from utils.selected_text import get_selected_text  # 预加载，避免首次调用延迟
+from utils.selected_text import (  # 预加载，避免首次调用延迟
+    can_capture_passively, get_selected_text, get_selected_text_passive, is_injecting,
+)
 
 logger = get_logger("Listener")
 
 # 常量定义
 TIME_LIMIT: float = 0.2  # 双击时间限制（秒）
 COOLDOWN_TIME: float = 1.0  # 冷却时间（秒）
+SPECULATIVE_WAIT: float = 0.5  # 第二次按键后等待预获取结果的最长时间（秒）
+
+# 键盘回调推送给处理线程的事件类型
+EVENT_TAP = "tap"        # 第一次单独敲击热键
+EVENT_DOUBLE = "double"  # 双击热键
 
 # 支持的热键映射
 HOTKEY_MAP: Dict[str, Tuple[Set, str]] = {
@@ -74,6 +83,19 @@ class Listener(QThread):
         self._is_append: bool = False
         self._running: bool = True
         self._keyboard_listener: Optional[keyboard.Listener] = None
+        
+        # 单独按下修饰键（期间没有按其他键）才视为一次"敲击"，用于预获取
+        self._pressed_key_type: Optional[str] = None
+        self._other_key_pressed: bool = False
+        
+        # 第一次敲击时在后台预先获取选中文本，第二次敲击直接取结果
+        self._capture_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SpeculativeCapture")
+        self._speculative_capture: Optional[Tuple[str, float, Future]] = None
+        
+        # 键盘回调只负责识别事件并入队，获取文本等耗时操作在监听线程中执行，
+        # 避免阻塞系统键盘钩子
+        self._events: "queue.SimpleQueue[Optional[Tuple[str, str, float]]]" = queue.SimpleQueue()
+        self.last_trigger_latency_ms: float = 0.0  # 最近一次从松开按键到发出信号的耗时
     
     def set_translate_hotkey(self, key: str, enabled: bool) -> None:
         """设置翻译热键。"""
@@ -88,17 +110,30 @@ class Listener(QThread):
         logger.info(f"附加热键设置为: 双击{key.upper()}, 启用={enabled}")
     
     def run(self) -> None:
-        """启动键盘监听。"""
+        """启动键盘监听，并在当前线程中处理热键事件。"""
         logger.info(f"热键监听器已启动 (翻译:{self._translate_key}, 附加:{self._append_key})")
-        self._keyboard_listener = keyboard.Listener(on_release=self._on_release)
+        self._keyboard_listener = keyboard.Listener(
+            on_press=self._on_press,
+            on_release=self._on_release,
+        )
         self._keyboard_listener.start()
-        self._keyboard_listener.join()
+        
+        while self._running:
+            event = self._events.get()
+            if event is None:
+                break
+            try:
+                self._process_event(*event)
+            except Exception as e:
+                logger.error(f"热键事件处理错误: {e}")
     
     def stop(self) -> None:
         """停止监听器。"""
         self._running = False
         if self._keyboard_listener:
             self._keyboard_listener.stop()
+        self._events.put(None)
+        self._capture_executor.shutdown(wait=False)
         logger.info("热键监听器已停止")
     
     def _get_key_type(self, key: keyboard.Key) -> Optional[str]:
@@ -108,8 +143,19 @@ class Listener(QThread):
                 return key_type
         return None
     
+    def _on_press(self, key: keyboard.Key) -> None:
+        """记录按键按下，用于区分单独敲击修饰键和组合键。"""
+        if not self._running or is_injecting():
+            return
+        key_type = self._get_key_type(key)
+        if key_type is None:
+            self._other_key_pressed = True
+        elif key_type != self._pressed_key_type:
+            self._pressed_key_type = key_type
+            self._other_key_pressed = False
+    
     def _on_release(self, key: keyboard.Key) -> None:
-        """处理按键释放事件。"""
+        """处理按键释放事件（键盘钩子线程，只做识别，不做耗时操作）。"""
         if not self._running:
             return
         
@@ -118,6 +164,13 @@ class Listener(QThread):
             if key_type is None:
                 return
             
+            # 忽略获取文本时模拟的 Ctrl 按键
+            if is_injecting():
+                return
+            
+            clean_tap = key_type == self._pressed_key_type and not self._other_key_pressed
+            self._pressed_key_type = None
+            
             current_time = time.time()
             
             # 检查是否在冷却期（非阻塞方式）
@@ -127,59 +180,134 @@ class Listener(QThread):
             # 检查是否双击
             if current_time - self._key_times.get(key_type, 0) < TIME_LIMIT:
                 self._key_times[key_type] -= TIME_LIMIT  # 防止连续触发
-                self._handle_double_press(key_type)
+                self._classify_double_press(key_type, current_time)
             else:
                 self._key_times[key_type] = current_time
+                if clean_tap and self._is_hotkey(key_type):
+                    self._events.put((EVENT_TAP, key_type, current_time))
                 
         except Exception as e:
             logger.error(f"键盘事件处理错误: {e}")
     
-    def _handle_double_press(self, key_type: str) -> None:
-        """处理双击事件。"""
+    def _is_hotkey(self, key_type: str) -> bool:
+        """是否为已启用的热键。"""
+        return (
+            (key_type == self._translate_key and self._translate_enabled)
+            or (key_type == self._append_key and self._append_enabled)
+        )
+    
+    def _classify_double_press(self, key_type: str, release_time: float) -> None:
+        """识别双击对应的热键并入队。"""
         # 检查是否是翻译热键
         if key_type == self._translate_key and self._translate_enabled:
-            self._on_translate()
             # 使用时间戳实现非阻塞冷却
-            self._cooldown_end_times[key_type] = time.time() + COOLDOWN_TIME
+            self._cooldown_end_times[key_type] = release_time + COOLDOWN_TIME
+            self._events.put((EVENT_DOUBLE, key_type, release_time))
         
         # 检查是否是附加热键
         elif key_type == self._append_key and self._append_enabled:
-            self._on_append()
+            # 重置翻译热键时间避免触发
+            self._key_times[self._translate_key] = 0
+            self._events.put((EVENT_DOUBLE, key_type, release_time))
     
-    def _on_translate(self) -> None:
+    def _process_event(self, event_type: str, key_type: str, event_time: float) -> None:
+        """处理队列中的热键事件（监听线程）。"""
+        if event_type == EVENT_TAP:
+            self._start_speculative_capture(key_type, event_time)
+        elif event_type == EVENT_DOUBLE:
+            self._handle_double_press(key_type, event_time)
+    
+    def _record_latency(self, action: str, release_time: float) -> None:
+        """记录从松开按键到发出信号的耗时。"""
+        self.last_trigger_latency_ms = (time.time() - release_time) * 1000
+        logger.debug(f"{action}热键响应耗时 {self.last_trigger_latency_ms:.1f} ms")
+    
+    def _start_speculative_capture(self, key_type: str, tap_time: float) -> None:
+        """
+        第一次敲击热键时在后台预先获取选中文本。
+
+        单次敲击 Ctrl/Shift 十分常见，此时还不能确定用户要翻译，因此只用
+        无副作用的方式预获取；只能模拟 Ctrl+C 复制时（终端中即中断信号，
+        还会改写剪贴板）等到确认双击后再获取。
+        """
+        if not can_capture_passively():
+            return
+        # 上一次预获取尚未完成时不再排队，避免积压
+        previous = self._speculative_capture
+        if previous is not None and not previous[2].done():
+            return
+        future = self._capture_executor.submit(get_selected_text_passive)
+        self._speculative_capture = (key_type, tap_time, future)
+    
+    def _take_speculative_capture(self, key_type: str) -> Optional[str]:
+        """
+        取出与本次双击匹配的预获取结果。
+        
+        Returns:
+            预获取的文本；没有匹配的预获取、获取失败或未取到文本时返回None
+        """
+        speculative, self._speculative_capture = self._speculative_capture, None
+        if speculative is None:
+            return None
+        spec_key_type, tap_time, future = speculative
+        if spec_key_type != key_type or time.time() - tap_time > TIME_LIMIT + SPECULATIVE_WAIT:
+            # 过期的预获取直接丢弃
+            return None
+        try:
+            text = future.result(timeout=SPECULATIVE_WAIT)
+        except FutureTimeoutError:
+            logger.debug("预获取超时，改为同步获取")
+            return None
+        except Exception as e:
+            logger.debug(f"预获取失败: {e}")
+            return None
+        if text is None:
+            logger.debug("预获取未取到文本，改为同步获取")
+            return None
+        logger.debug("使用预获取的选中文本")
+        return text
+    
+    def _handle_double_press(self, key_type: str, release_time: float) -> None:
+        """处理双击事件。"""
+        if key_type == self._translate_key:
+            self._on_translate(release_time)
+        elif key_type == self._append_key:
+            self._on_append(release_time)
+    
+    def _on_translate(self, release_time: float) -> None:
         """处理翻译热键事件。"""
         try:
-            text = self._get_selected_text()
+            text = self._get_selected_text(self._translate_key)
             
             if self._is_append:
                 self._is_append = False
                 if text == self._text_before:
-                    self.translate_triggered.emit("")
-                else:
-                    self.translate_triggered.emit(text)
-            else:
-                if text == "":
-                    text = self._text_before
-                self.translate_triggered.emit(text)
+                    text = ""
+            elif text == "":
+                text = self._text_before
+            
+            self._record_latency("翻译", release_time)
+            self.translate_triggered.emit(text)
             
             self._text_before = text if text != "" else self._text_before
             
         except Exception as e:
             logger.error(f"翻译热键处理错误: {e}")
     
-    def _on_append(self) -> None:
+    def _on_append(self, release_time: float) -> None:
         """处理附加热键事件。"""
-        # 重置翻译热键时间避免触发
-        self._key_times[self._translate_key] = 0
-        text = self._get_selected_text()
+        text = self._get_selected_text(self._append_key)
         self._text_before = text
+        self._record_latency("附加", release_time)
         self.append_triggered.emit(text)
         self._is_append = True
     
-    def _get_selected_text(self) -> str:
-        """获取选中的文本。"""
-        logger.debug("正在获取选中文本...")
-        text = get_selected_text()
+    def _get_selected_text(self, key_type: str) -> str:
+        """获取选中的文本，优先使用第一次敲击时的预获取结果。"""
+        text = self._take_speculative_capture(key_type)
+        if text is None:
+            logger.debug("正在获取选中文本...")
+            text = get_selected_text()
         text = self._format_text(text)
         
         if text:
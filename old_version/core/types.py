@@ -1,8 +1,20 @@
 """Type definitions for the application."""
 
+import re
+import sys
+import uuid
 from dataclasses import dataclass, field
 from typing import List, Optional, Callable, Any
-from datetime import datetime
+from datetime import datetime, timedelta
+
+
+def split_api_keys(value: str) -> List[str]:
+    """将按换行、逗号或空白分隔的多个API密钥拆分为去重后的列表。"""
+    keys: List[str] = []
+    for key in re.split(r"[\s,;]+", value or ""):
+        if key and key not in keys:
+            keys.append(key)
+    return keys
 
 
 @dataclass
@@ -11,12 +23,21 @@ class APIProfile:
     name: str
     api_key: str
     base_url: str
+    rpm_limit: int = 0   # 每分钟请求数限额，0表示由服务端响应头自动校准
+    tpm_limit: int = 0   # 每分钟token数限额，0表示由服务端响应头自动校准
+    
+    @property
+    def api_keys(self) -> List[str]:
+        """密钥池（api_key 中可按行填写多个密钥）。"""
+        return split_api_keys(self.api_key)
     
     def to_dict(self) -> dict:
         return {
             "name": self.name,
             "api_key": self.api_key,
             "base_url": self.base_url,
+            "rpm_limit": self.rpm_limit,
+            "tpm_limit": self.tpm_limit,
         }
     
     @classmethod
@@ -25,6 +46,8 @@ class APIProfile:
             name=data.get("name", ""),
             api_key=data.get("api_key", ""),
             base_url=data.get("base_url", ""),
+            rpm_limit=int(data.get("rpm_limit", 0) or 0),
+            tpm_limit=int(data.get("tpm_limit", 0) or 0),
         )
 
 
@@ -73,6 +96,7 @@ class LanguageInfo:
     """语言信息。"""
     code: str       # 英文代码，如 "Chinese"
     native: str     # 本地名称，如 "中文"
+    confidence: float = field(default=1.0, compare=False)  # 检测置信度 (0~1)
 
 
 @dataclass
@@ -85,6 +109,14 @@ class TranslationRequest:
     api_key: str
     base_url: str
     model: str
+    api_name: str = ""   # API配置名称
+    rpm_limit: int = 0   # 每分钟请求数限额
+    tpm_limit: int = 0   # 每分钟token数限额
+    
+    @property
+    def api_keys(self) -> List[str]:
+        """请求可轮换使用的密钥列表。"""
+        return split_api_keys(self.api_key)
 
 
 @dataclass
@@ -94,19 +126,124 @@ class TranslationResult:
     content: str
     error: Optional[str] = None
     from_cache: bool = False
+    preempted: bool = False  # 被更高优先级请求抢占（调用方可重新提交）
+    segments: Optional[List["TranslationResult"]] = None  # 批量翻译时各片段的结果
 
 
-@dataclass
 class TranslationRecord:
-    """翻译记录，保存原文-翻译对应关系。"""
-    id: str                          # 唯一标识符
-    source_text: str                 # 原文
-    translated_text: str             # 翻译结果
-    source_language: str             # 源语言代码
-    target_language: str             # 目标语言代码
-    timestamp: str                   # 创建时间 ISO格式
-    model: str = ""                  # 使用的模型
-    skill: str = ""                  # 使用的技能名称
+    """翻译记录，保存原文-翻译对应关系。
+
+    历史记录可能有数十万条，因此不使用普通 dataclass：实例使用
+    __slots__，UUID 形式的ID以16字节保存，ISO 格式的时间以纪元微秒整数
+    保存（需要时再格式化），语言、模型、技能等重复取值的字段驻留为同一
+    字符串对象。无法无损转换的ID或时间按原字符串保存，to_dict/from_dict
+    的格式不变。
+    """
+
+    __slots__ = (
+        "_key", "source_text", "translated_text", "source_language",
+        "target_language", "_time", "model", "skill",
+    )
+
+    _EPOCH = datetime(1970, 1, 1)
+
+    def __init__(
+        self,
+        id: str,                         # 唯一标识符
+        source_text: str,                # 原文
+        translated_text: str,            # 翻译结果
+        source_language: str,            # 源语言代码
+        target_language: str,            # 目标语言代码
+        timestamp: str,                  # 创建时间 ISO格式
+        model: str = "",                 # 使用的模型
+        skill: str = "",                 # 使用的技能名称
+    ):
+        self._key = self.key_of(id)
+        self.source_text = source_text
+        self.translated_text = translated_text
+        self.source_language = sys.intern(source_language)
+        self.target_language = sys.intern(target_language)
+        self.timestamp = timestamp
+        self.model = sys.intern(model)
+        self.skill = sys.intern(skill)
+
+    @staticmethod
+    def key_of(record_id):
+        """
+        将记录ID转换为内部键（规范 UUID 转为16字节，其余保持原样）。
+
+        Args:
+            record_id: 记录ID字符串（已是内部键时原样返回）
+
+        Returns:
+            内部键
+        """
+        if isinstance(record_id, bytes):
+            return record_id
+        if (
+            isinstance(record_id, str) and len(record_id) == 36 and record_id == record_id.lower()
+            and record_id[8] == record_id[13] == record_id[18] == record_id[23] == "-"
+        ):
+            try:
+                return bytes.fromhex(record_id.replace("-", ""))
+            except ValueError:
+                pass
+        return record_id
+
+    @property
+    def key(self):
+        """内部键，内存中的索引以此作为字典键，避免为每条记录保留ID字符串。"""
+        return self._key
+
+    @property
+    def id(self) -> str:
+        key = self._key
+        if isinstance(key, bytes):
+            h = key.hex()
+            return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+        return key
+
+    @id.setter
+    def id(self, value: str) -> None:
+        self._key = self.key_of(value)
+
+    @property
+    def timestamp(self) -> str:
+        value = self._time
+        if isinstance(value, int):
+            return (self._EPOCH + timedelta(microseconds=value)).isoformat()
+        return value
+
+    @timestamp.setter
+    def timestamp(self, value: str) -> None:
+        self._time = value
+        try:
+            moment = datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            return
+        if moment.tzinfo is None and moment.isoformat() == value:
+            self._time = (moment - self._EPOCH) // timedelta(microseconds=1)
+
+    def _fields(self) -> tuple:
+        return (
+            self.id, self.source_text, self.translated_text, self.source_language,
+            self.target_language, self.timestamp, self.model, self.skill,
+        )
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"TranslationRecord(id={self.id!r}, source_text={self.source_text!r}, "
+            f"translated_text={self.translated_text!r}, source_language={self.source_language!r}, "
+            f"target_language={self.target_language!r}, timestamp={self.timestamp!r}, "
+            f"model={self.model!r}, skill={self.skill!r})"
+        )
     
     def to_dict(self) -> dict:
         return {
@@ -144,7 +281,6 @@ class TranslationRecord:
         skill: str = "",
     ) -> "TranslationRecord":
         """创建新的翻译记录。"""
-        import uuid
         return cls(
             id=str(uuid.uuid4()),
             source_text=source_text,
@@ -174,6 +310,7 @@ class AppConfig:
     prompt: str = ""
     # 显示配置
     show_source_comparison: bool = False  # 原文对照模式
+    speculative_translation: bool = False  # 附加文本静止后预先低优先级翻译
     
     def to_dict(self) -> dict:
         return {
@@ -189,6 +326,7 @@ class AppConfig:
             "target_language": self.target_language,
             "prompt": self.prompt,
             "show_source_comparison": self.show_source_comparison,
+            "speculative_translation": self.speculative_translation,
         }
     
     @classmethod
@@ -215,6 +353,7 @@ class AppConfig:
             target_language=data.get("target_language", "English"),
             prompt=data.get("prompt", ""),
             show_source_comparison=data.get("show_source_comparison", False),
+            speculative_translation=data.get("speculative_translation", False),
         )
     
     def get_selected_skill(self) -> Optional[Skill]:
@@ -5,6 +5,7 @@ CRKT - CRK Translator
 
 import sys
 import os
+import time
 
 from PyQt5.QtWidgets import QApplication, QMessageBox
 from PyQt5.QtGui import QIcon
@@ -13,6 +14,7 @@ from core.logger import setup_logging, get_logger
 from core.types import AppConfig
 from core.listener import Listener
 from models.config_manager import ConfigManager
+from models.blob_store import BlobStore
 from models.cache_manager import CacheManager
 from models.language_detector import LanguageDetector
 from models.translation_service import TranslationService
@@ -21,6 +23,7 @@ from views.tray_icon import TrayIconView
 from views.display_window import DisplayWindowView
 from views.settings_dialog import SettingsDialog
 from presenters.app_presenter import AppPresenter
+from utils.clipboard_watcher import install_clipboard_watcher
 
 
 def get_app_directory() -> str:
@@ -59,6 +62,9 @@ def create_application() -> tuple:
     qt_app = QApplication(sys.argv)
     qt_app.setQuitOnLastWindowClosed(False)
     
+    # 剪贴板变化通知（获取选中文本时等待事件而非轮询）
+    install_clipboard_watcher(qt_app)
+    
     # 初始化图标
     icon_path = os.path.join(app_dir, "icon.png")
     if not os.path.exists(icon_path):
@@ -70,10 +76,12 @@ def create_application() -> tuple:
     
     # 创建Model层组件
     config_manager = ConfigManager(app_dir)
+    # 缓存和历史记录共用的文本存储
+    blob_store = BlobStore(os.path.join(data_dir, "blobs.jsonl"))
     cache_path = os.path.join(data_dir, "cache.pkl")
-    cache_manager = CacheManager(cache_path)
+    cache_manager = CacheManager(cache_path, blobs=blob_store)
     history_path = os.path.join(data_dir, "history.json")
-    history_manager = HistoryManager(history_path)
+    history_manager = HistoryManager(history_path, blobs=blob_store)
     language_detector = LanguageDetector()
     translation_service = TranslationService(cache_manager)
     
@@ -121,8 +129,10 @@ def main() -> int:
         退出码
     """
     try:
+        start = time.perf_counter()
         qt_app, presenter = create_application()
         presenter.start()
+        get_logger().info(f"托盘已就绪，启动耗时 {(time.perf_counter() - start) * 1000:.0f}ms")
         return qt_app.exec_()
         
     except Exception as e:
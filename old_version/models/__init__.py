@@ -5,6 +5,10 @@ from .cache_manager import CacheManager
 from .language_detector import LanguageDetector
 from .translation_service import TranslationService
 from .history_manager import HistoryManager
+from .prompt_template import PromptTemplate, compile_prompt
+from .rate_limiter import RateLimiter, RateLimiterRegistry
+from .key_pool import APIKeyPool, APIKeyPoolRegistry
+from .request_scheduler import Priority, RequestScheduler
 
 __all__ = [
     "ConfigManager",
@@ -12,4 +16,12 @@ __all__ = [
     "LanguageDetector",
     "TranslationService",
     "HistoryManager",
+    "PromptTemplate",
+    "compile_prompt",
+    "RateLimiter",
+    "RateLimiterRegistry",
+    "APIKeyPool",
+    "APIKeyPoolRegistry",
+    "Priority",
+    "RequestScheduler",
 ]
@@ -0,0 +1,181 @@
+"""Content-addressed text store module."""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Set
+
+from core.logger import get_logger
+
+logger = get_logger("BlobStore")
+
+# 条目数超过存活文本数的倍数（且不少于最小条目数）时重写文件
+COLLECT_RATIO: float = 2.0
+COLLECT_MIN_ENTRIES: int = 500
+
+DIGEST_SIZE = 16
+
+
+class BlobStore:
+    """按内容寻址的文本存储（哈希 -> 文本）。
+
+    缓存和历史记录只保存文本的哈希，相同文本在内存和磁盘上都只存一份。
+    put() 只更新内存，新文本在 sync() 时才以 JSONL 追加写入文件（引用方
+    须先 sync() 再写入引用），加载时全部读入内存（只有缓存和未归档的历史
+    引用这里的文本，数量有限）。不再被引用的文本由 collect() 回收：各使用
+    方通过 add_owner() 登记返回存活哈希的回调，回调返回 None 表示尚未
+    就绪（如历史记录仍在加载），此时不回收。使用方先 put() 再登记引用，
+    两步之间回收可能看不到该引用，因此上次回收之后存入的文本保留到下次
+    回收。
+    """
+
+    def __init__(self, path: str):
+        """
+        初始化存储。
+
+        Args:
+            path: 存储文件路径
+        """
+        self._path = path
+        self._texts: Dict[bytes, str] = {}
+        self._owners: List[Callable[[], Optional[Set[bytes]]]] = []
+        self._lock = threading.Lock()
+        self._file = None
+        self._pending: List[bytes] = []    # 尚未写入文件的条目
+        self._recent: Set[bytes] = set()   # 上次回收之后存入的哈希，本次回收时保留
+        self._entries = 0
+        self._next_check = COLLECT_MIN_ENTRIES   # 条目数达到该值时再检查是否需要回收
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, digest: bytes) -> bool:
+        return digest in self._texts
+
+    @staticmethod
+    def digest(text: str) -> bytes:
+        """计算文本的哈希。"""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=DIGEST_SIZE).digest()
+
+    def _load(self) -> None:
+        if not os.path.exists(self._path):
+            return
+        valid_end = 0
+        try:
+            with open(self._path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        logger.warning(f"文本存储末尾有不完整的条目，已丢弃 ({len(line)} 字节)")
+                        break
+                    valid_end += len(line)
+                    try:
+                        entry = json.loads(line)
+                        self._texts[bytes.fromhex(entry["h"])] = entry["t"]
+                    except (ValueError, KeyError, TypeError):
+                        logger.warning("跳过损坏的文本存储条目")
+                        continue
+                    self._entries += 1
+            if valid_end < os.path.getsize(self._path):
+                with open(self._path, "r+b") as f:
+                    f.truncate(valid_end)
+            logger.debug(f"文本存储加载完成: {len(self._texts)} 条")
+        except OSError as e:
+            logger.error(f"加载文本存储出错: {e}")
+
+    @staticmethod
+    def _line(digest: bytes, text: str) -> bytes:
+        return (json.dumps({"h": digest.hex(), "t": text}, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def put(self, text: str) -> bytes:
+        """
+        存入文本（已存在时不重复写入）。
+
+        Args:
+            text: 文本
+
+        Returns:
+            文本的哈希
+        """
+        digest = self.digest(text)
+        with self._lock:
+            if digest not in self._texts:
+                self._texts[digest] = text
+                self._pending.append(self._line(digest, text))
+            self._recent.add(digest)
+        return digest
+
+    def get(self, digest: bytes) -> Optional[str]:
+        """按哈希取出文本，不存在时返回None。"""
+        return self._texts.get(digest)
+
+    def intern(self, text: str) -> str:
+        """存入文本并返回共享的文本对象（相同内容只保留一个对象）。"""
+        return self._texts[self.put(text)]
+
+    def add_owner(self, live: Callable[[], Optional[Set[bytes]]]) -> None:
+        """
+        登记使用方。
+
+        Args:
+            live: 返回该使用方引用的哈希集合的回调，尚未就绪时返回None
+        """
+        self._owners.append(live)
+
+    def collect(self) -> None:
+        """无效条目足够多且所有使用方都已就绪时，回收不再被引用的文本。"""
+        if self._entries < self._next_check:
+            return
+        live: Set[bytes] = set()
+        for owner in self._owners:
+            digests = owner()
+            if digests is None:
+                return
+            live.update(digests)
+        if self._entries <= len(live) * COLLECT_RATIO:
+            self._next_check = max(COLLECT_MIN_ENTRIES, int(len(live) * COLLECT_RATIO) + 1)
+            return
+
+        tmp_path = self._path + ".tmp"
+        with self._lock:
+            try:
+                # 上次回收之后存入的文本可能尚未登记到使用方，一并保留
+                texts = {d: t for d, t in self._texts.items() if d in live or d in self._recent}
+                with open(tmp_path, "wb") as tmp:
+                    for digest, text in texts.items():
+                        tmp.write(self._line(digest, text))
+                    tmp.flush()
+                    os.fsync(tmp.fileno())
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                os.replace(tmp_path, self._path)
+                self._pending = []
+                self._recent = set()
+                removed = len(self._texts) - len(texts)
+                self._texts = texts
+                self._entries = len(texts)
+                self._next_check = max(COLLECT_MIN_ENTRIES, int(len(texts) * COLLECT_RATIO) + 1)
+                logger.info(f"文本存储已回收 {removed} 条，剩余 {len(texts)} 条")
+            except OSError as e:
+                logger.error(f"回收文本存储出错: {e}")
+
+    def sync(self) -> None:
+        """将新文本写入文件并刷入磁盘（没有新文本时不做任何事）。"""
+        with self._lock:
+            if not self._pending:
+                return
+            try:
+                if self._file is None:
+                    directory = os.path.dirname(self._path)
+                    if directory:
+                        os.makedirs(directory, exist_ok=True)
+                    self._file = open(self._path, "ab")
+                self._file.write(b"".join(self._pending))
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._entries += len(self._pending)
+                self._pending = []
+            except OSError as e:
+                logger.error(f"写入文本存储出错: {e}")
@@ -3,21 +3,31 @@
 import time
 import pickle
 import os
-from typing import Optional, Dict, Tuple, Any
+import threading
+from typing import Optional, Dict, Set, Tuple, Any
 
 from core.logger import get_logger
+from models.blob_store import BlobStore
 
 logger = get_logger("CacheManager")
 
 
 class CacheManager:
-    """缓存管理器，负责翻译结果的缓存和持久化。"""
+    """缓存管理器，负责翻译结果的缓存和持久化。
+    
+    提供文本存储时，缓存只保存原文哈希 -> 译文哈希，译文与历史记录共用
+    同一份文本，原文本身不再保存。
+
+    缓存会被多个翻译线程和历史记录的写入线程（回收文本时）同时访问，
+    对字典的读写都在锁内进行。
+    """
     
     def __init__(
         self,
         path: str,
         max_size: int = 1000,
         save_frequency: int = 20,
+        blobs: Optional[BlobStore] = None,
     ):
         """
         初始化缓存管理器。
@@ -26,16 +36,45 @@ class CacheManager:
             path: 缓存文件路径
             max_size: 最大缓存条目数
             save_frequency: 自动保存频率（每N次写入保存一次）
+            blobs: 与历史记录共用的文本存储，为None时直接缓存文本
         """
         self._path = path
         self._max_size = max_size
         self._save_frequency = save_frequency
-        self._cache: Dict[str, Tuple[float, str]] = {}
+        self._blobs = blobs
+        self._cache: Dict[Any, Tuple[float, Any]] = {}  # 键 -> (时间戳, 值)
         self._write_count = 0
+        self._lock = threading.Lock()
         
         self._load()
+        if blobs is not None:
+            blobs.add_owner(self._live_digests)
         logger.info("缓存管理器初始化完成")
     
+    def _key(self, text: str) -> Any:
+        return self._blobs.digest(text) if self._blobs is not None else text
+    
+    def _pack(self, value: str) -> Any:
+        return self._blobs.put(value) if self._blobs is not None else value
+    
+    def _unpack(self, value: Any) -> Optional[str]:
+        return self._blobs.get(value) if self._blobs is not None else value
+    
+    def _migrate(self) -> None:
+        """将直接保存文本的旧缓存转换为哈希引用。"""
+        if self._blobs is None or not any(isinstance(k, str) for k in self._cache):
+            return
+        self._cache = {
+            (self._key(k) if isinstance(k, str) else k): (t, self._pack(v) if isinstance(v, str) else v)
+            for k, (t, v) in self._cache.items()
+        }
+        logger.info(f"已将 {len(self._cache)} 条缓存转换为文本存储引用")
+    
+    def _live_digests(self) -> Set[bytes]:
+        """缓存引用的译文哈希。"""
+        with self._lock:
+            return {value for _, value in self._cache.values()}
+    
     def _load(self) -> None:
         """从文件加载缓存。"""
         try:
@@ -43,6 +82,7 @@ class CacheManager:
                 with open(self._path, "rb") as f:
                     self._cache = pickle.load(f)
                 logger.info(f"加载了 {len(self._cache)} 条缓存记录")
+                self._migrate()
             else:
                 self._cache = {}
                 logger.info("缓存文件不存在，创建空缓存")
@@ -58,11 +98,20 @@ class CacheManager:
             # 确保目录存在
             os.makedirs(os.path.dirname(self._path), exist_ok=True)
             
+            # 缓存引用的文本须先于缓存落盘
+            if self._blobs is not None:
+                self._blobs.sync()
+            
+            with self._lock:
+                snapshot = dict(self._cache)
             with open(self._path, "wb") as f:
-                pickle.dump(self._cache, f)
+                pickle.dump(snapshot, f)
             
             elapsed = time.time() - start_time
             logger.info(f"缓存保存完成，耗时 {elapsed:.2f} 秒")
+            
+            if self._blobs is not None:
+                self._blobs.collect()
         except Exception as e:
             logger.error(f"保存缓存失败: {e}")
     
@@ -77,21 +126,30 @@ class CacheManager:
         Returns:
             缓存的值，如果不存在或在冷却期内返回None
         """
-        if key not in self._cache:
-            return None
-        
-        timestamp, value = self._cache[key]
-        current_time = time.time()
-        
-        # 检查时间间隔
-        if current_time - timestamp < min_gap:
-            # 更新时间戳但不返回值（防止短时间内重复翻译）
+        key = self._key(key)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            
+            timestamp, value = entry
+            current_time = time.time()
+            
+            # 检查时间间隔
+            if current_time - timestamp < min_gap:
+                # 更新时间戳但不返回值（防止短时间内重复翻译）
+                self._cache[key] = (current_time, value)
+                return None
+            
+            text = self._unpack(value)
+            if text is None:
+                # 引用的文本已丢失
+                del self._cache[key]
+                return None
+            
+            # 更新时间戳并返回值
             self._cache[key] = (current_time, value)
-            return None
-        
-        # 更新时间戳并返回值
-        self._cache[key] = (current_time, value)
-        return value
+            return text
     
     def set(self, key: str, value: str) -> None:
         """
@@ -101,20 +159,24 @@ class CacheManager:
             key: 缓存键
             value: 缓存值
         """
-        # 检查容量，如果超过最大值则清理旧条目
-        if len(self._cache) > self._max_size:
-            self._cleanup()
-        
-        self._cache[key] = (time.time(), value)
-        self._write_count += 1
-        
-        # 自动保存
-        if self._write_count >= self._save_frequency:
+        entry = (time.time(), self._pack(value))
+        with self._lock:
+            # 检查容量，如果超过最大值则清理旧条目
+            if len(self._cache) > self._max_size:
+                self._cleanup()
+            
+            self._cache[self._key(key)] = entry
+            self._write_count += 1
+            
+            # 自动保存
+            save = self._write_count >= self._save_frequency
+            if save:
+                self._write_count = 0
+        if save:
             self.save()
-            self._write_count = 0
     
     def _cleanup(self) -> None:
-        """清理旧的缓存条目，保留80%容量。"""
+        """清理旧的缓存条目，保留80%容量（调用方需持有锁）。"""
         target_size = int(self._max_size * 0.8)
         
         if len(self._cache) <= target_size:
@@ -134,12 +196,14 @@ class CacheManager:
     
     def clear(self) -> None:
         """清空所有缓存。"""
-        self._cache.clear()
-        self._write_count = 0
+        with self._lock:
+            self._cache.clear()
+            self._write_count = 0
         self.save()
         logger.info("缓存已清空")
     
     @property
     def size(self) -> int:
         """返回当前缓存条目数。"""
-        return len(self._cache)
+        with self._lock:
+            return len(self._cache)
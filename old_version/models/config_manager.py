@@ -7,6 +7,7 @@ from typing import Optional, Callable, List
 
 from core.logger import get_logger
 from core.types import AppConfig, APIProfile, Skill, HotkeyConfig
+from models.prompt_template import compile_prompt
 
 logger = get_logger("ConfigManager")
 
@@ -113,6 +114,7 @@ class ConfigManager:
             target_language="English",
             prompt=self.DEFAULT_PROMPT,
             show_source_comparison=False,
+            speculative_translation=False,
         )
     
     def _load_config(self) -> AppConfig:
@@ -132,10 +134,12 @@ class ConfigManager:
                 
                 config = AppConfig.from_dict(data)
                 self._sync_selected_skill_prompt(config)
+                self._compile_prompts(config)
                 logger.info("配置加载成功")
                 return config
             else:
                 self._save_config(default_config)
+                self._compile_prompts(default_config)
                 logger.info("创建默认配置")
                 return default_config
                 
@@ -149,6 +153,16 @@ class ConfigManager:
         config.prompt = skill.prompt
         config.selected_skill = skill.name
     
+    def _compile_prompts(self, config: AppConfig) -> None:
+        """预编译并校验所有技能的提示词模板。"""
+        prompts = [(skill.name, skill.prompt) for skill in config.skills]
+        prompts.append((config.selected_skill, config.prompt))
+        for name, prompt in prompts:
+            try:
+                compile_prompt(prompt)
+            except ValueError as e:
+                logger.warning(f"技能 '{name}' 的提示词无效: {e}")
+    
     def _save_config(self, config: Optional[AppConfig] = None) -> bool:
         """
         保存配置到文件。
@@ -190,6 +204,8 @@ class ConfigManager:
         # 如果更新了selected_skill，同步prompt
         if "selected_skill" in kwargs:
             self._sync_selected_skill_prompt(config)
+        if "skills" in kwargs or "prompt" in kwargs:
+            self._compile_prompts(config)
         
         self._save_config()
         self._notify_observers()
@@ -225,6 +241,7 @@ class ConfigManager:
             config.show_source_comparison = data["show_source_comparison"]
         
         self._sync_selected_skill_prompt(config)
+        self._compile_prompts(config)
         self._save_config()
         self._notify_observers()
     
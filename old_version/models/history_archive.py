@@ -0,0 +1,313 @@
+"""Compressed monthly history archive module."""
+
+import json
+import lzma
+import os
+import shutil
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from core.logger import get_logger
+from core.types import TranslationRecord
+from models.history_search import HistorySearchIndex, query_terms, tokenize
+
+logger = get_logger("HistoryArchive")
+
+MANIFEST_NAME = "manifest.json"
+SEGMENT_SUFFIX = ".jsonl.xz"
+INDEX_SUFFIX = ".idx.json"
+
+# 内存中缓存的已解压分段数和分段索引数
+CACHED_SEGMENTS: int = 2
+CACHED_INDEXES: int = 16
+
+
+@dataclass
+class ArchiveSegment:
+    """归档分段的清单条目。"""
+    name: str                                         # 文件名（不含后缀），如 2024-05-000
+    month: str                                        # 所属月份 YYYY-MM
+    count: int                                        # 写入时的记录数
+    deleted: List[str] = field(default_factory=list)  # 归档后被删除的记录ID
+
+    @property
+    def live_count(self) -> int:
+        return self.count - len(self.deleted)
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "month": self.month, "count": self.count, "deleted": self.deleted}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ArchiveSegment":
+        return cls(
+            name=data.get("name", ""),
+            month=data.get("month", ""),
+            count=data.get("count", 0),
+            deleted=list(data.get("deleted", [])),
+        )
+
+
+class HistoryArchive:
+    """按月分段、lzma 压缩的只读历史归档。
+
+    每个分段是一个压缩的 JSONL 文件，写入后不再修改；旁边的小索引文件
+    记录分段内的记录ID和检索词，清单只保存各分段的记录数和删除标记。
+    常驻内存的只有清单：翻阅时按记录数定位到分段，搜索和按ID查找先查
+    分段索引，只解压可能命中的分段，最近解压的分段缓存在内存中。
+
+    写文件和修改内存状态分开：write_segments()、save()、remove_files()
+    只做文件 I/O，可在后台线程中执行；add_segments()、remove()、clear()
+    只修改内存。
+    """
+
+    def __init__(self, directory: str):
+        """
+        初始化归档。
+
+        Args:
+            directory: 归档目录
+        """
+        self._directory = directory
+        self._segments: List[ArchiveSegment] = []   # 从旧到新
+        self._records_cache: "OrderedDict[str, List[TranslationRecord]]" = OrderedDict()
+        self._index_cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._load_manifest()
+
+    def __len__(self) -> int:
+        return sum(segment.live_count for segment in self._segments)
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    # ---------- 文件 ----------
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._directory, name)
+
+    def _load_manifest(self) -> None:
+        path = self._path(MANIFEST_NAME)
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._segments = [ArchiveSegment.from_dict(s) for s in data.get("segments", [])]
+            logger.debug(f"加载历史归档清单: {len(self._segments)} 个分段, {len(self)} 条记录")
+        except Exception as e:
+            logger.error(f"加载历史归档清单出错: {e}")
+            self._segments = []
+
+    def save(self) -> None:
+        """原子写入清单。"""
+        os.makedirs(self._directory, exist_ok=True)
+        path = self._path(MANIFEST_NAME)
+        tmp_path = path + ".tmp"
+        data = {"segments": [segment.to_dict() for segment in self._segments]}
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _write_segment(self, month: str, records: List[TranslationRecord]) -> ArchiveSegment:
+        existing = sum(1 for segment in self._segments if segment.month == month)
+        segment = ArchiveSegment(name=f"{month}-{existing:03d}", month=month, count=len(records))
+
+        terms = set()
+        for record in records:
+            terms.update(tokenize(record.source_text))
+            terms.update(tokenize(record.translated_text))
+        index = {"ids": [record.id for record in records], "terms": sorted(terms)}
+
+        with lzma.open(self._path(segment.name + SEGMENT_SUFFIX), "wb") as f:
+            for record in records:
+                f.write((json.dumps(record.to_dict(), ensure_ascii=False) + "\n").encode("utf-8"))
+        with open(self._path(segment.name + INDEX_SUFFIX), "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+        return segment
+
+    def _read_segment(self, segment: ArchiveSegment) -> List[TranslationRecord]:
+        """解压分段，返回未删除的记录（从旧到新）。"""
+        records = self._records_cache.get(segment.name)
+        if records is None:
+            with lzma.open(self._path(segment.name + SEGMENT_SUFFIX), "rb") as f:
+                records = [TranslationRecord.from_dict(json.loads(line)) for line in f if line.strip()]
+            self._records_cache[segment.name] = records
+            while len(self._records_cache) > CACHED_SEGMENTS:
+                self._records_cache.popitem(last=False)
+            logger.debug(f"解压历史归档分段 {segment.name}: {len(records)} 条")
+        else:
+            self._records_cache.move_to_end(segment.name)
+        if segment.deleted:
+            deleted = set(segment.deleted)
+            return [record for record in records if record.id not in deleted]
+        return records
+
+    def _read_index(self, segment: ArchiveSegment) -> dict:
+        """读取分段索引（ID集合和排序的检索词表）。"""
+        index = self._index_cache.get(segment.name)
+        if index is None:
+            with open(self._path(segment.name + INDEX_SUFFIX), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            index = {"ids": set(data.get("ids", [])), "terms": data.get("terms", [])}
+            self._index_cache[segment.name] = index
+            while len(self._index_cache) > CACHED_INDEXES:
+                self._index_cache.popitem(last=False)
+        else:
+            self._index_cache.move_to_end(segment.name)
+        return index
+
+    # ---------- 操作 ----------
+
+    def write_segments(self, records: List[TranslationRecord]) -> List[ArchiveSegment]:
+        """
+        将记录按月写入新的分段文件（尚未加入清单）。
+
+        Args:
+            records: 待归档的记录（从旧到新）
+
+        Returns:
+            新分段，需随后调用 add_segments() 和 save()
+        """
+        if not records:
+            return []
+        os.makedirs(self._directory, exist_ok=True)
+
+        groups: Dict[str, List[TranslationRecord]] = {}
+        for record in records:
+            groups.setdefault(record.timestamp[:7] or "unknown", []).append(record)
+
+        segments = [self._write_segment(month, group) for month, group in groups.items()]
+        logger.info(f"已归档 {len(records)} 条历史记录（{len(segments)} 个分段）")
+        return segments
+
+    def add_segments(self, segments: List[ArchiveSegment]) -> None:
+        """将已写入的分段加入清单。"""
+        self._segments.extend(segments)
+
+    def _locate(self, index: int):
+        """第 index 新的归档记录所在的分段及其在分段内从新到旧的位置。"""
+        for segment in reversed(self._segments):
+            if index < segment.live_count:
+                return segment, index
+            index -= segment.live_count
+        return None, 0
+
+    def newest(self, index: int) -> Optional[TranslationRecord]:
+        """
+        第 index 新的归档记录（0 为最新）。
+
+        Returns:
+            翻译记录，越界时返回None
+        """
+        if index < 0:
+            return None
+        segment, position = self._locate(index)
+        if segment is None:
+            return None
+        records = self._read_segment(segment)
+        return records[len(records) - 1 - position]
+
+    def page(self, limit: int, offset: int = 0) -> List[TranslationRecord]:
+        """
+        从新到旧分页获取归档记录。
+
+        Args:
+            limit: 返回数量
+            offset: 跳过的最新记录数
+
+        Returns:
+            翻译记录列表
+        """
+        result: List[TranslationRecord] = []
+        for segment in reversed(self._segments):
+            if len(result) >= limit:
+                break
+            if offset >= segment.live_count:
+                offset -= segment.live_count
+                continue
+            records = self._read_segment(segment)
+            end = len(records) - offset
+            result.extend(reversed(records[max(0, end - (limit - len(result))):end]))
+            offset = 0
+        return result
+
+    def _find_segment(self, record_id: str) -> Optional[ArchiveSegment]:
+        for segment in reversed(self._segments):
+            if record_id in self._read_index(segment)["ids"] and record_id not in segment.deleted:
+                return segment
+        return None
+
+    def get(self, record_id: str) -> Optional[TranslationRecord]:
+        """按ID查找归档记录。"""
+        segment = self._find_segment(record_id)
+        if segment is None:
+            return None
+        return next((r for r in self._read_segment(segment) if r.id == record_id), None)
+
+    def remove(self, record_id: str) -> Optional[TranslationRecord]:
+        """
+        删除归档记录（分段文件不变，只在清单中标记，需随后调用 save()）。
+
+        Returns:
+            被删除的记录，不存在时返回None
+        """
+        segment = self._find_segment(record_id)
+        if segment is None:
+            return None
+        record = next((r for r in self._read_segment(segment) if r.id == record_id), None)
+        segment.deleted.append(record_id)
+        return record
+
+    @staticmethod
+    def _may_match(index: dict, terms) -> bool:
+        """分段索引中是否包含所有查询词。"""
+        vocabulary = index["terms"]
+        for term, prefix in terms:
+            i = bisect_left(vocabulary, term)
+            if i >= len(vocabulary):
+                return False
+            if not (vocabulary[i].startswith(term) if prefix else vocabulary[i] == term):
+                return False
+        return True
+
+    def search(self, query: str, limit: int = 50) -> List[TranslationRecord]:
+        """
+        从新到旧逐分段搜索，只解压索引中包含全部查询词的分段。
+
+        Args:
+            query: 查询文本
+            limit: 返回数量限制
+
+        Returns:
+            匹配的翻译记录（各分段内按相关度排序）
+        """
+        terms = query_terms(query)
+        if not terms:
+            return []
+
+        results: List[TranslationRecord] = []
+        for segment in reversed(self._segments):
+            if len(results) >= limit:
+                break
+            if not segment.live_count or not self._may_match(self._read_index(segment), terms):
+                continue
+            records = {record.key: record for record in self._read_segment(segment)}
+            index = HistorySearchIndex()
+            index.add_all(records.values())
+            results.extend(records[i] for i in index.search(query, limit - len(results)))
+        return results
+
+    def clear(self) -> None:
+        """清空所有归档（需随后调用 remove_files() 删除文件）。"""
+        self._segments = []
+        self._records_cache.clear()
+        self._index_cache.clear()
+
+    def remove_files(self) -> None:
+        """删除归档目录。"""
+        if os.path.isdir(self._directory):
+            shutil.rmtree(self._directory, ignore_errors=True)
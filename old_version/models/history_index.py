@@ -0,0 +1,154 @@
+"""Indexed in-memory history store module."""
+
+from typing import Dict, Iterator, List, Optional
+
+from core.types import TranslationRecord
+
+
+class HistoryIndex:
+    """按时间排序、可按ID索引的历史记录集合。
+
+    记录按添加顺序追加到槽位数组，删除只把槽位置空；ID -> 槽位的字典
+    提供 O(1) 查找，存活标记上的树状数组（Fenwick 树）在 O(log n) 内
+    定位"第 k 新"的记录，用于分页和历史翻阅。空槽过多或容量不足时
+    整体重建，均摊 O(1)。
+    """
+
+    _MIN_CAPACITY = 64
+
+    def __init__(self, records: Optional[List[TranslationRecord]] = None):
+        """
+        初始化索引。
+
+        Args:
+            records: 初始记录（最新的在前）
+        """
+        self._slots: List[Optional[TranslationRecord]] = []
+        self._positions: Dict[object, int] = {}  # 记录键 -> 槽位
+        self._rebuild(list(reversed(records or [])))
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, record_id: str) -> bool:
+        return TranslationRecord.key_of(record_id) in self._positions
+
+    def __iter__(self) -> Iterator[TranslationRecord]:
+        """从新到旧遍历。"""
+        for record in reversed(self._slots):
+            if record is not None:
+                yield record
+
+    # ---------- 树状数组 ----------
+
+    def _rebuild(self, chronological: List[TranslationRecord]) -> None:
+        """按时间顺序的存活记录重建槽位和树状数组。"""
+        capacity = max(self._MIN_CAPACITY, 2 * len(chronological))
+        self._slots = list(chronological)
+        self._positions = {record.key: i for i, record in enumerate(chronological)}
+        self._capacity = capacity
+        self._tree = [1] * (len(chronological) + 1) + [0] * (capacity - len(chronological))
+        self._tree[0] = 0
+        # O(n) 建树
+        for i in range(1, capacity + 1):
+            parent = i + (i & -i)
+            if parent <= capacity:
+                self._tree[parent] += self._tree[i]
+        self._top_bit = 1 << (capacity.bit_length() - 1)
+
+    def _update(self, position: int, delta: int) -> None:
+        i = position + 1
+        while i <= self._capacity:
+            self._tree[i] += delta
+            i += i & -i
+
+    def _find(self, rank: int) -> int:
+        """第 rank 个（从1开始，按时间顺序）存活记录的槽位。"""
+        position = 0
+        bit = self._top_bit
+        while bit:
+            nxt = position + bit
+            if nxt <= self._capacity and self._tree[nxt] < rank:
+                position = nxt
+                rank -= self._tree[nxt]
+            bit >>= 1
+        return position
+
+    # ---------- 操作 ----------
+
+    def add(self, record: TranslationRecord) -> None:
+        """添加一条最新记录（ID已存在时替换并移到最新）。"""
+        if record.key in self._positions:
+            self.remove(record.key)
+        if len(self._slots) >= self._capacity:
+            self._rebuild([r for r in self._slots if r is not None])
+        position = len(self._slots)
+        self._slots.append(record)
+        self._positions[record.key] = position
+        self._update(position, 1)
+
+    def get(self, record_id: str) -> Optional[TranslationRecord]:
+        """按ID（或记录键）查找记录。"""
+        position = self._positions.get(TranslationRecord.key_of(record_id))
+        return self._slots[position] if position is not None else None
+
+    def remove(self, record_id: str) -> Optional[TranslationRecord]:
+        """
+        删除记录。
+
+        Returns:
+            被删除的记录，不存在时返回None
+        """
+        position = self._positions.pop(TranslationRecord.key_of(record_id), None)
+        if position is None:
+            return None
+        record = self._slots[position]
+        self._slots[position] = None
+        self._update(position, -1)
+        # 空槽超过存活记录数时重建
+        if len(self._slots) - len(self._positions) > max(self._MIN_CAPACITY, len(self._positions)):
+            self._rebuild([r for r in self._slots if r is not None])
+        return record
+
+    def clear(self) -> None:
+        """清空所有记录。"""
+        self._rebuild([])
+
+    def newest(self, index: int) -> Optional[TranslationRecord]:
+        """
+        第 index 新的记录（0 为最新）。
+
+        Returns:
+            翻译记录，越界时返回None
+        """
+        count = len(self._positions)
+        if not 0 <= index < count:
+            return None
+        return self._slots[self._find(count - index)]
+
+    def page(self, limit: int, offset: int = 0) -> List[TranslationRecord]:
+        """
+        从新到旧分页获取记录。
+
+        Args:
+            limit: 返回数量
+            offset: 跳过的最新记录数
+
+        Returns:
+            翻译记录列表
+        """
+        count = len(self._positions)
+        if limit <= 0 or not 0 <= offset < count:
+            return []
+        position = self._find(count - offset)
+        result: List[TranslationRecord] = []
+        while position >= 0 and len(result) < limit:
+            record = self._slots[position]
+            if record is not None:
+                result.append(record)
+            position -= 1
+        return result
+
+    def snapshot(self) -> List[TranslationRecord]:
+        """所有记录的快照（最新的在前）。"""
+        return list(self)
@@ -0,0 +1,434 @@
+"""Append-only history log module."""
+
+import json
+import os
+import threading
+from typing import List, Optional
+
+from core.logger import get_logger
+from core.types import TranslationRecord
+from models.blob_store import BlobStore
+
+logger = get_logger("HistoryLog")
+
+# 日志条目超过存活记录数的倍数（且不少于最小条目数）时触发压缩
+COMPACT_RATIO: float = 2.0
+COMPACT_MIN_ENTRIES: int = 200
+
+# 日志操作类型
+OP_ADD = "add"
+OP_DELETE = "del"
+OP_CLEAR = "clear"
+OP_ARCHIVE = "archive"
+
+# 倒序读取日志时每次读取的字节数
+READ_BLOCK_SIZE: int = 64 * 1024
+
+
+class HistoryLog:
+    """历史记录的追加式日志（JSONL）。
+
+    每次新增、删除、清空或归档只追加一行：删除写入墓碑，清空写入清空
+    标记，归档写入移出的记录ID列表。加载时按顺序重放，或通过
+    read_backwards() 从末尾倒序分批读取。写入中断导致的末尾残行在加载时
+    截断。无效条目过多时在后台线程中把存活记录重写为新文件并原子替换，
+    压缩期间的追加会在替换前转移到新文件。
+    """
+
+    def __init__(self, path: str, blobs: Optional[BlobStore] = None):
+        """
+        初始化日志。
+
+        Args:
+            path: 日志文件路径
+            blobs: 文本存储，提供时记录中的原文和译文只以哈希写入日志
+        """
+        self._path = path
+        self._blobs = blobs
+        self._lock = threading.Lock()
+        self._file = None
+        self._entries = 0          # 文件中的条目数（含已失效的）
+        self._compacting = False
+        self._reading = False      # 倒序读取未完成时条目数未知，且不能替换文件
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def exists(self) -> bool:
+        return os.path.exists(self._path)
+
+    @property
+    def entry_count(self) -> int:
+        return self._entries
+
+    def load(self) -> List[TranslationRecord]:
+        """
+        重放日志，返回存活记录（最新的在前）。
+
+        Returns:
+            翻译记录列表
+        """
+        records = {}
+        entries = 0
+        valid_end = 0
+
+        if os.path.exists(self._path):
+            with open(self._path, "rb") as f:
+                offset = 0
+                for line in f:
+                    end = offset + len(line)
+                    if not line.endswith(b"\n"):
+                        # 末尾残行：写入过程中断
+                        logger.warning(f"历史日志末尾有不完整的条目，已丢弃 ({len(line)} 字节)")
+                        break
+                    offset = end
+                    valid_end = end
+                    try:
+                        op = json.loads(line)
+                    except ValueError:
+                        logger.warning(f"跳过损坏的历史日志条目（偏移 {end - len(line)}）")
+                        continue
+                    entries += 1
+                    self._apply(records, op)
+
+            if valid_end < os.path.getsize(self._path):
+                with open(self._path, "r+b") as f:
+                    f.truncate(valid_end)
+
+        self._entries = entries
+        # 只解码存活记录：已失效记录引用的文本可能已被回收
+        decoded = [r for r in map(self._decode, reversed(records.values())) if r is not None]
+        logger.debug(f"历史日志重放完成: {entries} 条日志, {len(decoded)} 条记录")
+        return decoded
+
+    def read_backwards(self) -> "HistoryLogReader":
+        """
+        从日志末尾开始倒序读取存活记录。
+
+        读取完成（或关闭读取器）前不会触发压缩，此后追加的条目不会被读到。
+
+        Returns:
+            日志读取器
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            end = self._valid_end()
+            self._reading = True
+        return HistoryLogReader(self, end)
+
+    def _valid_end(self) -> int:
+        """截断末尾残行，返回有效内容的长度。"""
+        if not os.path.exists(self._path):
+            return 0
+        size = os.path.getsize(self._path)
+        with open(self._path, "r+b") as f:
+            end = size
+            while end > 0:
+                start = max(0, end - READ_BLOCK_SIZE)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b"\n")
+                if newline >= 0:
+                    end = start + newline + 1
+                    break
+                end = start
+            if end < size:
+                logger.warning(f"历史日志末尾有不完整的条目，已丢弃 ({size - end} 字节)")
+                f.truncate(end)
+        return end
+
+    def _finish_reading(self, entries: int) -> None:
+        with self._lock:
+            if self._reading:
+                self._reading = False
+                self._entries += entries
+
+    def _encode(self, record: TranslationRecord) -> dict:
+        """记录 -> 日志中的字典（有文本存储时文本替换为哈希）。"""
+        data = record.to_dict()
+        if self._blobs is not None:
+            data["source_hash"] = self._blobs.put(data.pop("source_text")).hex()
+            data["translated_hash"] = self._blobs.put(data.pop("translated_text")).hex()
+        return data
+
+    def _decode(self, data: dict) -> Optional[TranslationRecord]:
+        """
+        日志中的字典 -> 记录（兼容直接保存文本的旧条目）。
+
+        Returns:
+            翻译记录；引用的文本已丢失时返回None，不以空文本代替
+        """
+        if "source_hash" in data or "translated_hash" in data:
+            data = dict(data)
+            source_text = self._resolve(data.pop("source_hash", ""))
+            translated_text = self._resolve(data.pop("translated_hash", ""))
+            if source_text is None or translated_text is None:
+                logger.warning(f"历史记录 {data.get('id', '')} 引用的文本已丢失，已跳过")
+                return None
+            data["source_text"] = source_text
+            data["translated_text"] = translated_text
+        return TranslationRecord.from_dict(data)
+
+    def _resolve(self, digest: str) -> Optional[str]:
+        if self._blobs is None or not digest:
+            return None
+        try:
+            return self._blobs.get(bytes.fromhex(digest))
+        except ValueError:
+            return None
+
+    def _apply(self, records: dict, op: dict) -> None:
+        """重放一条日志（新增的记录保留为字典，重放结束后再解码）。"""
+        kind = op.get("op")
+        if kind == OP_ADD:
+            data = op.get("record", {})
+            key = TranslationRecord.key_of(data.get("id", ""))
+            records.pop(key, None)
+            records[key] = data
+        elif kind == OP_DELETE:
+            records.pop(TranslationRecord.key_of(op.get("id")), None)
+        elif kind == OP_CLEAR:
+            records.clear()
+        elif kind == OP_ARCHIVE:
+            for record_id in op.get("ids", []):
+                records.pop(TranslationRecord.key_of(record_id), None)
+
+    def _open(self):
+        if self._file is None:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self._path, "ab")
+        return self._file
+
+    def _append(self, op: dict) -> None:
+        line = (json.dumps(op, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            f = self._open()
+            f.write(line)
+            f.flush()
+            self._entries += 1
+
+    def append_add(self, record: TranslationRecord) -> None:
+        """追加一条新记录。"""
+        data = self._encode(record)
+        if self._blobs is not None:
+            # 引用的文本先于日志条目落盘
+            self._blobs.sync()
+        self._append({"op": OP_ADD, "record": data})
+
+    def append_delete(self, record_id: str) -> None:
+        """追加删除墓碑。"""
+        self._append({"op": OP_DELETE, "id": record_id})
+
+    def append_archive(self, record_ids: List[str]) -> None:
+        """追加归档标记（这些记录已移入归档）。"""
+        self._append({"op": OP_ARCHIVE, "ids": record_ids})
+
+    def append_clear(self) -> None:
+        """追加清空标记。"""
+        self._append({"op": OP_CLEAR})
+
+    def sync(self) -> bool:
+        """将已追加的内容刷入磁盘。"""
+        try:
+            with self._lock:
+                if self._file is not None:
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+            return True
+        except OSError as e:
+            logger.error(f"同步历史日志出错: {e}")
+            return False
+
+    def close(self) -> None:
+        """同步并关闭日志文件。"""
+        self.sync()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def needs_compaction(self, live_count: int) -> bool:
+        """无效条目是否已足够多。"""
+        return (
+            not self._compacting
+            and not self._reading
+            and self._entries >= COMPACT_MIN_ENTRIES
+            and self._entries > live_count * COMPACT_RATIO
+        )
+
+    def compact(self, records: List[TranslationRecord], background: bool = True) -> None:
+        """
+        用存活记录重写日志。
+
+        Args:
+            records: 存活记录快照（最新的在前），调用后不应再修改该列表
+            background: 是否在后台线程中执行
+        """
+        with self._lock:
+            if self._compacting:
+                return
+            self._compacting = True
+            if self._file is not None:
+                self._file.flush()
+            snapshot_offset = os.path.getsize(self._path) if os.path.exists(self._path) else 0
+
+        if background:
+            threading.Thread(
+                target=self._compact, args=(records, snapshot_offset),
+                name="HistoryCompaction", daemon=True,
+            ).start()
+        else:
+            self._compact(records, snapshot_offset)
+
+    def _compact(self, records: List[TranslationRecord], snapshot_offset: int) -> None:
+        tmp_path = self._path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as tmp:
+                # 按时间顺序写入，重放后顺序不变
+                for record in reversed(records):
+                    op = {"op": OP_ADD, "record": self._encode(record)}
+                    tmp.write((json.dumps(op, ensure_ascii=False) + "\n").encode("utf-8"))
+            if self._blobs is not None:
+                self._blobs.sync()
+
+            with self._lock:
+                # 转移压缩期间追加的条目
+                tail = b""
+                if os.path.exists(self._path):
+                    with open(self._path, "rb") as old:
+                        old.seek(snapshot_offset)
+                        tail = old.read()
+                with open(tmp_path, "ab") as tmp:
+                    tmp.write(tail)
+                    tmp.flush()
+                    os.fsync(tmp.fileno())
+
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                os.replace(tmp_path, self._path)
+                self._entries = len(records) + tail.count(b"\n")
+
+            logger.info(f"历史日志已压缩: {self._entries} 条")
+        except Exception as e:
+            logger.error(f"压缩历史日志出错: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        finally:
+            with self._lock:
+                self._compacting = False
+
+
+class HistoryLogReader:
+    """从末尾向前读取历史日志的游标，按从新到旧的顺序分批产出存活记录。
+
+    删除墓碑总在对应记录之后，倒序读取时先遇到墓碑：记下ID，之后读到
+    的同ID记录直接跳过（重复添加的记录同理，只保留最新的一条）。遇到清空
+    标记时更早的记录都已失效，读取随即结束。
+    """
+
+    def __init__(self, log: HistoryLog, end: int):
+        self._log = log
+        self._file = open(log.path, "rb") if end > 0 else None
+        self._position = end       # 尚未读取部分的末尾
+        self._head = b""           # 当前块开头不完整的一行
+        self._lines: List[bytes] = []
+        self._seen = set()         # 已产出或已删除的记录键
+        self._entries = 0
+        self._end = end
+        self._done = False
+        if self._file is None:
+            self._finish()
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def _next_line(self) -> Optional[bytes]:
+        while not self._lines:
+            if self._position == 0:
+                line, self._head = self._head, b""
+                return line or None
+            size = min(READ_BLOCK_SIZE, self._position)
+            self._position -= size
+            self._file.seek(self._position)
+            parts = (self._file.read(size) + self._head).split(b"\n")
+            self._head = parts[0]
+            self._lines = [line for line in parts[1:] if line]
+        return self._lines.pop()
+
+    def read(self, count: int) -> List[TranslationRecord]:
+        """
+        读取下一批记录。
+
+        Args:
+            count: 最多读取的记录数
+
+        Returns:
+            翻译记录列表（从新到旧），读取完成后返回空列表
+        """
+        records: List[TranslationRecord] = []
+        while len(records) < count and not self._done:
+            line = self._next_line()
+            if line is None:
+                self._finish()
+                break
+            self._entries += 1
+            try:
+                op = json.loads(line)
+            except ValueError:
+                logger.warning("跳过损坏的历史日志条目")
+                continue
+
+            kind = op.get("op")
+            if kind == OP_ADD:
+                data = op.get("record", {})
+                key = TranslationRecord.key_of(data.get("id", ""))
+                if key not in self._seen:
+                    self._seen.add(key)
+                    record = self._log._decode(data)
+                    if record is not None:
+                        records.append(record)
+            elif kind == OP_DELETE:
+                self._seen.add(TranslationRecord.key_of(op.get("id")))
+            elif kind == OP_ARCHIVE:
+                self._seen.update(map(TranslationRecord.key_of, op.get("ids", [])))
+            elif kind == OP_CLEAR:
+                self.close()
+        return records
+
+    def _count_lines(self) -> int:
+        """统计日志有效部分的总行数。"""
+        total = 0
+        self._file.seek(0)
+        remaining = self._end
+        while remaining > 0:
+            block = self._file.read(min(READ_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            total += block.count(b"\n")
+        return total
+
+    def _finish(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._done = True
+        self._log._finish_reading(self._entries)
+
+    def close(self) -> None:
+        """结束读取（未读部分只统计条目数，不再解析）。"""
+        if self._done:
+            return
+        try:
+            self._entries = self._count_lines()
+        except OSError as e:
+            logger.error(f"统计历史日志条目出错: {e}")
+        self._finish()
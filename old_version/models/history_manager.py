@@ -2,78 +2,324 @@
 
 import json
 import os
-from typing import List, Optional, Callable
+import threading
+import time
+from typing import Dict, List, Optional, Set, Callable
 from datetime import datetime
 
 from core.logger import get_logger
 from core.types import TranslationRecord
+from models.blob_store import BlobStore
+from models.history_archive import HistoryArchive
+from models.history_index import HistoryIndex
+from models.history_log import HistoryLog, HistoryLogReader
+from models.history_search import HistorySearchIndex
+from utils.background_writer import BackgroundWriter
 
 logger = get_logger("HistoryManager")
 
+# 启动时同步读取的最新记录数（足够上翻），其余记录在后台读取
+INITIAL_WINDOW: int = 50
+# 后台读取和按需读取时每批的记录数
+PAGE_SIZE: int = 500
+# 日志和内存中保留的最新记录数；超出 ARCHIVE_BATCH 条后把更早的记录移入归档
+HOT_RECORDS: int = 1000
+ARCHIVE_BATCH: int = 200
+# 合并写入的等待时间（秒）
+WRITE_DELAY: float = 0.5
+
 
 class HistoryManager:
     """翻译历史记录管理器。
     
     负责管理原文-翻译对应关系的历史记录，支持持久化存储。
-    """
+    记录保存在追加式日志中，新增和删除只需追加一行；内存中由索引
+    提供按ID查找和按时间分页。日志只保留最新的 HOT_RECORDS 条左右，
+    更早的记录按月移入压缩归档，翻阅、分页、搜索和删除透明地延伸到
+    归档中，记录数不设上限。提供文本存储时，日志只保存原文和译文的
+    哈希，与翻译缓存共用同一份文本；原文、译文和目标语言都相同的重复
+    翻译不再新增记录，而是把已有记录移到最新。
     
-    MAX_RECORDS = 1000  # 最大记录数
+    修改只在调用线程中更新内存，日志追加、归档、压缩等文件操作交给后台
+    写入线程合并执行，界面线程不做文件 I/O；退出前调用 flush() 等待写完。
     
-    def __init__(self, history_path: str):
+    启动时只从日志末尾读取最新的一小段记录，其余在后台线程中倒序读取；
+    翻阅或分页超出已加载范围时按需多读一批，搜索等需要全部记录的操作
+    会等待读取完成。
+    """
+    
+    def __init__(self, history_path: str, blobs: Optional[BlobStore] = None):
         """
         初始化历史管理器。
         
         Args:
             history_path: 历史记录文件路径
+            blobs: 与缓存共用的文本存储，为None时日志直接保存文本
         """
         self._history_path = history_path
-        self._records: List[TranslationRecord] = []
+        self._blobs = blobs
+        self._log = HistoryLog(os.path.splitext(history_path)[0] + ".jsonl", blobs)
+        self._records = HistoryIndex()
+        self._archive = HistoryArchive(
+            os.path.join(os.path.dirname(history_path), "history_archive")
+        )
+        self._lock = threading.RLock()
+        self._writer = BackgroundWriter("HistoryWriter", WRITE_DELAY, self._after_batch)
+        self._unwritten: Dict[object, int] = {}  # 记录键 -> 尚未写入日志的新增次数
+        self._reader: Optional[HistoryLogReader] = None
+        self._older: List[TranslationRecord] = []  # 已读取、尚未并入索引的旧记录
+        self._search_index: Optional[HistorySearchIndex] = None  # 首次搜索时建立
+        self._contents: Optional[Dict[tuple, object]] = None  # (原文, 译文, 目标语言) -> 记录键，按需建立
         self._observers: List[Callable[[TranslationRecord], None]] = []
         self._history_pointer = -1  # -1表示当前模式，>=0表示历史模式
         
         self._load()
-        logger.info(f"历史管理器初始化完成，已加载 {len(self._records)} 条记录")
+        if blobs is not None:
+            blobs.add_owner(self._live_digests)
+        logger.info(
+            f"历史管理器初始化完成，已加载 {len(self._records)} 条记录，"
+            f"归档 {len(self._archive)} 条"
+        )
     
     def _load(self) -> None:
-        """从文件加载历史记录。"""
+        """加载最新的一段历史记录并在后台读取其余部分（首次运行时导入旧版 JSON 文件）。"""
         try:
-            if os.path.exists(self._history_path):
-                with open(self._history_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                self._records = [
-                    TranslationRecord.from_dict(r) 
-                    for r in data.get("records", [])
-                ]
-                
-                logger.debug(f"加载了 {len(self._records)} 条历史记录")
+            if not self._log.exists and os.path.exists(self._history_path):
+                self._import_legacy()
+                return
+            
+            start = time.perf_counter()
+            self._reader = self._log.read_backwards()
+            self._records = HistoryIndex(self._reader.read(INITIAL_WINDOW))
+            logger.debug(
+                f"加载了最新的 {len(self._records)} 条历史记录，"
+                f"耗时 {(time.perf_counter() - start) * 1000:.1f}ms"
+            )
+            
+            if self._reader.done:
+                self._finish_loading()
+            else:
+                threading.Thread(
+                    target=self._load_remaining, args=(start,),
+                    name="HistoryLoader", daemon=True,
+                ).start()
         except Exception as e:
             logger.error(f"加载历史记录出错: {e}")
-            self._records = []
+            self._records = HistoryIndex()
+            self._stop_loading()
     
-    def save(self) -> bool:
+    def _load_remaining(self, start: float) -> None:
+        """后台线程：分批读取其余记录，完成后一次性并入索引。"""
+        try:
+            while True:
+                with self._lock:
+                    if self._reader is None:
+                        return
+                    self._older.extend(self._reader.read(PAGE_SIZE))
+                    if self._reader.done:
+                        self._finish_loading()
+                        break
+            logger.info(
+                f"历史记录后台加载完成: {len(self._records)} 条，"
+                f"耗时 {(time.perf_counter() - start) * 1000:.0f}ms"
+            )
+        except Exception as e:
+            logger.error(f"后台加载历史记录出错: {e}")
+            self._stop_loading()
+    
+    def _merge_older(self) -> None:
+        """将已读取的旧记录并入索引（整体替换，不影响正在读取索引的调用方）。"""
+        if self._older:
+            self._records = HistoryIndex(self._records.snapshot() + self._older)
+            self._older = []
+            self._contents = None
+    
+    def _finish_loading(self) -> None:
+        """读取完成：合并剩余记录并关闭读取器。"""
+        with self._lock:
+            self._merge_older()
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+        self._writer.submit(self._maintain)
+    
+    def _stop_loading(self) -> None:
+        """放弃尚未读取的记录（出错或清空历史时）。"""
+        with self._lock:
+            self._older = []
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+    
+    def _ensure_loaded(self, count: Optional[int] = None) -> None:
         """
-        保存历史记录到文件。
+        确保至少已加载 count 条记录（或全部记录已加载）。
         
-        Returns:
-            是否保存成功
+        Args:
+            count: 需要的记录数，None 表示全部
         """
+        if self._reader is None:
+            return
+        with self._lock:
+            self._merge_older()
+            while self._reader is not None and (count is None or len(self._records) < count):
+                wanted = PAGE_SIZE if count is None else max(PAGE_SIZE, count - len(self._records))
+                self._older.extend(self._reader.read(wanted))
+                if self._reader.done:
+                    self._finish_loading()
+                else:
+                    self._merge_older()
+    
+    @property
+    def is_loaded(self) -> bool:
+        """历史记录是否已全部加载。"""
+        return self._reader is None
+    
+    def _import_legacy(self) -> None:
+        """将旧版 history.json 转换为日志（旧文件保留不动）。"""
+        with open(self._history_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        self._records = HistoryIndex([
+            TranslationRecord.from_dict(r) 
+            for r in data.get("records", [])
+        ])
+        self._log.compact(self._records.snapshot(), background=False)
+        logger.info(f"已将 {len(self._records)} 条历史记录迁移到日志")
+    
+    def _persist(self, append: Callable[[], None]) -> None:
+        """提交一次日志追加（归档和压缩在整批写完后进行）。"""
+        def task() -> None:
+            try:
+                append()
+            except OSError as e:
+                logger.error(f"写入历史日志出错: {e}")
+        self._writer.submit(task)
+    
+    def _append_add(self, record: TranslationRecord) -> None:
+        """写入线程：追加新增记录，并解除其归档限制。"""
         try:
-            data = {
-                "records": [r.to_dict() for r in self._records],
+            self._log.append_add(record)
+        finally:
+            with self._lock:
+                count = self._unwritten.pop(record.key) - 1
+                if count:
+                    self._unwritten[record.key] = count
+    
+    def _after_batch(self) -> None:
+        """写入线程：每批写入完成后同步到磁盘，再按需归档和压缩。"""
+        if self._blobs is not None:
+            self._blobs.sync()
+        self._log.sync()
+        self._maintain()
+    
+    def _maintain(self) -> None:
+        """写入线程：按需归档、压缩日志和回收文本。"""
+        if self.is_loaded and len(self._records) >= HOT_RECORDS + ARCHIVE_BATCH:
+            self._archive_oldest()
+        self._maybe_compact()
+    
+    def _archive_oldest(self) -> None:
+        """写入线程：把超出 HOT_RECORDS 的最旧记录移入归档并在日志中标记。"""
+        with self._lock:
+            records = self._records.page(len(self._records) - HOT_RECORDS, HOT_RECORDS)
+            records.reverse()
+            # 新增尚未写入日志的记录不归档，否则归档标记会先于其新增条目
+            # 写入日志，重新加载时这些记录会重复出现
+            for i, record in enumerate(records):
+                if record.key in self._unwritten:
+                    del records[i:]
+                    break
+        if not records:
+            return
+        try:
+            segments = self._archive.write_segments(records)
+        except OSError as e:
+            logger.error(f"归档历史记录出错: {e}")
+            return
+        
+        with self._lock:
+            self._archive.add_segments(segments)
+            for record in records:
+                if self._records.get(record.key) is record:
+                    self._records.remove(record.key)
+                    if self._search_index is not None:
+                        self._search_index.remove(record)
+                else:
+                    # 写分段期间已被删除或重复翻译移到最新，归档中的这份作废
+                    self._archive.remove(record.id)
+            self._contents = None
+        try:
+            self._archive.save()
+            self._log.append_archive([record.id for record in records])
+        except OSError as e:
+            logger.error(f"写入历史归档出错: {e}")
+    
+    def _newest(self, index: int) -> Optional[TranslationRecord]:
+        """第 index 新的记录（超出内存中的记录时从归档读取）。"""
+        if index < len(self._records):
+            return self._records.newest(index)
+        return self._archive.newest(index - len(self._records))
+    
+    def _maybe_compact(self) -> None:
+        """写入线程：失效条目过多时压缩日志，并回收不再被引用的文本。"""
+        if self._log.needs_compaction(len(self._records)):
+            with self._lock:
+                records = self._records.snapshot()
+            self._log.compact(records, background=False)
+        if self._blobs is not None:
+            self._blobs.collect()
+    
+    def _live_digests(self) -> Optional[Set[bytes]]:
+        """日志中存活记录引用的文本哈希（加载完成前返回None）。"""
+        if not self.is_loaded:
+            return None
+        with self._lock:
+            records = self._records.snapshot()
+        digests: Set[bytes] = set()
+        for record in records:
+            digests.add(BlobStore.digest(record.source_text))
+            digests.add(BlobStore.digest(record.translated_text))
+        return digests
+    
+    def _find_duplicate(
+        self,
+        source_text: str,
+        translated_text: str,
+        target_language: str,
+    ) -> Optional[TranslationRecord]:
+        """查找原文、译文和目标语言都相同的记录（只查日志中的记录，不查归档）。"""
+        if self._contents is None:
+            self._contents = {
+                (r.source_text, r.translated_text, r.target_language): r.key
+                for r in self._records.snapshot()
             }
+        key = self._contents.get((source_text, translated_text, target_language))
+        return self._records.get(key) if key is not None else None
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        立即执行所有待写入的操作并等待完成（退出前调用）。
+        
+        Args:
+            timeout: 最长等待时间（秒），None 表示一直等待
             
-            # 确保目录存在
-            os.makedirs(os.path.dirname(self._history_path), exist_ok=True)
-            
-            with open(self._history_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            logger.debug("历史记录保存成功")
-            return True
-        except Exception as e:
-            logger.error(f"保存历史记录出错: {e}")
+        Returns:
+            是否在超时前全部写完
+        """
+        if not self._writer.flush(timeout):
+            logger.warning(f"历史记录仍有 {self._writer.pending} 个写入未完成")
             return False
+        return True
+    
+    def save(self) -> bool:
+        """
+        等待历史记录全部写入磁盘（等同于 flush()）。
+        
+        Returns:
+            是否保存成功
+        """
+        return self.flush()
     
     def add_observer(self, callback: Callable[[TranslationRecord], None]) -> None:
         """添加观察者，当新记录添加时通知。"""
@@ -118,26 +364,39 @@ class HistoryManager:
         Returns:
             创建的翻译记录
         """
-        record = TranslationRecord.create(
-            source_text=source_text,
-            translated_text=translated_text,
-            source_language=source_language,
-            target_language=target_language,
-            model=model,
-            skill=skill,
-        )
+        if self._blobs is not None:
+            # 与缓存共用同一个文本对象
+            source_text = self._blobs.intern(source_text)
+            translated_text = self._blobs.intern(translated_text)
         
-        # 添加到记录列表（最新的在前）
-        self._records.insert(0, record)
-        
-        # 限制记录数量
-        if len(self._records) > self.MAX_RECORDS:
-            self._records = self._records[:self.MAX_RECORDS]
+        with self._lock:
+            record = TranslationRecord.create(
+                source_text=source_text,
+                translated_text=translated_text,
+                source_language=source_language,
+                target_language=target_language,
+                model=model,
+                skill=skill,
+            )
+            duplicate = self._find_duplicate(source_text, translated_text, target_language)
+            if duplicate is not None:
+                # 重复翻译：沿用原记录ID，替换后移到最新
+                record.id = duplicate.id
+            
+            # 添加为最新记录
+            self._records.add(record)
+            self._unwritten[record.key] = self._unwritten.get(record.key, 0) + 1
+            self._contents[(source_text, translated_text, target_language)] = record.key
+            if self._search_index is not None:
+                self._search_index.add(record)
         
-        logger.info(f"添加翻译记录: {record.id[:8]}... ({source_language} -> {target_language})")
+        if duplicate is not None:
+            logger.info(f"重复的翻译记录已移到最新: {record.id[:8]}...")
+        else:
+            logger.info(f"添加翻译记录: {record.id[:8]}... ({source_language} -> {target_language})")
         
-        # 自动保存
-        self.save()
+        # 在写入线程中追加日志
+        self._persist(lambda: self._append_add(record))
         
         # 通知观察者
         self._notify_observers(record)
@@ -154,10 +413,13 @@ class HistoryManager:
         Returns:
             翻译记录，未找到返回None
         """
-        for record in self._records:
-            if record.id == record_id:
-                return record
-        return None
+        record = self._records.get(record_id)
+        if record is None and not self.is_loaded:
+            self._ensure_loaded()
+            record = self._records.get(record_id)
+        if record is None:
+            record = self._archive.get(record_id)
+        return record
     
     def get_records(
         self,
@@ -174,11 +436,17 @@ class HistoryManager:
         Returns:
             翻译记录列表
         """
-        return self._records[offset:offset + limit]
+        self._ensure_loaded(offset + limit)
+        records = self._records.page(limit, offset)
+        if len(records) < limit:
+            records += self._archive.page(
+                limit - len(records), max(0, offset - len(self._records))
+            )
+        return records
     
     def get_latest_record(self) -> Optional[TranslationRecord]:
         """获取最新的翻译记录。"""
-        return self._records[0] if self._records else None
+        return self._newest(0)
     
     def search_records(
         self,
@@ -188,6 +456,10 @@ class HistoryManager:
         """
         搜索历史记录。
         
+        使用倒排索引（首次搜索时建立，之后随增删更新），所有关键词都需
+        出现，最后一个单词按前缀匹配，结果按相关度排序。结果不足时继续
+        从新到旧搜索归档。
+        
         Args:
             keyword: 搜索关键词
             limit: 返回数量限制
@@ -195,16 +467,18 @@ class HistoryManager:
         Returns:
             匹配的翻译记录列表
         """
-        keyword_lower = keyword.lower()
-        results = []
-        
-        for record in self._records:
-            if (keyword_lower in record.source_text.lower() or 
-                keyword_lower in record.translated_text.lower()):
-                results.append(record)
-                if len(results) >= limit:
-                    break
-        
+        if self._search_index is None:
+            self._ensure_loaded()
+        with self._lock:
+            if self._search_index is None:
+                self._search_index = HistorySearchIndex()
+                self._search_index.add_all(reversed(self._records.snapshot()))
+                logger.debug(f"已建立历史搜索索引: {len(self._search_index)} 条记录")
+            
+            keys = self._search_index.search(keyword, limit)
+            results = [record for record in map(self._records.get, keys) if record is not None]
+        if len(results) < limit:
+            results += self._archive.search(keyword, limit - len(results))
         return results
     
     def delete_record(self, record_id: str) -> bool:
@@ -217,24 +491,40 @@ class HistoryManager:
         Returns:
             是否删除成功
         """
-        for i, record in enumerate(self._records):
-            if record.id == record_id:
-                del self._records[i]
-                self.save()
-                logger.info(f"已删除记录: {record_id[:8]}...")
+        if self._records.get(record_id) is None:
+            self._ensure_loaded()
+        with self._lock:
+            record = self._records.remove(record_id)
+            if record is None:
+                if self._archive.remove(record_id) is None:
+                    return False
+                self._writer.submit(self._archive.save)
+                logger.info(f"已删除归档记录: {record_id[:8]}...")
                 return True
-        return False
+            if self._search_index is not None:
+                self._search_index.remove(record)
+            self._contents = None
+        self._persist(lambda: self._log.append_delete(record_id))
+        logger.info(f"已删除记录: {record_id[:8]}...")
+        return True
     
     def clear_history(self) -> None:
         """清空所有历史记录。"""
-        self._records = []
-        self.save()
+        self._stop_loading()
+        with self._lock:
+            self._records.clear()
+            if self._search_index is not None:
+                self._search_index.clear()
+            self._archive.clear()
+            self._contents = None
+        self._writer.submit(self._archive.remove_files)
+        self._persist(self._log.append_clear)
         logger.info("历史记录已清空")
     
     @property
     def record_count(self) -> int:
-        """获取记录总数。"""
-        return len(self._records)
+        """获取记录总数（含归档，后台加载完成前可能少于实际数量）。"""
+        return len(self._records) + len(self._older) + len(self._archive)
     
     # ==================== 历史翻阅功能 ====================
     
@@ -245,13 +535,16 @@ class HistoryManager:
         Returns:
             翻阅到的历史记录，如果无法上翻返回None
         """
-        if len(self._records) == 0:
+        # 多预读一条，以便判断是否已到最旧的记录
+        self._ensure_loaded(self._history_pointer + 2)
+        total = self.record_count
+        if total == 0:
             return None
         
         if self._history_pointer == -1:
             # 从当前模式进入历史模式
             self._history_pointer = 0
-        elif self._history_pointer < len(self._records) - 1:
+        elif self._history_pointer < total - 1:
             # 在历史模式中继续上翻
             self._history_pointer += 1
         else:
@@ -259,7 +552,7 @@ class HistoryManager:
             return None
         
         logger.debug(f"上翻到历史记录: 指针={self._history_pointer}")
-        return self._records[self._history_pointer]
+        return self._newest(self._history_pointer)
     
     def navigate_down(self) -> Optional[TranslationRecord]:
         """
@@ -277,7 +570,7 @@ class HistoryManager:
         # 在历史模式中下翻
         self._history_pointer -= 1
         logger.debug(f"下翻到历史记录: 指针={self._history_pointer}")
-        return self._records[self._history_pointer]
+        return self._newest(self._history_pointer)
     
     def exit_history_mode(self) -> None:
         """退出历史模式，回到当前模式。"""
@@ -291,4 +584,3 @@ class HistoryManager:
     def get_history_pointer(self) -> int:
         """获取历史指针。"""
         return self._history_pointer
-
@@ -0,0 +1,207 @@
+"""Full-text search index for translation history module."""
+
+import heapq
+import math
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from core.types import TranslationRecord
+
+# 拼音文字按单词切分；中日韩文字按连续片段切分后再生成二元组
+_CJK_CHARS = r"\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_TOKEN_PATTERN = re.compile(rf"[{_CJK_CHARS}]+|[^\W_{_CJK_CHARS}]+")
+_CJK_PATTERN = re.compile(rf"[{_CJK_CHARS}]")
+
+# BM25 参数
+_K1 = 1.2
+_B = 0.75
+
+
+def _is_cjk(token: str) -> bool:
+    return _CJK_PATTERN.match(token) is not None
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    将文本切分为索引词。
+
+    拼音文字取小写单词；中日韩文字取相邻两字的二元组，并保留单字以支持
+    单字查询。
+
+    Args:
+        text: 文本
+
+    Returns:
+        索引词列表（含重复）
+    """
+    tokens: List[str] = []
+    for run in _TOKEN_PATTERN.findall(text.lower()):
+        if _is_cjk(run):
+            tokens.extend(run)
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def query_terms(query: str) -> List[Tuple[str, bool]]:
+    """
+    解析查询为 (词, 是否前缀匹配) 列表。
+
+    末尾带 * 的词以及最后一个拼音词按前缀匹配；中日韩片段按二元组匹配，
+    单字时按单字匹配。
+
+    Args:
+        query: 查询文本
+
+    Returns:
+        (词, 是否前缀匹配) 列表
+    """
+    terms: List[Tuple[str, bool]] = []
+    for match in _TOKEN_PATTERN.finditer(query.lower()):
+        run = match.group()
+        if _is_cjk(run):
+            if len(run) == 1:
+                terms.append((run, False))
+            else:
+                terms.extend((run[i:i + 2], False) for i in range(len(run) - 1))
+        else:
+            explicit = query[match.end():match.end() + 1] == "*"
+            terms.append((run, explicit))
+    if terms and not terms[-1][1] and not _is_cjk(terms[-1][0]):
+        terms[-1] = (terms[-1][0], True)
+    return terms
+
+
+class HistorySearchIndex:
+    """历史记录的倒排索引。
+
+    词 -> {记录ID: 词频} 的倒排表随记录增删增量维护；拼音单词另有词表，
+    前缀查询时按需排序后二分查找。查询要求所有词都出现（与运算），从最短的倒排表开始求交集，
+    结果按 BM25 得分排序，得分相同时新记录在前。
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[object, int]] = {}
+        self._words: Set[str] = set()          # 拼音单词词表（前缀查询用）
+        self._sorted_words: Optional[List[str]] = None
+        self._lengths: Dict[object, int] = {}  # 记录键 -> 词数
+        self._order: Dict[object, int] = {}    # 记录键 -> 添加序号（越大越新）
+        self._next_order = 0
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    @staticmethod
+    def _record_tokens(record: TranslationRecord) -> List[str]:
+        return tokenize(record.source_text) + tokenize(record.translated_text)
+
+    def add(self, record: TranslationRecord) -> None:
+        """索引一条记录（ID已存在时先移除旧内容）。"""
+        if record.key in self._lengths:
+            self.remove(record)
+        tokens = self._record_tokens(record)
+        counts: Dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for token, count in counts.items():
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = {}
+                if not _is_cjk(token):
+                    self._words.add(token)
+                    self._sorted_words = None
+            posting[record.key] = count
+        self._lengths[record.key] = len(tokens)
+        self._order[record.key] = self._next_order
+        self._next_order += 1
+        self._total_length += len(tokens)
+
+    def add_all(self, records: Iterable[TranslationRecord]) -> None:
+        """批量索引记录（按时间从旧到新传入）。"""
+        for record in records:
+            self.add(record)
+
+    def remove(self, record: TranslationRecord) -> None:
+        """从索引中移除记录。"""
+        length = self._lengths.pop(record.key, None)
+        if length is None:
+            return
+        self._order.pop(record.key, None)
+        self._total_length -= length
+        for token in set(self._record_tokens(record)):
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(record.key, None)
+            if not posting:
+                del self._postings[token]
+                if token in self._words:
+                    self._words.discard(token)
+                    self._sorted_words = None
+
+    def clear(self) -> None:
+        """清空索引。"""
+        self.__init__()
+
+    def _expand(self, prefix: str) -> List[str]:
+        """以 prefix 开头的所有词。"""
+        if self._sorted_words is None:
+            self._sorted_words = sorted(self._words)
+        words = self._sorted_words
+        return words[bisect_left(words, prefix):bisect_left(words, prefix + "\uffff")]
+
+    def _matches(self, term: str, prefix: bool) -> Dict[object, int]:
+        """词（或前缀展开后的所有词）命中的记录及词频。"""
+        if not prefix:
+            return self._postings.get(term, {})
+        tokens = self._expand(term)
+        if len(tokens) == 1:
+            return self._postings[tokens[0]]
+        merged: Dict[object, int] = {}
+        for token in tokens:
+            for key, count in self._postings[token].items():
+                merged[key] = merged.get(key, 0) + count
+        return merged
+
+    def search(self, query: str, limit: int = 50) -> List[object]:
+        """
+        搜索记录。
+
+        Args:
+            query: 查询文本
+            limit: 返回数量限制
+
+        Returns:
+            按相关度排序的记录键（TranslationRecord.key）
+        """
+        terms = query_terms(query)
+        if not terms or not self._lengths:
+            return []
+
+        matches = [self._matches(term, prefix) for term, prefix in terms]
+        matches.sort(key=len)
+        if not matches[0]:
+            return []
+
+        candidates: Set[object] = set(matches[0])
+        for posting in matches[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+
+        total = len(self._lengths)
+        lengths = self._lengths
+        base = _K1 * (1 - _B)
+        scale = _K1 * _B * total / self._total_length
+        scores: Dict[object, float] = dict.fromkeys(candidates, 0.0)
+        for posting in matches:
+            weight = (_K1 + 1) * math.log(1 + (total - len(posting) + 0.5) / (len(posting) + 0.5))
+            for key in candidates:
+                tf = posting[key]
+                scores[key] += weight * tf / (tf + base + scale * lengths[key])
+
+        order = self._order
+        return heapq.nlargest(limit, candidates, key=lambda key: (scores[key], order[key]))
@@ -0,0 +1,140 @@
+"""Incremental re-translation module."""
+
+import difflib
+import re
+from dataclasses import dataclass
+from typing import Hashable, List, Optional, Tuple
+
+from core.logger import get_logger
+
+logger = get_logger("IncrementalTranslation")
+
+_PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """按空行拆分段落。"""
+    return [p.strip() for p in _PARAGRAPH_SPLIT.split(text.strip()) if p.strip()]
+
+
+@dataclass
+class IncrementalPlan:
+    """增量翻译计划。"""
+    paragraphs: List[str]                # 新原文的段落
+    translations: List[Optional[str]]    # 可复用的译文，需重新翻译的段落为None
+    changed: List[int]                   # 需要翻译的段落下标
+
+    @property
+    def segments(self) -> List[str]:
+        """需要翻译的段落原文。"""
+        return [self.paragraphs[i] for i in self.changed]
+
+    @property
+    def contexts(self) -> List[Tuple[str, str]]:
+        """需要翻译的段落的前后相邻段落（仅作上下文）。"""
+        result = []
+        for i in self.changed:
+            before = self.paragraphs[i - 1] if i > 0 else ""
+            after = self.paragraphs[i + 1] if i + 1 < len(self.paragraphs) else ""
+            result.append((before, after))
+        return result
+
+    def preview(self, placeholder: str = "…") -> str:
+        """已复用段落的译文，待翻译段落以占位符代替。"""
+        return "\n\n".join(t if t is not None else placeholder for t in self.translations)
+
+    def apply(self, translated: List[str]) -> List[str]:
+        """
+        将新译文填入计划，得到与原文段落对齐的完整译文。
+
+        Args:
+            translated: 与 changed 顺序一致的译文
+
+        Returns:
+            段落级译文列表
+        """
+        result = list(self.translations)
+        for i, text in zip(self.changed, translated):
+            result[i] = text.strip()
+        return result
+
+
+class IncrementalTracker:
+    """记录上一次翻译的段落级对应关系，并为新原文生成增量翻译计划。
+
+    只有能确定原文与译文段落一一对应时才会启用增量翻译；改动比例过大、
+    翻译配置变化或无法对齐时返回None，由调用方执行完整翻译。
+    """
+
+    MAX_CHANGED_RATIO = 0.5  # 改动段落超过该比例时完整翻译
+
+    def __init__(self):
+        self._paragraphs: List[str] = []
+        self._translations: List[str] = []
+        self._key: Optional[Hashable] = None
+
+    def reset(self) -> None:
+        """清除记录。"""
+        self._paragraphs = []
+        self._translations = []
+        self._key = None
+
+    def remember(self, source: str, translation: str, key: Hashable) -> None:
+        """
+        记录一次完整翻译；段落数一致时视为一一对应。
+
+        Args:
+            source: 原文
+            translation: 译文
+            key: 翻译配置（提示词、模型、目标语言等），变化时不复用
+        """
+        paragraphs = split_paragraphs(source)
+        translations = split_paragraphs(translation)
+        if paragraphs and len(paragraphs) == len(translations):
+            self.remember_aligned(paragraphs, translations, key)
+        else:
+            self.reset()
+
+    def remember_aligned(self, paragraphs: List[str], translations: List[str], key: Hashable) -> None:
+        """记录已对齐的段落级翻译。"""
+        self._paragraphs = list(paragraphs)
+        self._translations = list(translations)
+        self._key = key
+
+    def plan(self, source: str, key: Hashable) -> Optional[IncrementalPlan]:
+        """
+        对比新原文与上一次翻译的原文。
+
+        Args:
+            source: 新原文
+            key: 翻译配置
+
+        Returns:
+            增量翻译计划；无可复用内容、原文未变化或不适合增量时返回None
+        """
+        if not self._paragraphs or key != self._key:
+            return None
+
+        paragraphs = split_paragraphs(source)
+        if paragraphs == self._paragraphs:
+            # 原文未变时走完整流程，保留重复翻译的刷新语义
+            return None
+
+        translations: List[Optional[str]] = []
+        changed: List[int] = []
+
+        matcher = difflib.SequenceMatcher(None, self._paragraphs, paragraphs, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                translations.extend(self._translations[i1:i2])
+            elif tag in ("replace", "insert"):
+                for j in range(j1, j2):
+                    changed.append(len(translations))
+                    translations.append(None)
+            # delete: 旧段落直接丢弃
+
+        if len(changed) > len(paragraphs) * self.MAX_CHANGED_RATIO:
+            return None
+
+        logger.debug(f"增量翻译: {len(changed)}/{len(paragraphs)} 段需要翻译")
+        return IncrementalPlan(paragraphs, translations, changed)
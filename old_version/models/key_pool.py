@@ -0,0 +1,235 @@
+"""API key pool module."""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.logger import get_logger
+from models.rate_limiter import RateLimiter, RateLimiterRegistry
+
+logger = get_logger("APIKeyPool")
+
+# 额度耗尽（insufficient_quota）的密钥暂停使用的时间（秒）
+QUOTA_COOLDOWN: float = 3600.0
+
+# 认证失败（401/403）的密钥暂停使用的时间（秒）；可能只是代理等临时故障，不永久移除
+AUTH_COOLDOWN: float = 600.0
+
+# 所有密钥都需要等待时，单次在某个密钥上排队的最长时间（秒）
+_QUEUE_SLICE: float = 1.0
+
+
+def mask_key(key: str) -> str:
+    """遮蔽密钥，仅用于日志显示。"""
+    if len(key) <= 10:
+        return "***"
+    return f"{key[:6]}...{key[-4:]}"
+
+
+class NoAvailableKeyError(RuntimeError):
+    """密钥池中没有可用密钥。"""
+
+
+class KeyState:
+    """单个密钥的运行状态。"""
+
+    def __init__(self, key: str, limiter: RateLimiter):
+        self.key = key
+        self.limiter = limiter
+        self.disabled_until = 0.0      # 认证失败或额度耗尽，暂时移出轮换
+        self.consecutive_errors = 0
+        self.last_used = 0.0
+
+    def usable(self, now: float) -> bool:
+        return now >= self.disabled_until
+
+
+class KeyLease:
+    """一次请求占用的密钥。"""
+
+    def __init__(self, state: KeyState, estimated_tokens: int):
+        self.state = state
+        self.estimated_tokens = estimated_tokens
+
+    @property
+    def key(self) -> str:
+        return self.state.key
+
+    @property
+    def limiter(self) -> RateLimiter:
+        return self.state.limiter
+
+    def release(self, actual_tokens: Optional[int] = None) -> None:
+        """释放限流额度。"""
+        self.state.limiter.release(self.estimated_tokens, actual_tokens)
+
+
+class APIKeyPool:
+    """API配置的密钥池。
+
+    每个密钥拥有独立的限流器和错误状态，请求优先分配给可立即放行且
+    负载最低的密钥（负载相同时按最久未使用轮换），使总吞吐量随密钥数
+    线性增长。认证失败的密钥自动移出轮换，额度耗尽的密钥暂停一段时间。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        keys: List[str],
+        limiter_factory: Callable[[str], RateLimiter],
+    ):
+        """
+        初始化密钥池。
+
+        Args:
+            name: API配置名称
+            keys: 密钥列表
+            limiter_factory: 根据密钥获取限流器的函数
+        """
+        self._name = name
+        self._limiter_factory = limiter_factory
+        self._lock = threading.Lock()
+        self._states: List[KeyState] = []
+        self.update_keys(keys)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def size(self) -> int:
+        """密钥总数。"""
+        return len(self._states)
+
+    @property
+    def active_count(self) -> int:
+        """当前参与轮换的密钥数。"""
+        now = time.monotonic()
+        with self._lock:
+            return sum(1 for s in self._states if s.usable(now))
+
+    def update_keys(self, keys: List[str]) -> None:
+        """更新密钥列表，保留已有密钥的状态。"""
+        with self._lock:
+            existing = {s.key: s for s in self._states}
+            self._states = [
+                existing.get(key) or KeyState(key, self._limiter_factory(key))
+                for key in keys
+            ]
+
+    def _candidates(self, tokens: int) -> List[Tuple[float, KeyState]]:
+        now = time.monotonic()
+        with self._lock:
+            active = [s for s in self._states if s.usable(now)]
+        if not active:
+            raise NoAvailableKeyError(f"API配置 '{self._name}' 没有可用的API密钥（均已失效或额度耗尽）")
+        ranked = [(s.limiter.estimated_wait(tokens), s) for s in active]
+        ranked.sort(key=lambda item: (item[0], item[1].limiter.in_flight, item[1].last_used))
+        return ranked
+
+    def acquire(
+        self,
+        tokens: int,
+        should_cancel: Optional[Callable[[], bool]] = None,
+        queue: bool = True,
+    ) -> Optional[KeyLease]:
+        """
+        选择一个密钥并获取其限流额度。
+
+        Args:
+            tokens: 预计消耗的 token 数
+            should_cancel: 返回True时放弃等待
+            queue: 是否进入限流器的排队队列；低优先级请求传False，
+                只在额度空闲时获取，从不占用排在交互式请求之前的位置
+
+        Returns:
+            密钥租约，取消时返回None
+
+        Raises:
+            NoAvailableKeyError: 没有可用密钥
+        """
+        while True:
+            if should_cancel and should_cancel():
+                return None
+
+            ranked = self._candidates(tokens)
+            for _, state in ranked:
+                if state.limiter.try_acquire(tokens):
+                    state.last_used = time.monotonic()
+                    return KeyLease(state, tokens)
+
+            # 暂无可立即放行的密钥，在最快可用的密钥上排队一小段时间后重新选择
+            wait, state = ranked[0]
+            if not queue:
+                time.sleep(min(max(wait, 0.05), _QUEUE_SLICE))
+                continue
+            timeout = min(max(wait, 0.05), _QUEUE_SLICE)
+            if state.limiter.acquire(tokens, should_cancel=should_cancel, timeout=timeout):
+                state.last_used = time.monotonic()
+                return KeyLease(state, tokens)
+
+    def report_success(self, lease: KeyLease) -> None:
+        """记录请求成功。"""
+        lease.state.consecutive_errors = 0
+
+    def report_auth_failure(self, lease: KeyLease) -> None:
+        """认证失败，暂停使用该密钥。"""
+        state = lease.state
+        state.disabled_until = max(state.disabled_until, time.monotonic() + AUTH_COOLDOWN)
+        logger.warning(f"[{self._name}] 密钥 {mask_key(state.key)} 认证失败，暂停使用 {AUTH_COOLDOWN:.0f} 秒")
+
+    def report_rate_limited(self, lease: KeyLease, quota_exhausted: bool = False) -> None:
+        """记录限流错误；额度耗尽时暂停使用该密钥。"""
+        state = lease.state
+        state.consecutive_errors += 1
+        if quota_exhausted:
+            state.disabled_until = time.monotonic() + QUOTA_COOLDOWN
+            logger.warning(f"[{self._name}] 密钥 {mask_key(state.key)} 额度耗尽，暂停使用")
+
+
+class APIKeyPoolRegistry:
+    """密钥池注册表，按API配置维护密钥池，密钥级限流器全局共享。"""
+
+    def __init__(self):
+        self._limiters = RateLimiterRegistry()
+        self._pools: Dict[Tuple[str, str], APIKeyPool] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        name: str,
+        base_url: str,
+        keys: List[str],
+        rpm: int = 0,
+        tpm: int = 0,
+    ) -> APIKeyPool:
+        """
+        获取（必要时创建）API配置的密钥池。
+
+        Args:
+            name: API配置名称
+            base_url: API基础URL
+            keys: 密钥列表
+            rpm: 每个密钥的每分钟请求数限额
+            tpm: 每个密钥的每分钟 token 数限额
+
+        Returns:
+            密钥池实例
+        """
+        def limiter_factory(key: str) -> RateLimiter:
+            return self._limiters.get(f"{name}/{mask_key(key)}", base_url, key, rpm, tpm)
+
+        pool_key = (name, base_url.rstrip("/"))
+        with self._lock:
+            pool = self._pools.get(pool_key)
+            if pool is None:
+                pool = APIKeyPool(name, keys, limiter_factory)
+                self._pools[pool_key] = pool
+                if len(keys) > 1:
+                    logger.info(f"[{name}] 密钥池包含 {len(keys)} 个密钥")
+            else:
+                pool._limiter_factory = limiter_factory
+                pool.update_keys(keys)
+                for key in keys:
+                    limiter_factory(key)  # 同步用户配置的限额
+            return pool
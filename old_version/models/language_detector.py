@@ -1,13 +1,423 @@
 """Language detection module."""
 
+import math
 import re
-from typing import Tuple, Dict
+import threading
+from array import array
+from collections import Counter
+from itertools import repeat
+from typing import Tuple, Dict, List, Optional, Sequence, Union
 
 from core.logger import get_logger
 from core.types import LanguageInfo
 
+try:
+    import numpy as np
+except ImportError:  # 未安装 NumPy 时批量检测逐段进行
+    np = None
+
 logger = get_logger("LanguageDetector")
 
+# 超过该长度的文本均匀抽样检测
+MAX_SAMPLE_CHARS: int = 4096
+# 抽样时的片段数
+SAMPLE_CHUNKS: int = 16
+
+# 文字区块 (起始码位, 结束码位, 文字)
+_SCRIPT_BLOCKS: List[Tuple[int, int, str]] = [
+    (0x0041, 0x024F, "latin"),      # 基本拉丁字母及带变音符号的字母（只计字母）
+    (0x0400, 0x04FF, "cyrillic"),
+    (0x3040, 0x30FF, "kana"),       # 平假名、片假名
+    (0x3400, 0x4DBF, "han"),        # CJK 扩展A
+    (0x4E00, 0x9FFF, "han"),
+    (0xAC00, 0xD7AF, "hangul"),
+    (0xF900, 0xFAFF, "han"),        # CJK 兼容汉字
+]
+
+# 文字的标记字符：文本先经 str.translate 映射为标记，再用 str.count 计数，
+# 逐字符的工作全部在C层完成
+_SCRIPT_MARKERS: Dict[str, str] = {
+    "latin": "\x01",
+    "cyrillic": "\x02",
+    "kana": "\x03",
+    "han": "\x04",
+    "hangul": "\x05",
+}
+_SEPARATOR = "\x00"  # 批量检测时的分隔符，映射后保持不变
+_FILLER = " "         # 其他字符统一映射为空格
+_MULTI_CHAR_LOWER = "\u0130"  # 小写后不止一个字符的字母（İ -> i̇）
+
+# 各文字单个字符的权重：拼音文字一个单词由多个字母组成，按约三个字母
+# 相当于一个汉字/音节计算，避免英文中夹杂一个中文词就被判为中文
+_SCRIPT_WEIGHTS: Dict[str, float] = {
+    "latin": 1 / 3,
+    "cyrillic": 1 / 3,
+    "han": 1.0,
+    "kana": 1.0,
+    "hangul": 1.0,
+}
+
+# 三元组分类器缓存的单词得分数上限，超过时清空
+WORD_CACHE_SIZE: int = 50000
+
+# 汉字与假名中假名占比达到该值时视为日语
+JAPANESE_KANA_RATIO: float = 0.1
+
+# 拉丁字母过少或三元组证据不足时，默认判为英语并乘以该系数，
+# 使调用方能区分默认猜测与确实判定的英语
+UNDECIDED_LATIN_CONFIDENCE: float = 0.3
+
+# 其他拉丁字母语言平均每个三元组的对数概率须比英语高出该值才判为该语言，
+# 否则视为证据不足（英文论文标题等短语中与法、西语同形的词很多）
+LATIN_MIN_MARGIN: float = 0.5
+
+# 平均每个三元组领先第二名该值时，三元组分类的置信度为1
+LATIN_CONFIDENT_MARGIN: float = 1.2
+
+# 批量检测返回紧凑编码时使用的语言编号
+LANGUAGE_CODES: Tuple[str, ...] = (
+    "English", "Chinese", "Japanese", "Korean", "Russian", "French", "German", "Spanish",
+)
+
+_LANGUAGES: Dict[str, LanguageInfo] = {
+    "English": LanguageInfo(code="English", native="English"),
+    "Chinese": LanguageInfo(code="Chinese", native="中文"),
+    "Japanese": LanguageInfo(code="Japanese", native="日本語"),
+    "Korean": LanguageInfo(code="Korean", native="한국어"),
+    "Russian": LanguageInfo(code="Russian", native="Русский"),
+    "French": LanguageInfo(code="French", native="Français"),
+    "German": LanguageInfo(code="German", native="Deutsch"),
+    "Spanish": LanguageInfo(code="Spanish", native="Español"),
+}
+
+_WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
+
+def _sample(text: str) -> str:
+    """长文本均匀抽取若干片段。"""
+    if len(text) <= MAX_SAMPLE_CHARS:
+        return text
+    size = MAX_SAMPLE_CHARS // SAMPLE_CHUNKS
+    step = (len(text) - size) / (SAMPLE_CHUNKS - 1)
+    return "".join(text[int(i * step):int(i * step) + size] for i in range(SAMPLE_CHUNKS))
+
+
+_script_table: Optional[str] = None
+
+
+def _get_script_table() -> str:
+    """码位 -> 标记字符的映射表（首次使用时生成，以字符串作为 translate 的查找表）。"""
+    global _script_table
+    if _script_table is None:
+        table = [_FILLER] * (_SCRIPT_BLOCKS[-1][1] + 1)
+        for start, end, script in _SCRIPT_BLOCKS:
+            marker = _SCRIPT_MARKERS[script]
+            for cp in range(start, end + 1):
+                if script != "latin" or chr(cp).isalpha():
+                    table[cp] = marker
+        table[ord(_SEPARATOR)] = _SEPARATOR
+        _script_table = "".join(table)
+    return _script_table
+
+
+def _count_scripts(marked: str) -> Dict[str, int]:
+    return {script: marked.count(marker) for script, marker in _SCRIPT_MARKERS.items()}
+
+
+def script_histogram(text: str) -> Dict[str, int]:
+    """
+    统计各文字的字符数（不含数字、标点和空白）。
+
+    Args:
+        text: 文本
+
+    Returns:
+        文字 -> 字符数
+    """
+    return _count_scripts(text.translate(_get_script_table()))
+
+
+def _trigrams(text: str) -> List[str]:
+    """提取小写单词序列（以空格连接、首尾补空格）的字符三元组（含重复）。"""
+    joined = f" {' '.join(_WORD_PATTERN.findall(text.lower()))} "
+    return list(map("".join, zip(joined, joined[1:], joined[2:])))
+
+
+_letter_mask = None
+_marker_array = None
+
+
+def _get_letter_mask(limit: int):
+    """
+    码位 -> 是否为 _WORD_PATTERN 中的字母（NumPy 布尔数组）。
+
+    按需生成：通常只覆盖基本多文种平面，出现更大的码位时再扩展到全部码位。
+
+    Args:
+        limit: 需要覆盖的码位上限（不含）
+    """
+    global _letter_mask
+    if _letter_mask is None or len(_letter_mask) < limit:
+        size = 0x10000 if limit <= 0x10000 else 0x110000
+        mask = np.zeros(size, dtype=bool)
+        for match in _WORD_PATTERN.finditer("".join(map(chr, range(size)))):
+            mask[match.start():match.end()] = True
+        _letter_mask = mask
+    return _letter_mask
+
+
+def _get_marker_array():
+    """码位 -> 文字标记编号的 NumPy 数组（与 _get_script_table 相同，其他字符为0，末项用于更大的码位）。"""
+    global _marker_array
+    if _marker_array is None:
+        table = np.frombuffer(f"{_get_script_table()}{_FILLER}".encode("utf-32-le"), dtype=np.uint32)
+        _marker_array = np.where(table == ord(_FILLER), 0, table).astype(np.int8)
+    return _marker_array
+
+
+def _code_points(text: str):
+    """文本的 UTF-32 码位数组。"""
+    return np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+
+
+def _load_profile() -> Tuple[List[str], Tuple[int, ...], Dict[str, Tuple[int, ...]]]:
+    """解析内置的三元组计数表，返回 (语言列表, 各语言三元组总数, 三元组 -> 各语言次数)。"""
+    from models.language_profiles import TRIGRAM_COUNTS, TRIGRAM_LANGUAGES, TRIGRAM_TOTALS
+    counts = {
+        line[:3]: tuple(map(int, line[4:].split()))
+        for line in TRIGRAM_COUNTS.splitlines()
+    }
+    return list(TRIGRAM_LANGUAGES), TRIGRAM_TOTALS, counts
+
+
+class TrigramClassifier:
+    """拉丁字母语言的字符三元组分类器（朴素贝叶斯）。
+
+    频率表在首次使用时由内置的三元组计数（见 language_profiles）生成，
+    每个三元组对应各语言的对数概率。单词序列 " w1 w2 ... " 的三元组恰好是各单词补空格后 " w " 的
+    三元组，加上相邻单词间跨空格的三元组，因此打分按单词进行：单词的
+    得分缓存复用（文本中的单词大量重复），按列累加在C层完成。
+    """
+    
+    MIN_LETTERS = 8  # 字母过少时不做区分
+    
+    def __init__(self, training_text: Optional[Dict[str, str]] = None):
+        """
+        初始化分类器。
+        
+        Args:
+            training_text: 语言 -> 训练文本，默认使用内置的三元组计数
+        """
+        self._training_text = training_text
+        self._lock = threading.Lock()
+        self._languages: List[str] = []
+        self._table: Dict[str, Tuple[float, ...]] = {}
+        self._unseen: Tuple[float, ...] = ()
+        self._english: Optional[int] = None
+        self._word_scores: Dict[str, Tuple[float, ...]] = {}
+        self._arrays = None  # 批量分类用的查找表（见 _get_arrays）
+        self._alphabet: Dict[int, int] = {}
+    
+    def _load(self) -> None:
+        with self._lock:
+            if self._table:
+                return
+            if self._training_text is None:
+                languages, totals, counts = _load_profile()
+            else:
+                languages = list(self._training_text)
+                profiles = [Counter(_trigrams(self._training_text[lang])) for lang in languages]
+                totals = tuple(sum(p.values()) for p in profiles)
+                counts = {
+                    tri: tuple(p[tri] for p in profiles)
+                    for tri in set().union(*profiles)
+                }
+            denominators = [total + len(counts) for total in totals]
+            
+            # 加一平滑
+            self._table = {
+                tri: tuple(math.log((c + 1) / d) for c, d in zip(row, denominators))
+                for tri, row in counts.items()
+            }
+            self._unseen = tuple(math.log(1 / d) for d in denominators)
+            self._languages = languages
+            self._english = languages.index("English") if "English" in languages else None
+            logger.debug(f"三元组频率表已加载: {len(languages)} 种语言, {len(counts)} 个三元组")
+    
+    def classify(self, text: str) -> Optional[Tuple[str, float]]:
+        """
+        判断拉丁字母文本的语言。
+        
+        Args:
+            text: 文本
+            
+        只有领先英语足够多时才判为其他语言；置信度由平均每个三元组领先
+        第二名的幅度换算，而不是朴素贝叶斯的后验概率（后者对稍长的文本
+        几乎总是接近1）。
+        
+        Args:
+            text: 文本
+            
+        Returns:
+            (语言, 置信度)，有效字母过少或证据不足以排除英语时返回None
+        """
+        if not self._table:
+            self._load()
+        words = _WORD_PATTERN.findall(text.lower())
+        # 与 _trigrams(text) 的长度相同
+        count = sum(map(len, words)) + len(words) - 1
+        if count < self.MIN_LETTERS:
+            return None
+        
+        cache = self._word_scores
+        rows = [cache.get(word) or self._score_word(word) for word in words]
+        bridges = [f"{a[-1]} {b[0]}" for a, b in zip(words, words[1:])]
+        rows.extend(map(self._table.get, bridges, repeat(self._unseen)))
+        scores = list(map(sum, zip(*rows)))
+        
+        order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+        best, second = order[0], order[1]
+        english = self._english
+        if english is not None and best != english:
+            if (scores[best] - scores[english]) / count < LATIN_MIN_MARGIN:
+                return None
+        margin = (scores[best] - scores[second]) / count
+        return self._languages[best], min(1.0, margin / LATIN_CONFIDENT_MARGIN)
+
+    def _score_word(self, word: str) -> Tuple[float, ...]:
+        """单词补空格后各三元组得分之和（写入缓存）。"""
+        padded = f" {word} "
+        trigrams = map("".join, zip(padded, padded[1:], padded[2:]))
+        score = tuple(map(sum, zip(*map(self._table.get, trigrams, repeat(self._unseen)))))
+        if len(self._word_scores) >= WORD_CACHE_SIZE:
+            self._word_scores.clear()
+        self._word_scores[word] = score
+        return score
+    
+    @property
+    def languages(self) -> List[str]:
+        """分类器区分的语言（按得分列的顺序）。"""
+        if not self._table:
+            self._load()
+        return self._languages
+    
+    def _get_arrays(self, limit: int):
+        """
+        批量分类用的查找表。
+        
+        码位先映射为（小写后的）符号：字母表中的字母为 1..A，字母表外的字母为 0，其他
+        字符为空格 (A+1)，批量分隔符为单独的边界符号 (A+2)。三元组编号
+        (a * K + b) * K + c 直接索引到对数概率表的列：边界符号在首尾时按
+        空格计分（即文本首尾补的空格），在中间或紧跟在空格之后时忽略（跨越
+        两段文本），得分为0。
+        
+        Args:
+            limit: 符号表需要覆盖的码位上限（不含）
+            
+        Returns:
+            (码位 -> 符号, 空格的符号, 边界符号, K, 三元组编号 -> 行号, 对数概率表（每行为一个三元组在各语言的值）)
+        """
+        if self._arrays is None:
+            if not self._table:
+                self._load()
+            letters = sorted(set("".join(self._table)) - {" "})
+            self._alphabet = {ord(char): i for i, char in enumerate(letters, 1)}
+            space, boundary = len(letters) + 1, len(letters) + 2
+            self._alphabet[ord(" ")] = space
+            size = boundary + 1
+            
+            known = np.full((size, size, size), len(self._table), dtype=np.int32)
+            for column, trigram in enumerate(self._table):
+                a, b, c = (self._alphabet[ord(char)] for char in trigram)
+                known[a, b, c] = column
+            first, middle, last = np.indices((size, size, size))
+            columns = known[
+                np.where(first == boundary, space, first),
+                middle,
+                np.where(last == boundary, space, last),
+            ]
+            ignored = len(self._table) + 1
+            columns[(middle == boundary) | ((middle == space) & (last == boundary))] = ignored
+            
+            # 各语言的对数概率，末尾两列为未见过的三元组和被忽略的三元组
+            log_probs = np.array(list(self._table.values()) + [self._unseen, (0.0,) * len(self._unseen)])
+            self._arrays = (np.zeros(0, dtype=np.int8), space, boundary, size, columns.ravel(), log_probs)
+        
+        symbols, space, boundary, size, columns, log_probs = self._arrays
+        if len(symbols) < limit:
+            lowered = np.where(_get_letter_mask(limit), 0, space).astype(np.int8)
+            for point, symbol in self._alphabet.items():
+                lowered[point] = symbol
+            lowered[ord(_SEPARATOR)] = boundary
+            # 大写字母取其小写的符号，省去对整段文本调用 lower()；小写后
+            # 不止一个字符的（见 _MULTI_CHAR_LOWER）由调用方先行小写
+            chars = "".join(map(chr, range(len(lowered))))
+            for char in _MULTI_CHAR_LOWER:
+                chars = chars.replace(char, _SEPARATOR)
+            symbols = lowered[_code_points(chars.lower())]
+            self._arrays = (symbols, space, boundary, size, columns, log_probs)
+        return self._arrays
+    
+    def classify_batch(self, samples: Sequence[str]):
+        """
+        批量判断拉丁字母文本的语言（需要 NumPy），判定规则与 classify() 相同。
+        
+        Args:
+            samples: 文本列表（不含分隔符）
+            
+        Returns:
+            (语言下标数组, 置信度数组)，无法判定的文本语言下标为-1
+        """
+        # 首尾各加分隔符作为边界，末尾多加一个使最后一段为空时区间起点仍有效
+        joined = f"{_SEPARATOR}{_SEPARATOR.join(samples)}{_SEPARATOR}{_SEPARATOR}"
+        if any(char in joined for char in _MULTI_CHAR_LOWER):
+            joined = joined.lower()
+        return self.classify_points(_code_points(joined), len(samples))
+    
+    def classify_points(self, points, count: int):
+        """
+        批量判断已转为码位数组的文本的语言。
+        
+        码位查表得到符号后只保留字母和紧跟字母的第一个非字母字符（即单词
+        间的空格），再编码全部三元组查表得到各语言的对数概率；各段的得分为
+        两个分隔符之间的区间和。
+        
+        Args:
+            points: 以分隔符开头、每段之后各有一个分隔符并再多一个分隔符结尾
+                的 UTF-32 码位数组（不含 _MULTI_CHAR_LOWER 中的字符）
+            count: 段数
+            
+        Returns:
+            (语言下标数组, 置信度数组)，无法判定的文本语言下标为-1
+        """
+        table, space, boundary, size, columns, log_probs = self._get_arrays(int(points.max()) + 1)
+        symbols = np.take(table, points)
+        
+        keep = symbols != space
+        keep[1:] |= symbols[:-1] < space
+        symbols = symbols[keep].astype(np.int32)
+        rows = np.take(columns, (symbols[:-2] * size + symbols[1:-1]) * size + symbols[2:])
+        
+        boundaries = np.flatnonzero(symbols == boundary)
+        starts, ends = boundaries[:count], boundaries[1:count + 1]
+        scores = np.add.reduceat(np.take(log_probs, rows, axis=0), starts, axis=0)
+        # 区间内除最后一个字符起始的三元组外均有效，以空格结尾时再去掉一个
+        totals = ends - starts - 1 - (symbols[ends - 1] == space)
+        
+        ordered = np.sort(scores, axis=1)
+        best = np.argmax(scores, axis=1)
+        lengths = np.maximum(totals, 1)
+        margin = (ordered[:, -1] - ordered[:, -2]) / lengths
+        confidence = np.minimum(1.0, margin / LATIN_CONFIDENT_MARGIN)
+        
+        undecided = totals < self.MIN_LETTERS
+        english = self._english
+        if english is not None:
+            lead = (ordered[:, -1] - scores[:, english]) / lengths
+            undecided |= (best != english) & (lead < LATIN_MIN_MARGIN)
+        best[undecided] = -1
+        return best, confidence
+
 
 class LanguageDetector:
     """语言检测器，负责检测文本语言和确定目标语言。"""
@@ -33,34 +443,180 @@ class LanguageDetector:
         "Русский": ("Russian", "Русский"),
     }
     
+    def __init__(self):
+        self._latin_classifier = TrigramClassifier()
+    
     def detect(self, text: str) -> LanguageInfo:
         """
         检测文本的语言。
         
+        统计各文字的字符数，按权重选出占主导的文字，置信度为其权重占比；
+        拉丁字母文本再由三元组分类器区分英、法、德、西语，字母过少或证据
+        不足以排除英语时默认为英语并降低置信度。长文本只检测均匀抽取的样本。
+        
         Args:
             text: 要检测的文本
             
         Returns:
-            语言信息
+            语言信息（含置信度）
+        """
+        sample = _sample(text)
+        code, confidence = self._classify(sample, script_histogram(sample))
+        info = _LANGUAGES[code]
+        return LanguageInfo(code=info.code, native=info.native, confidence=confidence)
+    
+    def detect_batch(
+        self,
+        texts: Sequence[str],
+        as_codes: bool = False,
+    ) -> Union[List[LanguageInfo], array]:
         """
-        # 检查是否包含中文字符
-        if re.search(r'[\u4e00-\u9fff]', text):
-            return LanguageInfo(code="Chinese", native="中文")
+        批量检测多段文本的语言。
         
-        # 日语（平假名、片假名）
-        if re.search(r'[\u3040-\u309f\u30a0-\u30ff]', text):
-            return LanguageInfo(code="Japanese", native="日本語")
+        所有文本（抽样后）以分隔符连接后一次处理，重复的文本只检测一次。
+        安装了 NumPy 时转为 UTF-32 码位数组，文字统计和三元组分类全部向量化
+        （见 _classify_batch）；否则只做一次 translate 映射，再逐段计数分类。
         
-        # 韩语
-        if re.search(r'[\uac00-\ud7af]', text):
-            return LanguageInfo(code="Korean", native="한국어")
+        Args:
+            texts: 文本列表
+            as_codes: 为True时返回紧凑的语言编号数组（LANGUAGE_CODES 的下标）
+            
+        Returns:
+            与输入顺序一致的语言信息列表或编号数组
+        """
+        unique = {text: i for i, text in enumerate(dict.fromkeys(texts))}
+        samples = [text if len(text) <= MAX_SAMPLE_CHARS else _sample(text) for text in unique]
+        if _SEPARATOR in "".join(samples):
+            samples = [sample.replace(_SEPARATOR, _FILLER) for sample in samples]
         
-        # 俄语
-        if re.search(r'[\u0400-\u04ff]', text):
-            return LanguageInfo(code="Russian", native="Русский")
+        if np is not None:
+            indices, confidences = self._classify_batch(samples)
+            if as_codes:
+                positions = np.fromiter(map(unique.__getitem__, texts), dtype=np.intp, count=len(texts))
+                return array("B", indices.astype(np.uint8)[positions].tobytes())
+            results = zip(map(LANGUAGE_CODES.__getitem__, indices.tolist()), confidences.tolist())
+        else:
+            marked = _SEPARATOR.join(samples).translate(_get_script_table()).split(_SEPARATOR)
+            results = [
+                self._classify(sample, _count_scripts(segment))
+                for sample, segment in zip(samples, marked)
+            ]
+            if as_codes:
+                indices = [LANGUAGE_CODES.index(code) for code, _ in results]
+                return array("B", (indices[unique[text]] for text in texts))
         
-        # 默认为英语
-        return LanguageInfo(code="English", native="English")
+        infos = [LanguageInfo(code, _LANGUAGES[code].native, confidence) for code, confidence in results]
+        return list(map(infos.__getitem__, map(unique.__getitem__, texts)))
+    
+    def _classify_batch(self, samples: List[str]):
+        """
+        向量化地检测多段文本的语言（需要 NumPy），规则与 _classify 相同。
+        
+        文本以分隔符连接后转为 UTF-32 码位数组，按码位查表得到文字标记，
+        以 (段号, 标记) 为下标做一次 bincount 得到各段的文字统计；以拉丁
+        字母为主的段再交给三元组分类器批量判定。
+        
+        Args:
+            samples: 不含分隔符的文本列表
+            
+        Returns:
+            (LANGUAGE_CODES 下标数组, 置信度数组)
+        """
+        count = len(samples)
+        # 首尾各加分隔符：各段之后的分隔符计入该段（标记为0，不影响统计），
+        # 同一数组也直接用于三元组分类
+        joined = f"{_SEPARATOR}{_SEPARATOR.join(samples)}{_SEPARATOR}{_SEPARATOR}"
+        points = _code_points(joined)
+        markers = _get_marker_array()
+        script = np.take(markers, points[1:-1], mode="clip")
+        width = len(_SCRIPT_MARKERS) + 1
+        lengths = np.fromiter(map(len, samples), dtype=np.intp, count=count) + 1
+        segment = np.repeat(np.arange(count), lengths)
+        counts = np.bincount(segment * width + script, minlength=count * width).reshape(count, width)
+        
+        def column(name: str):
+            return counts[:, ord(_SCRIPT_MARKERS[name])]
+        
+        han, kana = column("han"), column("kana")
+        japanese = (kana > 0) & (kana >= (han + kana) * JAPANESE_KANA_RATIO)
+        candidates = ("Chinese", "Japanese", "Korean", "Russian", "English")
+        scores = np.stack([
+            np.where(japanese, 0, han),
+            np.where(japanese, han + kana, kana),
+            column("hangul") * _SCRIPT_WEIGHTS["hangul"],
+            column("cyrillic") * _SCRIPT_WEIGHTS["cyrillic"],
+            column("latin") * _SCRIPT_WEIGHTS["latin"],
+        ], axis=1)
+        
+        total = scores.sum(axis=1)
+        best = np.argmax(scores, axis=1)
+        known = total > 0
+        confidences = np.where(known, scores[np.arange(count), best] / np.where(known, total, 1), 0.0)
+        indices = np.array([LANGUAGE_CODES.index(code) for code in candidates])[best]
+        english = LANGUAGE_CODES.index("English")
+        indices[~known] = english
+        
+        latin_rows = np.flatnonzero(known & (best == candidates.index("English")))
+        if latin_rows.size:
+            classifier = self._latin_classifier
+            if any(char in joined for char in _MULTI_CHAR_LOWER):
+                latin_samples = samples if latin_rows.size == count else [samples[i] for i in latin_rows]
+                languages, latin_confidences = classifier.classify_batch(latin_samples)
+            else:
+                latin_points = points
+                if latin_rows.size < count:
+                    # 只保留以拉丁字母为主的段（连同其后的分隔符）
+                    selected = np.zeros(count, dtype=bool)
+                    selected[latin_rows] = True
+                    inner = points[1:-1][selected[segment]]
+                    latin_points = np.concatenate((points[:1], inner, points[-1:]))
+                languages, latin_confidences = classifier.classify_points(latin_points, latin_rows.size)
+            # 无法判定（下标-1）的取末尾的英语
+            mapping = np.array([LANGUAGE_CODES.index(code) for code in classifier.languages] + [english])
+            codes = mapping[languages]
+            factors = np.where(
+                languages < 0,
+                UNDECIDED_LATIN_CONFIDENCE,
+                np.where(codes == english, np.maximum(latin_confidences, UNDECIDED_LATIN_CONFIDENCE), latin_confidences),
+            )
+            indices[latin_rows] = codes
+            confidences[latin_rows] *= factors
+        return indices, confidences
+    
+    def _classify(self, sample: str, counts: Dict[str, int]) -> Tuple[str, float]:
+        """根据文字统计（必要时结合三元组分类）确定语言与置信度。"""
+        han = counts.get("han", 0)
+        kana = counts.get("kana", 0)
+        
+        scores: Dict[str, float] = {}
+        if kana and kana >= (han + kana) * JAPANESE_KANA_RATIO:
+            # 日文中的汉字计入日语
+            scores["Japanese"] = han + kana
+        else:
+            scores["Chinese"] = han
+            scores["Japanese"] = kana
+        scores["Korean"] = counts.get("hangul", 0) * _SCRIPT_WEIGHTS["hangul"]
+        scores["Russian"] = counts.get("cyrillic", 0) * _SCRIPT_WEIGHTS["cyrillic"]
+        scores["English"] = counts.get("latin", 0) * _SCRIPT_WEIGHTS["latin"]
+        
+        total = sum(scores.values())
+        if total <= 0:
+            # 没有可识别的文字，默认为英语
+            return "English", 0.0
+        
+        code = max(scores, key=scores.get)
+        confidence = scores[code] / total
+        if code == "English":
+            latin = self._latin_classifier.classify(sample)
+            if latin is None:
+                confidence *= UNDECIDED_LATIN_CONFIDENCE
+            else:
+                code, latin_confidence = latin
+                if code == "English":
+                    # 英语是默认结果，判定为英语的置信度不低于默认猜测
+                    latin_confidence = max(latin_confidence, UNDECIDED_LATIN_CONFIDENCE)
+                confidence *= latin_confidence
+        return code, confidence
     
     def get_target_language(
         self,
@@ -99,3 +655,4 @@ class LanguageDetector:
         else:
             # 回退到英语
             return LanguageInfo(code="English", native="English")
+
@@ -0,0 +1,161 @@
+"""Mixed-language segmentation module."""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from core.logger import get_logger
+from models.language_detector import LanguageDetector
+
+logger = get_logger("MixedLanguage")
+
+# 句子边界：中文句末标点后（可无空白）、西文句末标点后的空白、换行
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[。！？；])[ \t]*|(?<=[.!?;])[ \t]+|[ \t]*\n\s*")
+
+# 每个含文字的句子检测置信度都达到该值才逐句拆分；拉丁字母文本的置信度
+# 由三元组得分的领先幅度换算而来，过短或证据不足的句子（如标题、致谢）
+# 远低于该值，此时整段照常翻译，避免把误判为目标语言的句子原样留下
+MIN_SPLIT_CONFIDENCE: float = 0.8
+
+
+def split_sentences(text: str) -> List[Tuple[str, str]]:
+    """
+    按句子拆分文本，保留句间分隔符以便原样拼回。
+
+    Args:
+        text: 文本
+
+    Returns:
+        (句子, 其后的分隔符) 列表
+    """
+    pieces: List[Tuple[str, str]] = []
+    pos = 0
+    for match in _SENTENCE_BOUNDARY.finditer(text):
+        sentence = text[pos:match.start()]
+        if sentence:
+            pieces.append((sentence, match.group()))
+        elif pieces:
+            pieces[-1] = (pieces[-1][0], pieces[-1][1] + match.group())
+        pos = match.end()
+    if pos < len(text):
+        pieces.append((text[pos:], ""))
+    return pieces
+
+
+@dataclass
+class MixedLanguagePlan:
+    """混合语言文本的翻译计划：已是目标语言的句子原样保留，其余按连续段翻译。"""
+    sentences: List[str]
+    separators: List[str]
+    runs: List[Tuple[int, int]]  # 需要翻译的连续句子区间 [start, end)
+
+    def _run_text(self, start: int, end: int) -> str:
+        parts = []
+        for i in range(start, end):
+            parts.append(self.sentences[i])
+            if i + 1 < end:
+                parts.append(self.separators[i])
+        return "".join(parts)
+
+    @property
+    def segments(self) -> List[str]:
+        """需要翻译的文本段。"""
+        return [self._run_text(start, end) for start, end in self.runs]
+
+    @property
+    def contexts(self) -> List[Tuple[str, str]]:
+        """各段前后相邻的句子（仅作上下文）。"""
+        result = []
+        for start, end in self.runs:
+            before = self.sentences[start - 1] if start > 0 else ""
+            after = self.sentences[end] if end < len(self.sentences) else ""
+            result.append((before, after))
+        return result
+
+    @property
+    def kept_chars(self) -> int:
+        """无需翻译的字符数。"""
+        translated = sum(len(self.sentences[i]) for start, end in self.runs for i in range(start, end))
+        return sum(len(s) for s in self.sentences) - translated
+
+    def assemble(self, translated: Optional[List[str]] = None, placeholder: str = "…") -> str:
+        """
+        将译文填回原位置，得到完整结果。
+
+        Args:
+            translated: 与 segments 顺序一致的译文，None 时以占位符代替
+            placeholder: 占位符
+
+        Returns:
+            拼接后的文本
+        """
+        starts = {start: (end, k) for k, (start, end) in enumerate(self.runs)}
+        parts = []
+        i = 0
+        while i < len(self.sentences):
+            if i in starts:
+                end, k = starts[i]
+                parts.append(translated[k].strip() if translated is not None else placeholder)
+                parts.append(self.separators[end - 1])
+                i = end
+            else:
+                parts.append(self.sentences[i])
+                parts.append(self.separators[i])
+                i += 1
+        return "".join(parts)
+
+
+def plan_mixed_translation(
+    detector: LanguageDetector,
+    text: str,
+    target_code: str,
+) -> Optional[MixedLanguagePlan]:
+    """
+    逐句检测语言，为混合语言文本生成翻译计划。
+
+    Args:
+        detector: 语言检测器
+        text: 原文
+        target_code: 目标语言代码
+
+    Returns:
+        翻译计划；文本不是混合语言（没有已是目标语言的句子，或全部已是
+        目标语言）或有句子的语言无法可靠判定时返回None
+    """
+    pieces = split_sentences(text)
+    if len(pieces) < 2:
+        return None
+
+    sentences = [s for s, _ in pieces]
+    separators = [sep for _, sep in pieces]
+    labels = detector.detect_batch(sentences)
+
+    if any(0 < info.confidence < MIN_SPLIT_CONFIDENCE for info in labels):
+        logger.debug("混合语言: 有句子的语言无法可靠判定，整段翻译")
+        return None
+    # 没有可识别文字的句子（数字、符号等）原样保留
+    foreign_flags = [info.confidence > 0 and info.code != target_code for info in labels]
+
+    runs: List[Tuple[int, int]] = []
+    kept = 0
+    start: Optional[int] = None
+    for i, foreign in enumerate(foreign_flags):
+        if foreign:
+            if start is None:
+                start = i
+            continue
+        if labels[i].confidence > 0:
+            kept += 1
+        if start is not None:
+            runs.append((start, i))
+            start = None
+    if start is not None:
+        runs.append((start, len(sentences)))
+
+    if not runs or not kept:
+        return None
+
+    plan = MixedLanguagePlan(sentences, separators, runs)
+    logger.debug(f"混合语言: {len(runs)} 段需要翻译，跳过 {plan.kept_chars} 个字符")
+    return plan
+
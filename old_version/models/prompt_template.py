@@ -0,0 +1,197 @@
+"""Prompt template compilation module."""
+
+import string
+from typing import Dict, List, Optional, Tuple, Union
+
+from core.logger import get_logger
+from core.types import LanguageInfo
+
+logger = get_logger("PromptTemplate")
+
+# 模板中允许使用的占位符
+TEXT_FIELDS = ("selected_text", "text")
+LANGUAGE_FIELDS = (
+    "source_language",
+    "source_language_en",
+    "target_language",
+    "target_language_en",
+)
+ALLOWED_FIELDS = TEXT_FIELDS + LANGUAGE_FIELDS
+
+# 原文占位符在系统提示词中的替代说明
+TEXT_REFERENCE = "(The input text is provided in the user message.)"
+
+# 片段：字面文本，或 (字段名, 转换符, 格式说明)
+_Field = Tuple[str, Optional[str], str]
+_Segment = Union[str, _Field]
+
+
+class PromptTemplate:
+    """编译后的提示词模板。
+
+    将模板拆分为与原文无关的系统提示词前缀和只携带原文的用户消息，
+    使同一技能、同一语言对的请求共享完全相同的前缀，从而命中服务端的
+    前缀/KV 缓存。模板只在编译时解析和校验一次。
+    """
+
+    _formatter = string.Formatter()
+
+    def __init__(self, template: str):
+        """
+        编译提示词模板。
+
+        Args:
+            template: 原始模板字符串
+
+        Raises:
+            ValueError: 模板语法错误或包含未知占位符
+        """
+        self._template = template
+        self._segments: List[_Segment] = []
+        self._system_cache: Dict[Tuple[str, str, str, str], str] = {}
+
+        try:
+            parsed = list(self._formatter.parse(template))
+        except ValueError as e:
+            raise ValueError(f"提示词模板格式错误: {e}") from e
+
+        text_field_count = 0
+        self._uses_target_language = False
+        for literal, field_name, format_spec, conversion in parsed:
+            if literal:
+                self._segments.append(literal)
+            if field_name is None:
+                continue
+            if field_name not in ALLOWED_FIELDS:
+                raise ValueError(
+                    f"提示词模板包含未知占位符 {{{field_name}}}，"
+                    f"可用占位符: {', '.join(ALLOWED_FIELDS)}"
+                )
+            if field_name in TEXT_FIELDS:
+                text_field_count += 1
+            elif field_name.startswith("target_language"):
+                self._uses_target_language = True
+            self._segments.append((field_name, conversion, format_spec or ""))
+
+        # 原文只出现一次时才能把它拆到用户消息中，否则退回单条用户消息
+        self._splittable = text_field_count == 1
+
+    @property
+    def template(self) -> str:
+        """原始模板字符串。"""
+        return self._template
+
+    @property
+    def splittable(self) -> bool:
+        """是否可以拆分为系统前缀和用户消息。"""
+        return self._splittable
+
+    @property
+    def uses_target_language(self) -> bool:
+        """模板是否引用目标语言（即是否为翻译类提示词）。"""
+        return self._uses_target_language
+
+    def _render(self, values: Dict[str, str], text_value: str) -> str:
+        """按片段渲染模板。"""
+        parts: List[str] = []
+        for segment in self._segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+            field_name, conversion, format_spec = segment
+            if field_name in TEXT_FIELDS:
+                value = text_value
+            else:
+                value = values[field_name]
+            value = self._formatter.convert_field(value, conversion)
+            parts.append(self._formatter.format_field(value, format_spec))
+        return "".join(parts)
+
+    @staticmethod
+    def _language_values(
+        source_language: LanguageInfo,
+        target_language: LanguageInfo,
+    ) -> Dict[str, str]:
+        return {
+            "source_language": source_language.native,
+            "source_language_en": source_language.code,
+            "target_language": target_language.native,
+            "target_language_en": target_language.code,
+        }
+
+    def system_prompt(
+        self,
+        source_language: LanguageInfo,
+        target_language: LanguageInfo,
+    ) -> str:
+        """
+        获取指定语言对的系统提示词（按语言对缓存）。
+
+        Args:
+            source_language: 源语言
+            target_language: 目标语言
+
+        Returns:
+            不含原文的系统提示词
+        """
+        key = (
+            source_language.code, source_language.native,
+            target_language.code, target_language.native,
+        )
+        prompt = self._system_cache.get(key)
+        if prompt is None:
+            values = self._language_values(source_language, target_language)
+            prompt = self._render(values, TEXT_REFERENCE).strip()
+            self._system_cache[key] = prompt
+        return prompt
+
+    def build_messages(
+        self,
+        text: str,
+        source_language: LanguageInfo,
+        target_language: LanguageInfo,
+    ) -> List[dict]:
+        """
+        构建聊天消息列表。
+
+        Args:
+            text: 原文
+            source_language: 源语言
+            target_language: 目标语言
+
+        Returns:
+            OpenAI 格式的消息列表
+        """
+        if not self._splittable:
+            values = self._language_values(source_language, target_language)
+            return [{"role": "user", "content": self._render(values, text)}]
+
+        return [
+            {"role": "system", "content": self.system_prompt(source_language, target_language)},
+            {"role": "user", "content": text},
+        ]
+
+
+_compiled: Dict[str, PromptTemplate] = {}
+
+
+def compile_prompt(template: str) -> PromptTemplate:
+    """
+    编译提示词模板，相同模板只解析一次。
+
+    Args:
+        template: 原始模板字符串
+
+    Returns:
+        编译后的模板
+
+    Raises:
+        ValueError: 模板无效
+    """
+    compiled = _compiled.get(template)
+    if compiled is None:
+        compiled = PromptTemplate(template)
+        _compiled[template] = compiled
+        if not compiled.splittable:
+            logger.debug("提示词模板中原文占位符数量不为1，将使用单条用户消息")
+    return compiled
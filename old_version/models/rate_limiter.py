@@ -0,0 +1,382 @@
+"""API rate limiting module."""
+
+import re
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional, Set, Tuple
+
+from core.logger import get_logger
+
+logger = get_logger("RateLimiter")
+
+# 等待容量时的最长单次休眠（秒），用于及时响应取消请求
+_WAIT_SLICE: float = 0.1
+
+# x-ratelimit-reset-* 头部的时长格式，如 "1s", "6m0s", "20ms"
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    粗略估算文本的 token 数。
+
+    CJK 字符按每字 1 个 token 计，其余字符按每 4 个字符 1 个 token 计。
+
+    Args:
+        text: 文本
+
+    Returns:
+        估算的 token 数
+    """
+    cjk = 0
+    for ch in text:
+        if "\u3040" <= ch <= "\u9fff" or "\uac00" <= ch <= "\ud7af":
+            cjk += 1
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """
+    解析服务端返回的时长字符串。
+
+    Args:
+        value: 纯秒数（如 "2"）或复合时长（如 "1m30s"）
+
+    Returns:
+        秒数，无法解析时返回None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    matches = _DURATION_PATTERN.findall(value)
+    if not matches:
+        return None
+    return sum(float(n) * _DURATION_UNITS[unit] for n, unit in matches)
+
+
+class TokenBucket:
+    """令牌桶，容量为每分钟限额，按限额/60 的速率持续补充。"""
+
+    def __init__(self, per_minute: int = 0):
+        """
+        初始化令牌桶。
+
+        Args:
+            per_minute: 每分钟限额，0表示不限制
+        """
+        self._capacity = float(per_minute)
+        self._tokens = float(per_minute)
+        self._last = time.monotonic()
+
+    @property
+    def limited(self) -> bool:
+        """是否启用限制。"""
+        return self._capacity > 0
+
+    @property
+    def capacity(self) -> float:
+        """桶容量（每分钟限额）。"""
+        return self._capacity
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last
+        self._last = now
+        if self.limited and elapsed > 0:
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._capacity / 60.0)
+
+    def set_capacity(self, per_minute: int) -> None:
+        """调整每分钟限额，保留已用比例。"""
+        now = time.monotonic()
+        self._refill(now)
+        if per_minute <= 0:
+            self._capacity = 0.0
+            return
+        if self.limited:
+            self._tokens = self._tokens * per_minute / self._capacity
+        else:
+            self._tokens = float(per_minute)
+        self._capacity = float(per_minute)
+
+    def set_remaining(self, remaining: float) -> None:
+        """以服务端报告的剩余额度校准当前令牌数。"""
+        self._refill(time.monotonic())
+        if self.limited:
+            self._tokens = min(self._tokens, max(0.0, remaining))
+
+    def wait_time(self, amount: float) -> float:
+        """获取满足指定数量所需的等待时间（秒），0表示可立即放行。"""
+        if not self.limited:
+            return 0.0
+        self._refill(time.monotonic())
+        # 单次请求超过桶容量时只要求桶满，避免永远无法放行
+        amount = min(amount, self._capacity)
+        if self._tokens >= amount:
+            return 0.0
+        return (amount - self._tokens) * 60.0 / self._capacity
+
+    def consume(self, amount: float) -> None:
+        """扣除令牌（允许透支，透支部分由后续补充抵消）。"""
+        if self.limited:
+            self._refill(time.monotonic())
+            self._tokens -= amount
+
+    def refund(self, amount: float) -> None:
+        """退回多扣的令牌。"""
+        if self.limited:
+            self._tokens = min(self._capacity, self._tokens + amount)
+
+
+class RateLimiter:
+    """单个API凭据的限流器。
+
+    同时跟踪每分钟请求数和每分钟 token 数，请求按到达顺序排队，
+    容量不足时阻塞等待。服务端返回的限流头部会用于校准限额。
+    """
+
+    def __init__(self, name: str, rpm: int = 0, tpm: int = 0):
+        """
+        初始化限流器。
+
+        Args:
+            name: 名称（用于日志）
+            rpm: 每分钟请求数限额，0表示未知/不限制
+            tpm: 每分钟 token 数限额，0表示未知/不限制
+        """
+        self._name = name
+        self._requests = TokenBucket(rpm)
+        self._tokens = TokenBucket(tpm)
+        self._blocked_until = 0.0
+        self._condition = threading.Condition()
+        self._next_ticket = 0
+        self._serving = 0
+        self._skipped: Set[int] = set()
+        self._in_flight = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def in_flight(self) -> int:
+        """当前已放行但未完成的请求数。"""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """当前排队等待的请求数。"""
+        return self._next_ticket - self._serving - len(self._skipped)
+
+    def configure(self, rpm: int = 0, tpm: int = 0) -> None:
+        """更新用户配置的限额（0表示保持自动校准值）。"""
+        with self._condition:
+            if rpm > 0:
+                self._requests.set_capacity(rpm)
+            if tpm > 0:
+                self._tokens.set_capacity(tpm)
+            self._condition.notify_all()
+
+    def _wait_time(self, tokens: int) -> float:
+        now = time.monotonic()
+        return max(
+            self._blocked_until - now,
+            self._requests.wait_time(1),
+            self._tokens.wait_time(tokens),
+        )
+
+    def estimated_wait(self, tokens: int) -> float:
+        """
+        估算获取额度所需的等待时间（不含排队中的其他请求）。
+
+        Args:
+            tokens: 预计消耗的 token 数
+
+        Returns:
+            等待秒数，0表示可立即放行
+        """
+        with self._condition:
+            return max(0.0, self._wait_time(tokens))
+
+    def try_acquire(self, tokens: int) -> bool:
+        """
+        不排队地尝试立即获取额度。
+
+        Args:
+            tokens: 预计消耗的 token 数
+
+        Returns:
+            是否获取成功
+        """
+        with self._condition:
+            if self._next_ticket != self._serving or self._wait_time(tokens) > 0:
+                return False
+            self._requests.consume(1)
+            self._tokens.consume(tokens)
+            self._in_flight += 1
+            return True
+
+    def acquire(
+        self,
+        tokens: int,
+        should_cancel: Optional[Callable[[], bool]] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        排队获取一次请求的额度，容量不足时阻塞等待。
+
+        Args:
+            tokens: 预计消耗的 token 数
+            should_cancel: 返回True时放弃等待
+            timeout: 最长等待时间（秒），None表示不限
+
+        Returns:
+            是否获取成功（取消或超时返回False）
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            if ticket != self._serving or self._wait_time(tokens) > 0:
+                logger.debug(f"[{self._name}] 等待限流额度，排队中: {self.queued}")
+            try:
+                while True:
+                    if should_cancel and should_cancel():
+                        return False
+                    if ticket == self._serving:
+                        wait = self._wait_time(tokens)
+                        if wait <= 0:
+                            break
+                    else:
+                        wait = _WAIT_SLICE
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        wait = min(wait, remaining)
+                    self._condition.wait(min(wait, _WAIT_SLICE))
+
+                self._requests.consume(1)
+                self._tokens.consume(tokens)
+                self._in_flight += 1
+                return True
+            finally:
+                # 无论成功与否都让出排队位置；中途放弃的号码轮到时直接跳过
+                if ticket == self._serving:
+                    self._serving += 1
+                    while self._serving in self._skipped:
+                        self._skipped.discard(self._serving)
+                        self._serving += 1
+                else:
+                    self._skipped.add(ticket)
+                self._condition.notify_all()
+
+    def release(self, estimated_tokens: int = 0, actual_tokens: Optional[int] = None) -> None:
+        """
+        请求完成后释放，并按实际 token 用量校正预估。
+
+        Args:
+            estimated_tokens: 获取额度时的预估值
+            actual_tokens: 实际用量，None表示无法得知
+        """
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            if actual_tokens is not None:
+                diff = estimated_tokens - actual_tokens
+                if diff > 0:
+                    self._tokens.refund(diff)
+                elif diff < 0:
+                    self._tokens.consume(-diff)
+            self._condition.notify_all()
+
+    def block_for(self, seconds: float) -> None:
+        """在指定时间内暂停放行（如收到429）。"""
+        with self._condition:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._condition.notify_all()
+        logger.warning(f"[{self._name}] 触发服务端限流，暂停 {seconds:.1f} 秒")
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        根据服务端返回的限流头部自校准。
+
+        Args:
+            headers: HTTP响应头（键不区分大小写）
+        """
+        def header(name: str) -> Optional[str]:
+            value = headers.get(name)
+            return value if value not in (None, "") else None
+
+        def to_int(value: Optional[str]) -> Optional[int]:
+            try:
+                return int(float(value)) if value is not None else None
+            except ValueError:
+                return None
+
+        limit_requests = to_int(header("x-ratelimit-limit-requests"))
+        limit_tokens = to_int(header("x-ratelimit-limit-tokens"))
+        remaining_requests = to_int(header("x-ratelimit-remaining-requests"))
+        remaining_tokens = to_int(header("x-ratelimit-remaining-tokens"))
+        retry_after = parse_duration(header("retry-after-ms"))
+        if retry_after is not None:
+            retry_after /= 1000.0
+        else:
+            retry_after = parse_duration(header("retry-after"))
+
+        with self._condition:
+            if limit_requests and limit_requests != int(self._requests.capacity):
+                self._requests.set_capacity(limit_requests)
+                logger.info(f"[{self._name}] 校准请求限额: {limit_requests}/min")
+            if limit_tokens and limit_tokens != int(self._tokens.capacity):
+                self._tokens.set_capacity(limit_tokens)
+                logger.info(f"[{self._name}] 校准token限额: {limit_tokens}/min")
+            if remaining_requests is not None:
+                self._requests.set_remaining(remaining_requests)
+            if remaining_tokens is not None:
+                self._tokens.set_remaining(remaining_tokens)
+            if remaining_requests == 0 or remaining_tokens == 0:
+                reset = max(
+                    parse_duration(header("x-ratelimit-reset-requests")) or 0.0,
+                    parse_duration(header("x-ratelimit-reset-tokens")) or 0.0,
+                )
+                if reset > 0:
+                    self._blocked_until = max(self._blocked_until, time.monotonic() + reset)
+            self._condition.notify_all()
+
+        if retry_after:
+            self.block_for(retry_after)
+
+
+class RateLimiterRegistry:
+    """限流器注册表，按API凭据维护限流器实例。"""
+
+    def __init__(self):
+        self._limiters: Dict[Tuple[str, str], RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, base_url: str, api_key: str, rpm: int = 0, tpm: int = 0) -> RateLimiter:
+        """
+        获取（必要时创建）指定凭据的限流器。
+
+        Args:
+            name: 配置名称（用于日志）
+            base_url: API基础URL
+            api_key: API密钥
+            rpm: 用户配置的每分钟请求数限额
+            tpm: 用户配置的每分钟 token 数限额
+
+        Returns:
+            限流器实例
+        """
+        key = (base_url.rstrip("/"), api_key)
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = RateLimiter(name, rpm, tpm)
+                self._limiters[key] = limiter
+            else:
+                limiter.configure(rpm, tpm)
+            return limiter
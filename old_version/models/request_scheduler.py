@@ -0,0 +1,175 @@
+"""Priority request scheduling module."""
+
+import threading
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional
+
+from core.logger import get_logger
+
+logger = get_logger("RequestScheduler")
+
+# 等待调度时的最长单次休眠（秒），用于及时响应取消请求
+_WAIT_SLICE: float = 0.1
+
+
+class Priority(IntEnum):
+    """请求优先级，数值越小优先级越高。"""
+    INTERACTIVE = 0   # 热键触发的交互式翻译
+    SPECULATIVE = 1   # 预测性的预翻译
+    BACKGROUND = 2    # 批量任务、缓存刷新等后台工作
+
+
+# 各优先级的默认并发上限
+DEFAULT_CLASS_LIMITS: Dict[Priority, int] = {
+    Priority.INTERACTIVE: 2,
+    Priority.SPECULATIVE: 1,
+    Priority.BACKGROUND: 2,
+}
+
+
+class SchedulerSlot:
+    """一个已获准执行的请求占用的连接槽位。"""
+
+    def __init__(self, priority: Priority, on_preempt: Optional[Callable[[], None]]):
+        self.priority = priority
+        self.preempted = False
+        self._on_preempt = on_preempt
+
+    def preempt(self) -> bool:
+        """请求该槽位的持有者让出（仅能抢占一次）。"""
+        if self.preempted or self._on_preempt is None:
+            return False
+        self.preempted = True
+        try:
+            self._on_preempt()
+        except Exception as e:
+            logger.error(f"抢占回调出错: {e}")
+        return True
+
+
+class RequestScheduler:
+    """请求调度器。
+
+    按优先级分配有限的连接槽位：高优先级有请求在等待时低优先级不会被放行，
+    每个优先级有独立的并发上限，并为交互式请求预留槽位。槽位已满时，
+    交互式请求会抢占正在执行的最低优先级请求。
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        interactive_reserve: int = 1,
+        class_limits: Optional[Dict[Priority, int]] = None,
+    ):
+        """
+        初始化调度器。
+
+        Args:
+            max_concurrency: 总并发上限
+            interactive_reserve: 为交互式请求预留的槽位数
+            class_limits: 各优先级的并发上限
+        """
+        self._max_concurrency = max_concurrency
+        self._interactive_reserve = interactive_reserve
+        self._class_limits = dict(DEFAULT_CLASS_LIMITS)
+        if class_limits:
+            self._class_limits.update(class_limits)
+        self._condition = threading.Condition()
+        self._running: List[SchedulerSlot] = []
+        self._waiting: Dict[Priority, int] = {p: 0 for p in Priority}
+
+    def _running_count(self, priority: Optional[Priority] = None) -> int:
+        if priority is None:
+            return len(self._running)
+        return sum(1 for s in self._running if s.priority == priority)
+
+    def _can_admit(self, priority: Priority) -> bool:
+        if any(self._waiting[p] for p in Priority if p < priority):
+            return False
+        if self._running_count(priority) >= self._class_limits.get(priority, 1):
+            return False
+        capacity = self._max_concurrency
+        if priority != Priority.INTERACTIVE:
+            capacity -= self._interactive_reserve
+        return self._running_count() < capacity
+
+    def _preempt_lower(self, priority: Priority) -> None:
+        """抢占一个优先级更低的运行中请求（只在腾出槽位后本级别即可放行时）。"""
+        if self._running_count() < self._max_concurrency:
+            return
+        if self._running_count(priority) >= self._class_limits.get(priority, 1):
+            # 本级别已达并发上限，抢占也无法放行，只会白白中断别的请求
+            return
+        if any(s.preempted for s in self._running):
+            # 已有被抢占的请求正在退出，等它释放槽位，不再多中断一个
+            return
+        candidates = [
+            s for s in self._running
+            if s.priority > priority and not s.preempted
+        ]
+        if not candidates:
+            return
+        victim = max(candidates, key=lambda s: s.priority)
+        if victim.preempt():
+            logger.info(f"{priority.name} 请求抢占了 {victim.priority.name} 请求")
+
+    def has_waiting(self, above: Priority) -> bool:
+        """是否有优先级高于指定级别的请求在等待。"""
+        with self._condition:
+            return any(self._waiting[p] for p in Priority if p < above)
+
+    def acquire(
+        self,
+        priority: Priority,
+        should_cancel: Optional[Callable[[], bool]] = None,
+        on_preempt: Optional[Callable[[], None]] = None,
+    ) -> Optional[SchedulerSlot]:
+        """
+        等待并获取一个连接槽位。
+
+        Args:
+            priority: 请求优先级
+            should_cancel: 返回True时放弃等待
+            on_preempt: 被更高优先级请求抢占时的回调
+
+        Returns:
+            槽位，取消时返回None
+        """
+        with self._condition:
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    if should_cancel and should_cancel():
+                        return None
+                    if self._can_admit(priority):
+                        break
+                    if priority == Priority.INTERACTIVE:
+                        self._preempt_lower(priority)
+                    self._condition.wait(_WAIT_SLICE)
+
+                slot = SchedulerSlot(priority, on_preempt)
+                self._running.append(slot)
+                return slot
+            finally:
+                self._waiting[priority] -= 1
+                self._condition.notify_all()
+
+    def promote(self, slot: SchedulerSlot, priority: Priority) -> None:
+        """
+        提升运行中槽位的优先级（如交互式请求接管了预翻译）。
+
+        Args:
+            slot: 槽位
+            priority: 新的优先级，不低于原优先级时才生效
+        """
+        with self._condition:
+            if priority < slot.priority:
+                slot.priority = priority
+            self._condition.notify_all()
+
+    def release(self, slot: SchedulerSlot) -> None:
+        """释放槽位。"""
+        with self._condition:
+            if slot in self._running:
+                self._running.remove(slot)
+            self._condition.notify_all()
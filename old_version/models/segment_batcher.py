@@ -0,0 +1,133 @@
+"""Segment batching module."""
+
+import json
+from typing import List, Optional, Tuple
+
+from core.logger import get_logger
+
+logger = get_logger("SegmentBatcher")
+
+# 不超过该长度的片段参与合并
+SHORT_SEGMENT_CHARS: int = 300
+# 单个批次的原文总长度上限
+MAX_BATCH_CHARS: int = 3000
+# 单个批次的片段数上限
+MAX_BATCH_SEGMENTS: int = 40
+
+# 批量模式的附加系统指令（紧跟在技能系统提示词之后，不影响其前缀缓存）
+BATCH_INSTRUCTION = (
+    "Batch mode: the user message is a JSON object of the form "
+    '{"segments": [{"id": <int>, "text": "<source>"}, ...]}. '
+    "Translate every segment independently, applying all requirements above to each text. "
+    "Optional \"before\"/\"after\" fields hold neighbouring source text for context only; "
+    "do not translate or include them. "
+    "Respond with ONLY a JSON object of the form "
+    '{"translations": [{"id": <int>, "text": "<translation>"}, ...]} '
+    "containing every id exactly once, with no code fences and no extra commentary."
+)
+
+
+def plan_batches(segments: List[str]) -> List[List[int]]:
+    """
+    将片段分组为批次。
+
+    短片段按顺序合并，直到达到长度或数量上限；长片段单独成组。
+
+    Args:
+        segments: 片段列表
+
+    Returns:
+        每个批次包含的片段下标
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_chars = 0
+
+    for i, segment in enumerate(segments):
+        size = len(segment)
+        if size > SHORT_SEGMENT_CHARS:
+            batches.append([i])
+            continue
+        if current and (
+            current_chars + size > MAX_BATCH_CHARS
+            or len(current) >= MAX_BATCH_SEGMENTS
+        ):
+            batches.append(current)
+            current, current_chars = [], 0
+        current.append(i)
+        current_chars += size
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def pack_batch(
+    segments: List[str],
+    contexts: Optional[List[Tuple[str, str]]] = None,
+) -> str:
+    """
+    将片段打包为批量请求的用户消息。
+
+    Args:
+        segments: 片段列表
+        contexts: 每个片段的 (前文, 后文) 上下文，仅供参考不翻译
+
+    Returns:
+        JSON 字符串
+    """
+    items = []
+    for i, text in enumerate(segments):
+        item = {"id": i, "text": text}
+        if contexts:
+            before, after = contexts[i]
+            if before:
+                item["before"] = before
+            if after:
+                item["after"] = after
+        items.append(item)
+    return json.dumps({"segments": items}, ensure_ascii=False)
+
+
+def parse_batch_response(content: str, count: int) -> Optional[List[str]]:
+    """
+    解析批量请求的回复。
+
+    Args:
+        content: 模型回复
+        count: 批次中的片段数
+
+    Returns:
+        按片段顺序排列的译文，格式错误或片段缺失时返回None
+    """
+    start = content.find("{")
+    end = content.rfind("}")
+    if start < 0 or end <= start:
+        return None
+    try:
+        data = json.loads(content[start:end + 1])
+    except ValueError:
+        return None
+
+    items = data.get("translations") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        return None
+
+    results: List[Optional[str]] = [None] * count
+    for item in items:
+        if not isinstance(item, dict):
+            return None
+        seg_id, text = item.get("id"), item.get("text")
+        if isinstance(seg_id, str) and seg_id.isdigit():
+            seg_id = int(seg_id)
+        if not isinstance(seg_id, int) or not 0 <= seg_id < count or not isinstance(text, str):
+            return None
+        if results[seg_id] is not None:
+            return None
+        results[seg_id] = text
+
+    if any(r is None for r in results):
+        missing = sum(1 for r in results if r is None)
+        logger.warning(f"批量回复缺少 {missing}/{count} 个片段")
+        return None
+    return results
@@ -1,6 +1,6 @@
 """Translation service module."""
 
-from typing import Optional, Callable
+from typing import Optional, Callable, List, Set, Tuple
 from PyQt5.QtCore import QThread, pyqtSignal
 
 import openai
@@ -8,9 +8,19 @@ import openai
 from core.logger import get_logger
 from core.types import TranslationRequest, TranslationResult
 from models.cache_manager import CacheManager
+from models.prompt_template import PromptTemplate, compile_prompt
+from models.key_pool import APIKeyPool, APIKeyPoolRegistry
+from models.rate_limiter import estimate_tokens
+from models.request_scheduler import Priority, RequestScheduler, SchedulerSlot
+from models.segment_batcher import (
+    BATCH_INSTRUCTION, pack_batch, parse_batch_response, plan_batches,
+)
 
 logger = get_logger("TranslationService")
 
+# 收到429或认证失败后的最大重试次数
+MAX_RATE_LIMIT_RETRIES: int = 3
+
 
 class TranslationWorker(QThread):
     """翻译工作线程。"""
@@ -22,13 +32,114 @@ class TranslationWorker(QThread):
         self,
         request: TranslationRequest,
         cache: Optional[CacheManager] = None,
+        key_pool: Optional[APIKeyPool] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        priority: Priority = Priority.INTERACTIVE,
     ):
         super().__init__()
         self._request = request
         self._cache = cache
+        self._key_pool = key_pool
+        self._scheduler = scheduler
+        self._priority = priority
+        self._slot: Optional[SchedulerSlot] = None
+    
+    @property
+    def request(self) -> TranslationRequest:
+        return self._request
+    
+    @property
+    def priority(self) -> Priority:
+        return self._priority
     
     def run(self) -> None:
         """执行翻译任务。"""
+        try:
+            self._translate()
+        finally:
+            self.release_slot()
+    
+    def promote(self, priority: Priority) -> None:
+        """
+        提升请求优先级（交互式请求接管预翻译时调用）。
+        
+        已获取的槽位随之提升，不再被更低优先级的抢占打断。
+        
+        Args:
+            priority: 新的优先级
+        """
+        if priority >= self._priority:
+            return
+        self._priority = priority
+        slot = self._slot
+        if slot and self._scheduler:
+            self._scheduler.promote(slot, priority)
+    
+    def release_slot(self) -> None:
+        """释放调度槽位（可重复调用）。"""
+        slot, self._slot = self._slot, None
+        if slot and self._scheduler:
+            self._scheduler.release(slot)
+    
+    def _on_preempted(self) -> None:
+        """被更高优先级请求抢占时中断自身。"""
+        logger.info(f"{self._priority.name} 翻译被抢占，稍后重新执行")
+        self.requestInterruption()
+    
+    def _stop_if_interrupted(self) -> bool:
+        """检查中断请求；被抢占时通知调用方以便重新提交。"""
+        if not self.isInterruptionRequested():
+            return False
+        if self._slot and self._slot.preempted:
+            self.finished_signal.emit(TranslationResult(
+                success=False,
+                content="",
+                error="preempted",
+                preempted=True,
+            ))
+        return True
+    
+    def _fail(self, error: str) -> None:
+        """发送错误结果。"""
+        self.result_ready.emit(f"@An error occurred:{error}\n ")
+        self.finished_signal.emit(TranslationResult(
+            success=False,
+            content="",
+            error=error,
+        ))
+    
+    def _prepare(self) -> Optional[Tuple[str, PromptTemplate]]:
+        """
+        校验API配置并编译提示词模板。
+        
+        Returns:
+            (base_url, 编译后的模板) 元组，校验失败时发送错误并返回None
+        """
+        # 验证API配置
+        if not self._request.api_key:
+            self._fail("API密钥未设置，请在设置中配置API。")
+            return None
+        
+        if not self._request.base_url:
+            self._fail("API基础URL未设置，请在设置中配置。")
+            return None
+        
+        # 确保base_url以斜杠结尾
+        base_url = self._request.base_url
+        if not base_url.endswith('/'):
+            base_url += '/'
+        
+        # 编译后的模板按语言对缓存系统提示词，用户消息只携带原文，
+        # 使重复请求共享相同前缀以命中服务端缓存
+        try:
+            prompt = compile_prompt(self._request.prompt_template)
+        except ValueError as e:
+            self._fail(str(e))
+            return None
+        
+        return base_url, prompt
+    
+    def _translate(self) -> None:
         try:
             # 检查是否被请求中断
             if self.isInterruptionRequested():
@@ -46,131 +157,418 @@ class TranslationWorker(QThread):
                     ))
                     return
             
-            # 验证API配置
-            if not self._request.api_key:
-                error = "API密钥未设置，请在设置中配置API。"
-                self.result_ready.emit(f"@An error occurred:{error}\n ")
-                self.finished_signal.emit(TranslationResult(
-                    success=False,
-                    content="",
-                    error=error,
-                ))
+            prepared = self._prepare()
+            if prepared is None:
                 return
+            base_url, prompt = prepared
+            messages = prompt.build_messages(
+                self._request.text,
+                self._request.source_language,
+                self._request.target_language,
+            )
             
-            if not self._request.base_url:
-                error = "API基础URL未设置，请在设置中配置。"
-                self.result_ready.emit(f"@An error occurred:{error}\n ")
-                self.finished_signal.emit(TranslationResult(
-                    success=False,
-                    content="",
-                    error=error,
-                ))
+            # 按优先级获取连接槽位
+            if not self._acquire_slot():
                 return
             
-            # 确保base_url以斜杠结尾
-            base_url = self._request.base_url
-            if not base_url.endswith('/'):
-                base_url += '/'
-            
-            # 格式化提示词（同时提供 text 和 selected_text 以兼容不同模板）
-            prompt = self._request.prompt_template.format(
-                text=self._request.text,
-                selected_text=self._request.text,
-                source_language=self._request.source_language.native,
-                source_language_en=self._request.source_language.code,
-                target_language=self._request.target_language.native,
-                target_language_en=self._request.target_language.code,
+            response_content = self._stream_completion(
+                base_url,
+                messages,
+                estimate_tokens(self._request.text),
+                on_text=self.result_ready.emit,
             )
+            if response_content is None:
+                return
             
-            # 创建 OpenAI 客户端并请求API
-            client = openai.OpenAI(api_key=self._request.api_key, base_url=base_url)
-            completion_stream = client.chat.completions.create(
-                model=self._request.model,
-                messages=[{"role": "user", "content": prompt}],
-                stream=True,
-            )
+            # 发送最终结果
+            logger.info(f"翻译完成，共 {len(response_content)} 字符")
+            self.result_ready.emit(response_content)
             
-            response_content = ""
-            chunk_count = 0
+            # 保存到缓存
+            if self._cache:
+                self._cache.set(self._request.text, response_content)
             
+            self.finished_signal.emit(TranslationResult(
+                success=True,
+                content=response_content,
+            ))
+            
+        except Exception as e:
+            # 只有在非主动中断的情况下才报错
+            if not self._stop_if_interrupted():
+                logger.error(f"翻译错误: {e}")
+                self._fail(str(e))
+
+    def _acquire_slot(self) -> bool:
+        """按优先级获取连接槽位，被取消时返回False。"""
+        if not self._scheduler:
+            return True
+        priority = self._priority
+        self._slot = self._scheduler.acquire(
+            priority,
+            should_cancel=self.isInterruptionRequested,
+            on_preempt=self._on_preempted,
+        )
+        # 等待期间被接管提升了优先级
+        if self._slot and self._priority < priority:
+            self._scheduler.promote(self._slot, self._priority)
+        return self._slot is not None
+    
+    def _stream_completion(
+        self,
+        base_url: str,
+        messages: list,
+        expected_output_tokens: int,
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> Optional[str]:
+        """
+        发起流式请求并收集完整回复。
+        
+        Args:
+            base_url: API基础URL
+            messages: 消息列表
+            expected_output_tokens: 预计输出 token 数（用于限流预估）
+            on_text: 中间结果回调
+            
+        Returns:
+            完整回复内容，被中断时返回None
+        """
+        # 由密钥池分配密钥并排队获取限流额度后请求API
+        prompt_tokens = sum(estimate_tokens(m["content"]) for m in messages)
+        estimated_tokens = prompt_tokens + expected_output_tokens
+        opened = self._open_stream(base_url, messages, estimated_tokens)
+        if opened is None:
+            self._stop_if_interrupted()
+            return None
+        completion_stream, lease = opened
+        
+        response_content = ""
+        chunk_count = 0
+        
+        try:
             for chunk in completion_stream:
                 # 检查是否被请求中断
-                if self.isInterruptionRequested():
+                if self._stop_if_interrupted():
                     logger.info("翻译线程收到中断请求，正在停止...")
-                    return
+                    return None
                 
                 try:
                     content = chunk.choices[0].delta.content or ""
                     response_content += content
                     
                     # 控制发送频率，前3次每次都发，之后每3次发一次
-                    if chunk_count < 3 or chunk_count % 3 == 0:
-                        self.result_ready.emit(response_content)
+                    if on_text and (chunk_count < 3 or chunk_count % 3 == 0):
+                        on_text(response_content)
                     chunk_count += 1
                 except Exception as e:
                     logger.error(f"处理chunk时出错: {e}")
+        finally:
+            if lease:
+                lease.release(prompt_tokens + estimate_tokens(response_content))
+        
+        return response_content
+    
+    def _open_stream(self, base_url: str, messages: list, estimated_tokens: int):
+        """
+        从密钥池获取密钥并发起流式请求。
+        
+        遇到429时按服务端提示暂停该密钥并重新分配，认证失败的密钥会被
+        移出轮换后改用其他密钥重试。
+        
+        Returns:
+            (流式响应, 密钥租约) 元组，被中断时返回None
+        """
+        pool = self._key_pool
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            if pool:
+                # 低优先级请求不进入限流队列，保证交互式请求优先使用额度
+                lease = pool.acquire(
+                    estimated_tokens,
+                    should_cancel=self.isInterruptionRequested,
+                    queue=self._priority == Priority.INTERACTIVE,
+                )
+                if lease is None:
+                    return None
+                api_key = lease.key
+            else:
+                lease = None
+                api_key = self._request.api_key
             
-            # 发送最终结果
-            logger.info(f"翻译完成，共 {len(response_content)} 字符")
-            self.result_ready.emit(response_content)
+            # 429 由限流器统一排队重试，关闭客户端自带的重试
+            client = openai.OpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+            try:
+                raw = client.chat.completions.with_raw_response.create(
+                    model=self._request.model,
+                    messages=messages,
+                    stream=True,
+                )
+            except openai.RateLimitError as e:
+                if not lease:
+                    raise
+                lease.release(0)
+                pool.report_rate_limited(lease, quota_exhausted=e.code == "insufficient_quota")
+                if attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                headers = e.response.headers if e.response is not None else {}
+                lease.limiter.update_from_headers(headers)
+                if not headers.get("retry-after") and not headers.get("retry-after-ms"):
+                    lease.limiter.block_for(2.0 ** attempt)
+                logger.warning(f"请求被限流，第 {attempt + 1} 次重新排队")
+                continue
+            except (openai.AuthenticationError, openai.PermissionDeniedError):
+                if not lease:
+                    raise
+                lease.release(0)
+                pool.report_auth_failure(lease)
+                if attempt == MAX_RATE_LIMIT_RETRIES or pool.active_count == 0:
+                    raise
+                continue
+            except Exception:
+                if lease:
+                    lease.release(0)
+                raise
             
-            # 保存到缓存
-            if self._cache:
-                self._cache.set(self._request.text, response_content)
+            if lease:
+                lease.limiter.update_from_headers(raw.headers)
+                pool.report_success(lease)
+            try:
+                return raw.parse(), lease
+            except Exception:
+                if lease:
+                    lease.release(0)
+                raise
+        return None
+
+
+class BatchTranslationWorker(TranslationWorker):
+    """批量翻译工作线程。
+    
+    将多个短片段合并为一次请求（JSON 格式输入输出），解析回复后按片段
+    拆分；回复缺少片段或格式错误时回退为逐段请求。每个片段单独写入缓存。
+    """
+    
+    def __init__(
+        self,
+        request: TranslationRequest,
+        segments: List[str],
+        cache: Optional[CacheManager] = None,
+        key_pool: Optional[APIKeyPool] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        priority: Priority = Priority.BACKGROUND,
+        contexts: Optional[List[Tuple[str, str]]] = None,
+    ):
+        super().__init__(request, cache, key_pool, scheduler, priority)
+        self._segments = list(segments)
+        self._contexts = list(contexts) if contexts else None
+    
+    @property
+    def segments(self) -> List[str]:
+        return self._segments
+    
+    def _translate_one(self, base_url: str, prompt: PromptTemplate, text: str) -> Optional[str]:
+        """逐段请求单个片段。"""
+        messages = prompt.build_messages(
+            text,
+            self._request.source_language,
+            self._request.target_language,
+        )
+        return self._stream_completion(base_url, messages, estimate_tokens(text))
+    
+    def _translate_batch(
+        self,
+        base_url: str,
+        prompt: PromptTemplate,
+        texts: List[str],
+        contexts: Optional[List[Tuple[str, str]]] = None,
+    ) -> Optional[List[str]]:
+        """
+        合并请求一个批次。
+        
+        Returns:
+            各片段译文；被中断时返回None
+        """
+        # 携带上下文的单个片段也走批量格式，以便模型区分上下文和正文
+        if (len(texts) > 1 or contexts) and prompt.splittable:
+            messages = [
+                {"role": "system", "content": prompt.system_prompt(
+                    self._request.source_language,
+                    self._request.target_language,
+                )},
+                {"role": "system", "content": BATCH_INSTRUCTION},
+                {"role": "user", "content": pack_batch(texts, contexts)},
+            ]
+            content = self._stream_completion(
+                base_url,
+                messages,
+                sum(estimate_tokens(t) for t in texts),
+            )
+            if content is None:
+                return None
+            parsed = parse_batch_response(content, len(texts))
+            if parsed is not None:
+                return parsed
+            logger.warning(f"批量回复解析失败，回退为逐段请求 ({len(texts)} 段)")
+        
+        results = []
+        for text in texts:
+            translated = self._translate_one(base_url, prompt, text)
+            if translated is None:
+                return None
+            results.append(translated)
+        return results
+    
+    def _translate(self) -> None:
+        try:
+            if self.isInterruptionRequested():
+                return
+            
+            segment_results: List[Optional[TranslationResult]] = [None] * len(self._segments)
+            pending: List[int] = []
             
+            # 先查缓存（批量任务没有重复请求的冷却需求）
+            for i, text in enumerate(self._segments):
+                cached = self._cache.get(text, min_gap=0) if self._cache else None
+                if cached:
+                    segment_results[i] = TranslationResult(success=True, content=cached, from_cache=True)
+                elif text.strip():
+                    pending.append(i)
+                else:
+                    segment_results[i] = TranslationResult(success=True, content=text)
+            
+            if pending:
+                prepared = self._prepare()
+                if prepared is None:
+                    return
+                base_url, prompt = prepared
+                
+                if not self._acquire_slot():
+                    return
+                
+                texts = [self._segments[i] for i in pending]
+                for batch in plan_batches(texts):
+                    batch_texts = [texts[j] for j in batch]
+                    batch_contexts = None
+                    if self._contexts:
+                        batch_contexts = [self._contexts[pending[j]] for j in batch]
+                    translated = self._translate_batch(base_url, prompt, batch_texts, batch_contexts)
+                    if translated is None:
+                        return
+                    for j, content in zip(batch, translated):
+                        index = pending[j]
+                        segment_results[index] = TranslationResult(success=True, content=content)
+                        if self._cache:
+                            self._cache.set(self._segments[index], content)
+                
+                logger.info(f"批量翻译完成: {len(pending)} 段，{len(self._segments) - len(pending)} 段来自缓存")
+            
+            content = "\n\n".join(r.content for r in segment_results)
+            self.result_ready.emit(content)
             self.finished_signal.emit(TranslationResult(
                 success=True,
-                content=response_content,
+                content=content,
+                from_cache=not pending,
+                segments=segment_results,
             ))
             
         except Exception as e:
-            # 只有在非主动中断的情况下才报错
-            if not self.isInterruptionRequested():
-                error_msg = str(e)
-                logger.error(f"翻译错误: {error_msg}")
-                self.result_ready.emit(f"@An error occurred:{error_msg}\n ")
-                self.finished_signal.emit(TranslationResult(
-                    success=False,
-                    content="",
-                    error=error_msg,
-                ))
+            if not self._stop_if_interrupted():
+                logger.error(f"批量翻译错误: {e}")
+                self._fail(str(e))
 
 
 class TranslationService:
-    """翻译服务，管理翻译任务的生命周期。"""
+    """翻译服务，管理翻译任务的生命周期。
+    
+    交互式翻译同一时间只保留一个（新请求取消旧请求）；后台任务通过
+    submit() 提交，由调度器按优先级分配连接槽位和限流额度。
+    """
     
-    def __init__(self, cache: Optional[CacheManager] = None):
+    def __init__(
+        self,
+        cache: Optional[CacheManager] = None,
+        scheduler: Optional[RequestScheduler] = None,
+    ):
         """
         初始化翻译服务。
         
         Args:
             cache: 缓存管理器实例
+            scheduler: 请求调度器实例
         """
         self._cache = cache
+        self._key_pools = APIKeyPoolRegistry()
+        self._scheduler = scheduler or RequestScheduler()
         self._current_worker: Optional[TranslationWorker] = None
+        self._background_workers: Set[TranslationWorker] = set()
+        
+        # 预翻译状态
+        self._speculative_worker: Optional[TranslationWorker] = None
+        self._speculative_key: Optional[tuple] = None
+        self._speculative_partial = ""
+        self._speculative_result: Optional[TranslationResult] = None
+    
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """请求调度器。"""
+        return self._scheduler
+    
+    def _create_worker(
+        self,
+        request: TranslationRequest,
+        priority: Priority,
+        segments: Optional[List[str]] = None,
+        contexts: Optional[List[Tuple[str, str]]] = None,
+    ) -> TranslationWorker:
+        """创建工作线程（同一API配置共享密钥池和限流器）。"""
+        key_pool = None
+        api_keys = request.api_keys
+        if api_keys and request.base_url:
+            key_pool = self._key_pools.get(
+                request.api_name or request.base_url,
+                request.base_url,
+                api_keys,
+                rpm=request.rpm_limit,
+                tpm=request.tpm_limit,
+            )
+        if segments is not None:
+            return BatchTranslationWorker(
+                request, segments, self._cache, key_pool, self._scheduler, priority, contexts,
+            )
+        return TranslationWorker(request, self._cache, key_pool, self._scheduler, priority)
     
     def translate(
         self,
         request: TranslationRequest,
         on_progress: Optional[Callable[[str], None]] = None,
         on_complete: Optional[Callable[[TranslationResult], None]] = None,
-    ) -> TranslationWorker:
+        segments: Optional[List[str]] = None,
+        contexts: Optional[List[Tuple[str, str]]] = None,
+    ) -> Optional[TranslationWorker]:
         """
-        开始翻译任务。
+        开始交互式翻译任务。
         
         Args:
             request: 翻译请求
             on_progress: 进度回调，接收中间翻译结果
             on_complete: 完成回调，接收最终翻译结果
+            segments: 提供时只翻译这些片段（见 BatchTranslationWorker）
+            contexts: 各片段的 (前文, 后文) 上下文
             
         Returns:
-            翻译工作线程
+            翻译工作线程（复用已完成的预翻译结果时返回None）
         """
         # 取消之前的翻译
         self.cancel()
         
-        # 创建新的工作线程
-        worker = TranslationWorker(request, self._cache)
+        # 相同请求已有预翻译时直接复用；分段翻译无法复用，取消预翻译以免重复请求
+        if segments is None:
+            worker = self._take_speculation(request, on_progress, on_complete)
+            if worker is not None:
+                return worker
+        else:
+            self.cancel_speculation()
+        
+        worker = self._create_worker(request, Priority.INTERACTIVE, segments, contexts)
         
         if on_progress:
             worker.result_ready.connect(on_progress)
@@ -182,35 +580,240 @@ class TranslationService:
         
         return worker
     
-    def cancel(self) -> None:
-        """取消当前翻译任务。"""
-        if self._current_worker and self._current_worker.isRunning():
-            try:
+    @staticmethod
+    def _speculation_key(request: TranslationRequest) -> tuple:
+        """用于判断交互式请求能否复用预翻译的键。"""
+        return (
+            request.text,
+            request.prompt_template,
+            request.model,
+            request.base_url,
+            request.api_key,
+            request.source_language.code,
+            request.target_language.code,
+        )
+    
+    def speculate(self, request: TranslationRequest) -> None:
+        """
+        以低优先级预翻译文本。
+        
+        之后对相同文本的 translate() 会直接接管仍在进行的预翻译，
+        或立即返回已完成的结果。
+        
+        Args:
+            request: 翻译请求
+        """
+        key = self._speculation_key(request)
+        if key == self._speculative_key:
+            return
+        self.cancel_speculation()
+        
+        worker = self._create_worker(request, Priority.SPECULATIVE)
+        self._speculative_worker = worker
+        self._speculative_key = key
+        
+        def on_progress(text: str) -> None:
+            if worker is self._speculative_worker:
+                self._speculative_partial = text
+        
+        def on_finished(result: TranslationResult) -> None:
+            if worker is self._speculative_worker:
+                self._speculative_worker = None
+                if result.success:
+                    self._speculative_result = result
+                else:
+                    self._speculative_key = None
+        
+        worker.result_ready.connect(on_progress)
+        worker.finished_signal.connect(on_finished)
+        worker.finished.connect(lambda: self._background_workers.discard(worker))
+        self._background_workers.add(worker)
+        worker.start()
+        logger.debug(f"开始预翻译: {len(request.text)} 字符")
+    
+    def has_speculation(self, request: TranslationRequest) -> bool:
+        """是否有与请求匹配、可被 translate() 接管的预翻译。"""
+        return (
+            self._speculative_key is not None
+            and self._speculation_key(request) == self._speculative_key
+        )
+    
+    def _take_speculation(
+        self,
+        request: TranslationRequest,
+        on_progress: Optional[Callable[[str], None]],
+        on_complete: Optional[Callable[[TranslationResult], None]],
+    ) -> Optional[TranslationWorker]:
+        """
+        尝试让交互式请求接管匹配的预翻译。
+        
+        Returns:
+            被接管的工作线程；已完成或无匹配时返回None（已完成时回调会被立即调用）
+        """
+        if self._speculative_key is None:
+            return None
+        if self._speculation_key(request) != self._speculative_key:
+            self.cancel_speculation()
+            return None
+        
+        worker = self._speculative_worker
+        result = self._speculative_result
+        partial = self._speculative_partial
+        self._speculative_worker = None
+        self._speculative_key = None
+        self._speculative_result = None
+        self._speculative_partial = ""
+        
+        if result is not None:
+            logger.info("命中已完成的预翻译")
+            if on_progress:
+                on_progress(result.content)
+            if on_complete:
+                on_complete(result)
+            return None
+        
+        if worker is None or not worker.isRunning() or worker.isInterruptionRequested():
+            return None
+        
+        logger.info("接管进行中的预翻译")
+        worker.promote(Priority.INTERACTIVE)
+        self._background_workers.discard(worker)
+        if on_progress:
+            if partial:
+                on_progress(partial)
+            worker.result_ready.connect(on_progress)
+        if on_complete:
+            worker.finished_signal.connect(on_complete)
+        self._current_worker = worker
+        return worker
+    
+    def cancel_speculation(self) -> None:
+        """取消预翻译并丢弃其结果。"""
+        worker = self._speculative_worker
+        self._speculative_worker = None
+        self._speculative_key = None
+        self._speculative_result = None
+        self._speculative_partial = ""
+        if worker is not None:
+            self._stop_worker(worker)
+    
+    def submit(
+        self,
+        request: TranslationRequest,
+        priority: Priority = Priority.BACKGROUND,
+        on_progress: Optional[Callable[[str], None]] = None,
+        on_complete: Optional[Callable[[TranslationResult], None]] = None,
+        segments: Optional[List[str]] = None,
+    ) -> TranslationWorker:
+        """
+        提交低优先级翻译任务，不影响当前交互式翻译。
+        
+        被交互式请求抢占的任务会自动重新提交。
+        
+        Args:
+            request: 翻译请求
+            priority: 任务优先级
+            on_progress: 进度回调
+            on_complete: 完成回调（抢占重试期间不会触发）
+            segments: 提供时按片段批量翻译（忽略 request.text），
+                结果的 segments 字段按顺序给出各片段译文
+            
+        Returns:
+            翻译工作线程
+        """
+        worker = self._create_worker(request, priority, segments)
+        
+        def on_finished(result: TranslationResult) -> None:
+            if result.preempted:
+                self.submit(request, priority, on_progress, on_complete, segments)
+            elif on_complete:
+                on_complete(result)
+        
+        if on_progress:
+            worker.result_ready.connect(on_progress)
+        worker.finished_signal.connect(on_finished)
+        worker.finished.connect(lambda: self._background_workers.discard(worker))
+        
+        self._background_workers.add(worker)
+        worker.start()
+        
+        return worker
+    
+    def translate_segments(
+        self,
+        request: TranslationRequest,
+        segments: List[str],
+        on_complete: Optional[Callable[[TranslationResult], None]] = None,
+        priority: Priority = Priority.BACKGROUND,
+    ) -> TranslationWorker:
+        """
+        批量翻译多个片段（短片段合并为一次请求）。
+        
+        Args:
+            request: 提供语言、提示词和API配置的请求模板
+            segments: 片段列表
+            on_complete: 完成回调，结果的 segments 字段为各片段结果
+            priority: 任务优先级
+            
+        Returns:
+            翻译工作线程
+        """
+        return self.submit(request, priority, on_complete=on_complete, segments=segments)
+    
+    def _stop_worker(self, worker: TranslationWorker) -> None:
+        """中断工作线程并断开其信号。"""
+        try:
+            if worker.isRunning():
                 # 请求中断
-                self._current_worker.requestInterruption()
-                self._current_worker.wait(500)
+                worker.requestInterruption()
+                worker.wait(500)
                 
                 # 如果仍在运行，强制终止
-                if self._current_worker.isRunning():
+                if worker.isRunning():
                     logger.warning("线程未响应中断请求，强制终止...")
-                    self._current_worker.terminate()
-                    self._current_worker.wait(200)
+                    worker.terminate()
+                    worker.wait(200)
+                    worker.release_slot()
+            
+            # 断开信号连接
+            try:
+                worker.result_ready.disconnect()
+            except TypeError:
+                pass
+            try:
+                worker.finished_signal.disconnect()
+            except TypeError:
+                pass
                 
-                # 断开信号连接
-                try:
-                    self._current_worker.result_ready.disconnect()
-                except TypeError:
-                    pass
-                try:
-                    self._current_worker.finished_signal.disconnect()
-                except TypeError:
-                    pass
-                    
-            except Exception as e:
-                logger.error(f"取消翻译任务时出错: {e}")
+        except Exception as e:
+            logger.error(f"取消翻译任务时出错: {e}")
+    
+    def cancel(self) -> None:
+        """取消当前交互式翻译任务。"""
+        if self._current_worker and self._current_worker.isRunning():
+            try:
+                self._stop_worker(self._current_worker)
             finally:
                 self._current_worker = None
     
+    def cancel_background(self, priority: Optional[Priority] = None) -> None:
+        """
+        取消后台任务。
+        
+        Args:
+            priority: 只取消该优先级的任务，None表示全部
+        """
+        for worker in list(self._background_workers):
+            if priority is None or worker.priority == priority:
+                self._stop_worker(worker)
+                self._background_workers.discard(worker)
+    
+    def cancel_all(self) -> None:
+        """取消所有翻译任务。"""
+        self.cancel()
+        self.cancel_speculation()
+        self.cancel_background()
+    
     @property
     def is_running(self) -> bool:
         """检查是否有翻译任务正在运行。"""
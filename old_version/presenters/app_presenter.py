@@ -1,9 +1,9 @@
 """Main application presenter module."""
 
 import sys
-from typing import Optional
+from typing import Callable, Optional
 
-from PyQt5.QtCore import Qt, QSettings
+from PyQt5.QtCore import Qt, QSettings, QTimer
 from PyQt5.QtWidgets import QSystemTrayIcon, QMessageBox
 
 from core.logger import get_logger
@@ -16,6 +16,9 @@ from models.cache_manager import CacheManager
 from models.language_detector import LanguageDetector
 from models.translation_service import TranslationService
 from models.history_manager import HistoryManager
+from models.incremental_translation import IncrementalPlan, IncrementalTracker
+from models.mixed_language import MixedLanguagePlan, plan_mixed_translation
+from models.prompt_template import compile_prompt
 from views.tray_icon import TrayIconView
 from views.display_window import DisplayWindowView
 
@@ -27,6 +30,7 @@ class AppPresenter:
     
     REG_RUN_PATH = "HKEY_CURRENT_USER\\Software\\Microsoft\\Windows\\CurrentVersion\\Run"
     APP_NAME_REG = "CRKT"
+    SPECULATION_DEBOUNCE_MS = 800  # 附加文本静止多久后开始预翻译
     
     def __init__(
         self,
@@ -59,6 +63,15 @@ class AppPresenter:
         # 当前翻译上下文（用于翻译完成后创建记录）
         self._current_translation_context: Optional[dict] = None
         
+        # 段落级增量翻译记录
+        self._incremental = IncrementalTracker()
+        
+        # 附加文本预翻译的防抖定时器
+        self._speculation_timer = QTimer()
+        self._speculation_timer.setSingleShot(True)
+        self._speculation_timer.setInterval(self.SPECULATION_DEBOUNCE_MS)
+        self._speculation_timer.timeout.connect(self._on_speculation_timeout)
+        
         self._setup_bindings()
         logger.info("AppPresenter初始化完成")
     
@@ -70,12 +83,14 @@ class AppPresenter:
         self._tray_view.set_on_settings_click(self._on_settings_click)
         self._tray_view.set_on_startup_toggle(self._on_startup_toggle)
         self._tray_view.set_on_source_comparison_toggle(self._on_source_comparison_toggle)
+        self._tray_view.set_on_speculative_toggle(self._on_speculative_toggle)
         self._tray_view.set_on_quit_click(self._on_quit)
         self._tray_view.set_on_tray_activated(self._on_tray_activated)
         
         # 设置托盘图标初始状态
         self._tray_view.set_startup_checked(config.start_on_boot)
         self._tray_view.set_source_comparison_checked(config.show_source_comparison)
+        self._tray_view.set_speculative_checked(config.speculative_translation)
         
         # 显示窗口事件
         self._display_view.window_state_changed.connect(self._on_window_state_changed)
@@ -106,7 +121,7 @@ class AppPresenter:
     def stop(self) -> None:
         """停止应用程序。"""
         logger.info("正在退出应用程序...")
-        self._translation_service.cancel()
+        self._translation_service.cancel_all()
         
         try:
             self._cache_manager.save()
@@ -114,7 +129,8 @@ class AppPresenter:
             logger.error(f"退出时保存缓存出错: {e}")
         
         try:
-            self._history_manager.save()
+            # 等待后台写入线程写完历史记录
+            self._history_manager.flush(timeout=5.0)
         except Exception as e:
             logger.error(f"退出时保存历史记录出错: {e}")
         
@@ -193,6 +209,14 @@ class AppPresenter:
         self._display_view.set_comparison_mode(checked)
         logger.info(f"原文对照模式: {'开启' if checked else '关闭'}")
     
+    def _on_speculative_toggle(self, checked: bool) -> None:
+        """处理附加文本预翻译开关切换。"""
+        self._config_manager.update_config(speculative_translation=checked)
+        if not checked:
+            self._speculation_timer.stop()
+            self._translation_service.cancel_speculation()
+        logger.info(f"附加文本预翻译: {'开启' if checked else '关闭'}")
+    
     def _on_startup_toggle(self, checked: bool) -> None:
         """处理开机自启动切换。"""
         self._config_manager.update_config(start_on_boot=checked)
@@ -274,6 +298,10 @@ class AppPresenter:
             # JavaScript 负责在光标位置插入文本
             self._display_view.append_source(text, show_window=True)
             
+            # 原文静止一段时间后开始预翻译（每次追加都重新计时）
+            if self._config_manager.config.speculative_translation:
+                self._speculation_timer.start()
+            
             logger.debug(f"文本已追加到原文区: {len(text)} 字符")
         except Exception as e:
             self._handle_error(f"添加文本到原文区时出错: {e}")
@@ -321,6 +349,9 @@ class AppPresenter:
             if not text.strip():
                 return
             
+            # 正式翻译开始后不再需要等待中的预翻译
+            self._speculation_timer.stop()
+            
             # 更新显示
             self._display_view.update_source(text, show_window=not self._user_minimized)
             
@@ -348,32 +379,41 @@ class AppPresenter:
                 self._display_view.update_content('<p style="color: red;">API Key 未设置</p>')
                 return
             
-            # 检测语言
-            source_lang = self._language_detector.detect(text)
-            target_lang = self._language_detector.get_target_language(
-                source_lang,
-                config.target_language,
-            )
+            request = self._build_request(text)
+            incremental_key = self._incremental_key(request)
             
             # 保存翻译上下文
             self._current_translation_context = {
                 "source_text": text,
-                "source_language": source_lang,
-                "target_language": target_lang,
-                "model": config.selected_model,
+                "source_language": request.source_language,
+                "target_language": request.target_language,
+                "model": request.model,
                 "skill": config.selected_skill,
+                "incremental_key": incremental_key,
             }
             
-            # 创建翻译请求
-            request = TranslationRequest(
-                text=text,
-                source_language=source_lang,
-                target_language=target_lang,
-                prompt_template=config.prompt,
-                api_key=api_profile.api_key,
-                base_url=api_profile.base_url,
-                model=config.selected_model,
-            )
+            # 已有整段原文的预翻译时直接接管；否则先取消它，避免与下面的
+            # 分段翻译重复请求
+            if self._translation_service.has_speculation(request):
+                self._translation_service.translate(
+                    request,
+                    on_progress=self._on_translation_progress,
+                    on_complete=self._on_translation_complete,
+                )
+                return
+            self._translation_service.cancel_speculation()
+            
+            # 原文只有少量段落变化时，仅翻译变化的段落并修补上一次的译文
+            plan = self._incremental.plan(text, incremental_key)
+            if plan is not None:
+                self._start_incremental_translation(request, plan)
+                return
+            
+            # 混合语言文本中已是目标语言的句子不再翻译
+            mixed = self._plan_mixed_translation(request)
+            if mixed is not None:
+                self._start_mixed_translation(request, mixed)
+                return
             
             # 开始翻译
             self._translation_service.translate(
@@ -385,6 +425,146 @@ class AppPresenter:
         except Exception as e:
             self._handle_error(f"翻译过程中出错: {e}")
     
+    def _build_request(self, text: str) -> Optional[TranslationRequest]:
+        """根据当前配置构建翻译请求，没有可用API配置时返回None。"""
+        config = self._config_manager.config
+        api_profile = config.get_selected_api_profile()
+        if not api_profile:
+            return None
+        
+        # 检测语言
+        source_lang = self._language_detector.detect(text)
+        target_lang = self._language_detector.get_target_language(
+            source_lang,
+            config.target_language,
+        )
+        
+        return TranslationRequest(
+            text=text,
+            source_language=source_lang,
+            target_language=target_lang,
+            prompt_template=config.prompt,
+            api_key=api_profile.api_key,
+            base_url=api_profile.base_url,
+            model=config.selected_model,
+            api_name=api_profile.name,
+            rpm_limit=api_profile.rpm_limit,
+            tpm_limit=api_profile.tpm_limit,
+        )
+    
+    @staticmethod
+    def _incremental_key(request: TranslationRequest) -> tuple:
+        """增量翻译可复用译文的条件：提示词、模型和语言方向均相同。"""
+        return (
+            request.prompt_template,
+            request.model,
+            request.source_language.code,
+            request.target_language.code,
+        )
+    
+    def _start_incremental_translation(
+        self,
+        request: TranslationRequest,
+        plan: IncrementalPlan,
+    ) -> None:
+        """只翻译变化的段落（附带相邻段落作为上下文）。"""
+        if not plan.changed:
+            self._finish_incremental_translation(plan, [])
+            return
+        
+        # 先显示可复用的译文
+        if not self._user_minimized:
+            self._display_view.update_translation(plan.preview())
+        
+        self._translate_segments(
+            request,
+            plan.segments,
+            plan.contexts,
+            lambda translated: self._finish_incremental_translation(plan, translated),
+        )
+        logger.info(f"增量翻译: {len(plan.changed)}/{len(plan.paragraphs)} 段")
+    
+    def _translate_segments(
+        self,
+        request: TranslationRequest,
+        segments: list,
+        contexts: list,
+        on_translated: Callable[[list], None],
+    ) -> None:
+        """以交互优先级按片段翻译，全部完成后回调各片段译文。"""
+        def on_progress(text: str) -> None:
+            # 片段结果在完成后统一拼接，这里只转发错误信息
+            if text.startswith('@An error occurred:'):
+                self._on_translation_progress(text)
+        
+        def on_complete(result: TranslationResult) -> None:
+            if result.success and result.segments is not None:
+                on_translated([r.content for r in result.segments])
+            else:
+                self._on_translation_complete(result)
+        
+        self._translation_service.translate(
+            request,
+            on_progress=on_progress,
+            on_complete=on_complete,
+            segments=segments,
+            contexts=contexts,
+        )
+    
+    def _plan_mixed_translation(self, request: TranslationRequest) -> Optional[MixedLanguagePlan]:
+        """翻译类提示词下，为中英等混合文本生成逐句翻译计划。"""
+        try:
+            template = compile_prompt(request.prompt_template)
+        except ValueError:
+            return None
+        if not template.uses_target_language:
+            return None
+        return plan_mixed_translation(
+            self._language_detector,
+            request.text,
+            request.target_language.code,
+        )
+    
+    def _start_mixed_translation(self, request: TranslationRequest, plan: MixedLanguagePlan) -> None:
+        """只翻译不是目标语言的句子，已是目标语言的句子原样保留。"""
+        if not self._user_minimized:
+            self._display_view.update_translation(plan.assemble())
+        
+        def on_translated(translated: list) -> None:
+            content = plan.assemble(translated)
+            self._on_translation_progress(content)
+            self._on_translation_complete(TranslationResult(success=True, content=content))
+        
+        self._translate_segments(request, plan.segments, plan.contexts, on_translated)
+        logger.info(f"混合语言翻译: {len(plan.runs)} 段，跳过 {plan.kept_chars} 个字符")
+    
+    def _finish_incremental_translation(self, plan: IncrementalPlan, translated: list) -> None:
+        """修补译文并按完整翻译的流程收尾。"""
+        paragraphs = plan.apply(translated)
+        content = "\n\n".join(paragraphs)
+        key = (self._current_translation_context or {}).get("incremental_key")
+        
+        self._on_translation_progress(content)
+        self._on_translation_complete(TranslationResult(success=True, content=content))
+        
+        # 使用计划中的段落对应关系（译文内部可能含空行，重新拆分会错位）
+        if key is not None:
+            self._incremental.remember_aligned(plan.paragraphs, paragraphs, key)
+    
+    def _on_speculation_timeout(self) -> None:
+        """附加文本静止后，读取原文区并开始预翻译。"""
+        if not self._config_manager.config.speculative_translation:
+            return
+        
+        def on_source_text(text) -> None:
+            if not text or not text.strip():
+                return
+            request = self._build_request(text)
+            if request and request.api_key:
+                self._translation_service.speculate(request)
+        
+        self._display_view.get_source(on_source_text)
+    
     def _on_translation_progress(self, text: str) -> None:
         """处理翻译进度更新。"""
         if self._display_view.user_closed:
@@ -406,6 +586,9 @@ class AppPresenter:
         if result.success and self._current_translation_context:
             ctx = self._current_translation_context
             
+            # 记录段落对应关系，供下次增量翻译
+            self._incremental.remember(ctx["source_text"], result.content, ctx["incremental_key"])
+            
             # 保存翻译记录
             self._history_manager.add_record(
                 source_text=ctx["source_text"],
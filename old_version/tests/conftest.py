@@ -0,0 +1,7 @@
+"""Shared pytest configuration."""
+
+import os
+import sys
+
+# 以项目根目录为导入起点（与 main.py 相同）
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,190 @@
+"""Tests for the history log and history manager."""
+
+import json
+import os
+import time
+
+import pytest
+
+from core.types import TranslationRecord
+from models.blob_store import BlobStore
+from models.history_log import HistoryLog
+from models.history_manager import ARCHIVE_BATCH, HOT_RECORDS, HistoryManager
+
+
+def make_record(i: int) -> TranslationRecord:
+    return TranslationRecord.create(f"src {i}", f"dst {i}", "en", "zh")
+
+
+def read_all_backwards(log: HistoryLog):
+    reader = log.read_backwards()
+    records = []
+    while not reader.done:
+        records += reader.read(2)
+    return records
+
+
+@pytest.fixture(params=[False, True], ids=["inline-text", "blob-store"])
+def log(request, tmp_path):
+    blobs = BlobStore(str(tmp_path / "blobs.jsonl")) if request.param else None
+    log = HistoryLog(str(tmp_path / "history.jsonl"), blobs)
+    yield log
+    log.close()
+
+
+class TestHistoryLog:
+    def test_replay_applies_delete_archive_and_clear_markers(self, log):
+        records = [make_record(i) for i in range(6)]
+        for record in records[:4]:
+            log.append_add(record)
+        log.append_delete(records[1].id)
+        log.append_archive([records[0].id])
+        log.append_add(records[4])
+        log.sync()
+
+        expected = [records[4], records[3], records[2]]
+        assert log.load() == expected
+        assert log.entry_count == 7
+        reopened = HistoryLog(log.path, log._blobs)
+        assert read_all_backwards(reopened) == expected
+        assert reopened.entry_count == 7
+
+        log.append_clear()
+        log.append_add(records[5])
+        log.sync()
+        assert log.load() == [records[5]]
+        assert read_all_backwards(log) == [records[5]]
+
+    def test_re_added_record_replaces_older_entry(self, log):
+        first, second = make_record(1), make_record(2)
+        log.append_add(first)
+        log.append_add(second)
+        moved = TranslationRecord.from_dict(dict(first.to_dict(), translated_text="newer"))
+        log.append_add(moved)
+        log.sync()
+
+        assert log.load() == [moved, second]
+        assert read_all_backwards(log) == [moved, second]
+
+    @pytest.mark.parametrize("replay", ["load", "read_backwards"])
+    def test_truncated_tail_is_dropped_and_log_stays_appendable(self, log, replay):
+        records = [make_record(i) for i in range(3)]
+        for record in records[:2]:
+            log.append_add(record)
+        log.close()
+        with open(log.path, "ab") as f:
+            f.write(b'{"op": "add", "record": {"id": "torn')
+        intact_size = os.path.getsize(log.path) - len(b'{"op": "add", "record": {"id": "torn')
+
+        loaded = log.load() if replay == "load" else read_all_backwards(log)
+        assert loaded == [records[1], records[0]]
+        assert os.path.getsize(log.path) == intact_size
+
+        log.append_add(records[2])
+        log.sync()
+        assert log.load() == [records[2], records[1], records[0]]
+
+    def test_corrupt_entry_is_skipped(self, log):
+        records = [make_record(i) for i in range(2)]
+        log.append_add(records[0])
+        log.close()
+        with open(log.path, "ab") as f:
+            f.write(b"not json\n")
+        log.append_add(records[1])
+        log.sync()
+
+        assert log.load() == [records[1], records[0]]
+        assert read_all_backwards(log) == [records[1], records[0]]
+
+    def test_compaction_keeps_live_records_and_later_appends(self, log):
+        records = [make_record(i) for i in range(4)]
+        for record in records:
+            log.append_add(record)
+        for record in records[:3]:
+            log.append_delete(record.id)
+        log.sync()
+
+        live = log.load()
+        assert live == [records[3]]
+        log.compact(live, background=False)
+        assert log.entry_count == 1
+
+        extra = make_record(9)
+        log.append_add(extra)
+        log.sync()
+        assert log.load() == [extra, records[3]]
+        with open(log.path, encoding="utf-8") as f:
+            assert [json.loads(line)["op"] for line in f] == ["add", "add"]
+
+
+def open_manager(directory) -> HistoryManager:
+    manager = HistoryManager(
+        os.path.join(directory, "history.json"),
+        BlobStore(os.path.join(directory, "blobs.jsonl")),
+    )
+    deadline = time.monotonic() + 10
+    while not manager.is_loaded and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert manager.is_loaded
+    return manager
+
+
+class TestHistoryManager:
+    def test_archiving_with_unwritten_records_keeps_ids_unique(self, tmp_path):
+        # 一批写入超过 HOT_RECORDS + ARCHIVE_BATCH 条记录触发归档时，归档标记
+        # 不能先于记录的新增条目写入，否则重新加载后记录会重复
+        total = HOT_RECORDS + ARCHIVE_BATCH + 100
+        manager = open_manager(tmp_path)
+        added = [manager.add_record(f"src {i}", f"dst {i}", "en", "zh").id for i in range(total)]
+        assert manager.flush()
+
+        reloaded = open_manager(tmp_path)
+        ids = [record.id for record in reloaded.get_records(total * 2)]
+        assert reloaded.flush()
+        assert len(reloaded._archive) > 0
+        assert len(ids) == len(set(ids)) == total
+        assert ids == added[::-1]
+        assert reloaded.record_count == total
+
+    def test_duplicate_translation_moves_record_to_newest(self, tmp_path):
+        manager = open_manager(tmp_path)
+        first = manager.add_record("hello", "你好", "en", "zh")
+        manager.add_record("world", "世界", "en", "zh")
+        again = manager.add_record("hello", "你好", "en", "zh")
+        assert again.id == first.id
+        assert [r.source_text for r in manager.get_records()] == ["hello", "world"]
+        assert manager.flush()
+
+        reloaded = open_manager(tmp_path)
+        assert [r.id for r in reloaded.get_records()] == [first.id, manager.get_records()[1].id]
+        assert reloaded.flush()
+
+    def test_delete_and_clear_survive_reload(self, tmp_path):
+        manager = open_manager(tmp_path)
+        records = [manager.add_record(f"src {i}", f"dst {i}", "en", "zh") for i in range(3)]
+        assert manager.delete_record(records[1].id)
+        assert manager.flush()
+
+        reloaded = open_manager(tmp_path)
+        assert [r.id for r in reloaded.get_records()] == [records[2].id, records[0].id]
+        assert reloaded.get_record(records[1].id) is None
+        reloaded.clear_history()
+        assert reloaded.flush()
+
+        cleared = open_manager(tmp_path)
+        assert cleared.get_records() == []
+        assert cleared.flush()
+
+    def test_legacy_json_is_imported(self, tmp_path):
+        records = [make_record(i) for i in range(3)]
+        with open(tmp_path / "history.json", "w", encoding="utf-8") as f:
+            json.dump({"records": [r.to_dict() for r in records]}, f)
+
+        manager = open_manager(tmp_path)
+        assert manager.get_records() == records
+        assert manager.flush()
+        assert os.path.exists(tmp_path / "history.jsonl")
+
+        reloaded = open_manager(tmp_path)
+        assert reloaded.get_records() == records
+        assert reloaded.flush()
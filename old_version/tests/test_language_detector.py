@@ -0,0 +1,108 @@
+"""Tests for language detection."""
+
+import pytest
+
+from models import language_detector
+from models.language_detector import (
+    LANGUAGE_CODES, UNDECIDED_LATIN_CONFIDENCE, LanguageDetector, TrigramClassifier, script_histogram,
+)
+from models.language_profiles import BENCHMARK_CORPUS
+
+
+@pytest.fixture(scope="module")
+def detector():
+    return LanguageDetector()
+
+
+@pytest.mark.parametrize("expected, sentence", BENCHMARK_CORPUS)
+def test_benchmark_corpus(detector, expected, sentence):
+    assert detector.detect(sentence).code == expected
+
+
+@pytest.mark.parametrize("heading", [
+    "Our contributions are as follows",
+    "Implementation details",
+    "Introduction",
+    "Lemma 2. Let f be a continuous function on a compact set.",
+    "Notation",
+    "Abstract",
+])
+def test_academic_english_is_not_labelled_foreign(detector, heading):
+    info = detector.detect(heading)
+    assert info.code == "English"
+    assert info.confidence >= UNDECIDED_LATIN_CONFIDENCE
+
+
+def test_weak_trigram_evidence_falls_back_to_english():
+    classifier = TrigramClassifier()
+    # "Introduction" 的三元组略偏向法语，但不足以排除英语
+    assert classifier.classify("Introduction") is None
+    language, confidence = classifier.classify("Nous proposons une nouvelle méthode")
+    assert language == "French"
+    assert confidence > 0.9
+
+
+def test_short_text_is_undecided(detector):
+    info = detector.detect("Thanks.")
+    assert info.code == "English"
+    assert info.confidence == pytest.approx(UNDECIDED_LATIN_CONFIDENCE)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("这是一个测试句子", "Chinese"),
+    ("これはテストです", "Japanese"),
+    ("이것은 테스트입니다", "Korean"),
+    ("Это тестовое предложение", "Russian"),
+    ("12345 !!!", "English"),
+])
+def test_script_detection(detector, text, expected):
+    assert detector.detect(text).code == expected
+
+
+def test_english_with_a_chinese_word_stays_english(detector):
+    assert detector.detect("Please translate the word 翻译 into English for me.").code == "English"
+
+
+def test_script_histogram_counts_letters_only():
+    counts = script_histogram("abc 123 中文 ¡!")
+    assert counts["latin"] == 3
+    assert counts["han"] == 2
+
+
+def test_custom_training_text():
+    classifier = TrigramClassifier({
+        "English": "the cat sat on the mat with the hat " * 20,
+        "French": "le chat est sur le tapis avec le chapeau " * 20,
+    })
+    assert classifier.classify("the hat on the mat")[0] == "English"
+    assert classifier.classify("le chapeau sur le tapis")[0] == "French"
+
+
+@pytest.fixture(params=["numpy", "pure-python"])
+def batch_backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(language_detector, "np", None)
+    return request.param
+
+
+def test_batch_matches_single_detection(detector, batch_backend):
+    texts = [sentence for _, sentence in BENCHMARK_CORPUS] + [
+        "", "中文和English混合", "Thanks.", "THE HAT ON THE MAT IS RED",
+        "İSTANBUL İS A VERY LARGE CITY", "Ο ΣΙΣΥΦΟΣ and the stone", "null\x00byte inside the text",
+        "math 𝐀𝐁𝐂 and emoji 😀 in the sentence", "Der Hund " * 1000,
+    ]
+    texts = texts * 3
+    expected = [detector.detect(text) for text in texts]
+    batched = detector.detect_batch(texts)
+    assert [i.code for i in batched] == [i.code for i in expected]
+    assert [i.confidence for i in batched] == pytest.approx([i.confidence for i in expected])
+    codes = detector.detect_batch(texts, as_codes=True)
+    assert [LANGUAGE_CODES[c] for c in codes] == [i.code for i in expected]
+
+
+def test_batch_of_latin_texts_only(detector, batch_backend):
+    texts = ["the hat on the mat", "le chapeau sur le tapis", "Der Hund schläft im Garten"]
+    assert [i.code for i in detector.detect_batch(texts)] == [detector.detect(t).code for t in texts]
+    assert detector.detect_batch([]) == []
@@ -0,0 +1,86 @@
+"""Tests for mixed-language segmentation."""
+
+import pytest
+
+from models.language_detector import LanguageDetector
+from models.mixed_language import MixedLanguagePlan, plan_mixed_translation, split_sentences
+
+
+@pytest.fixture(scope="module")
+def detector():
+    return LanguageDetector()
+
+
+def test_split_sentences_round_trips():
+    text = "第一句。第二句！First one. Second one?\n\nThird line;  fourth"
+    pieces = split_sentences(text)
+    assert [s for s, _ in pieces] == ["第一句。", "第二句！", "First one.", "Second one?", "Third line;", "fourth"]
+    assert "".join(s + sep for s, sep in pieces) == text
+
+
+def test_assemble_fills_runs_in_place():
+    plan = MixedLanguagePlan(["A.", "B.", "C.", "D."], [" ", " ", " ", ""], [(1, 3)])
+    assert plan.segments == ["B. C."]
+    assert plan.contexts == [("A.", "D.")]
+    assert plan.kept_chars == 4
+    assert plan.assemble() == "A. … D."
+    assert plan.assemble([" 乙。丙。 "]) == "A. 乙。丙。 D."
+
+
+def test_translates_only_foreign_sentences(detector):
+    text = (
+        "本文提出了一种新的方法。"
+        "In this paper we study the convergence of gradient descent. "
+        "实验结果表明该方法有效。"
+    )
+    plan = plan_mixed_translation(detector, text, "Chinese")
+    assert plan is not None
+    assert plan.segments == ["In this paper we study the convergence of gradient descent."]
+    assert plan.assemble(["本文研究梯度下降的收敛性。"]) == (
+        "本文提出了一种新的方法。本文研究梯度下降的收敛性。 实验结果表明该方法有效。"
+    )
+
+
+def test_consecutive_foreign_sentences_form_one_run(detector):
+    text = (
+        "We propose a novel method for sparse attention. "
+        "Nous proposons une nouvelle méthode pour les modèles de langue. "
+        "Le modèle fonctionne bien sur toutes les données."
+    )
+    plan = plan_mixed_translation(detector, text, "English")
+    assert plan is not None
+    assert plan.segments == [
+        "Nous proposons une nouvelle méthode pour les modèles de langue. "
+        "Le modèle fonctionne bien sur toutes les données."
+    ]
+
+
+@pytest.mark.parametrize("text, target", [
+    # 短句与标题式的英文无法可靠判定，整段照常翻译
+    ("Introduction\n本文提出了一种新的方法。", "English"),
+    ("Implementation details\n实验结果表明该方法有效。", "English"),
+    ("Related work. Abstract. Le modèle fonctionne bien.", "English"),
+    ("The model works well. Thanks. It is fast. El modelo funciona bien.", "English"),
+    ("Hola. El modelo funciona bien. Gracias.", "English"),
+    ("Das Modell funktioniert gut. Ende. The model works well.", "English"),
+    ("Conclusion\nWe propose a novel method for sparse attention.", "Chinese"),
+])
+def test_short_or_heading_sentences_disable_the_split(detector, text, target):
+    assert plan_mixed_translation(detector, text, target) is None
+
+
+@pytest.mark.parametrize("text, target", [
+    ("本文提出了一种新的方法。实验结果表明该方法有效。", "Chinese"),
+    ("本文提出了一种新的方法。实验结果表明该方法有效。", "English"),
+    ("In this paper we study the convergence of gradient descent.", "Chinese"),
+])
+def test_single_language_text_is_not_split(detector, text, target):
+    assert plan_mixed_translation(detector, text, target) is None
+
+
+def test_sentences_without_letters_are_kept(detector):
+    text = "本文提出了一种新的方法。 42. In this paper we study the convergence of gradient descent."
+    plan = plan_mixed_translation(detector, text, "Chinese")
+    assert plan is not None
+    assert plan.segments == ["In this paper we study the convergence of gradient descent."]
+    assert plan.assemble(["译文"]).startswith("本文提出了一种新的方法。 42. ")
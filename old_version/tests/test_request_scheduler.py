@@ -0,0 +1,56 @@
+"""Tests for the priority request scheduler."""
+
+from models.request_scheduler import Priority, RequestScheduler
+
+
+def cancel_after(attempts):
+    """返回在第 attempts 次检查后要求放弃等待的回调。"""
+    calls = [0]
+
+    def should_cancel():
+        calls[0] += 1
+        return calls[0] > attempts
+
+    return should_cancel
+
+
+def test_interactive_preempts_lowest_priority_when_full():
+    scheduler = RequestScheduler(max_concurrency=3, interactive_reserve=0)
+    preempted = []
+    scheduler.acquire(Priority.INTERACTIVE)
+    scheduler.acquire(Priority.SPECULATIVE, on_preempt=lambda: preempted.append("speculative"))
+    scheduler.acquire(Priority.BACKGROUND, on_preempt=lambda: preempted.append("background"))
+
+    slot = scheduler.acquire(Priority.INTERACTIVE, should_cancel=cancel_after(2))
+
+    assert slot is None
+    assert preempted == ["background"]
+
+
+def test_no_preemption_when_interactive_class_limit_is_reached():
+    scheduler = RequestScheduler(max_concurrency=4, interactive_reserve=0)
+    preempted = []
+    scheduler.acquire(Priority.INTERACTIVE)
+    scheduler.acquire(Priority.INTERACTIVE)
+    scheduler.acquire(Priority.BACKGROUND, on_preempt=lambda: preempted.append("background"))
+    scheduler.acquire(Priority.BACKGROUND, on_preempt=lambda: preempted.append("background"))
+
+    # 第三个交互式请求受本级别上限限制，抢占后台请求也无法放行
+    slot = scheduler.acquire(Priority.INTERACTIVE, should_cancel=cancel_after(3))
+
+    assert slot is None
+    assert preempted == []
+
+
+def test_promoted_slot_is_not_preempted():
+    scheduler = RequestScheduler(max_concurrency=2, interactive_reserve=0)
+    preempted = []
+    speculative = scheduler.acquire(Priority.SPECULATIVE, on_preempt=lambda: preempted.append(1))
+    scheduler.promote(speculative, Priority.INTERACTIVE)
+    scheduler.acquire(Priority.INTERACTIVE)
+
+    slot = scheduler.acquire(Priority.INTERACTIVE, should_cancel=cancel_after(2))
+
+    assert slot is None
+    assert speculative.priority == Priority.INTERACTIVE
+    assert preempted == []
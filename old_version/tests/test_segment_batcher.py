@@ -0,0 +1,123 @@
+"""Tests for segment batching and batch response parsing."""
+
+import json
+
+import pytest
+
+from models.segment_batcher import (
+    MAX_BATCH_SEGMENTS, SHORT_SEGMENT_CHARS, pack_batch, parse_batch_response, plan_batches,
+)
+
+
+def reply(items) -> str:
+    return json.dumps({"translations": items}, ensure_ascii=False)
+
+
+def test_plan_batches_keeps_long_segments_alone():
+    segments = ["a", "b" * (SHORT_SEGMENT_CHARS + 1), "c"]
+    assert plan_batches(segments) == [[1], [0, 2]]
+
+
+def test_plan_batches_respects_segment_limit():
+    batches = plan_batches(["x"] * (MAX_BATCH_SEGMENTS + 1))
+    assert [len(b) for b in batches] == [MAX_BATCH_SEGMENTS, 1]
+
+
+def test_pack_batch_includes_only_present_context():
+    packed = json.loads(pack_batch(["一", "二"], [("前", ""), ("", "后")]))
+    assert packed == {"segments": [
+        {"id": 0, "text": "一", "before": "前"},
+        {"id": 1, "text": "二", "after": "后"},
+    ]}
+
+
+def test_parse_reorders_out_of_order_ids():
+    content = reply([{"id": 2, "text": "c"}, {"id": 0, "text": "a"}, {"id": "1", "text": "b"}])
+    assert parse_batch_response(content, 3) == ["a", "b", "c"]
+
+
+def test_parse_ignores_surrounding_text_and_fences():
+    content = "```json\n" + reply([{"id": 0, "text": "a"}]) + "\n```"
+    assert parse_batch_response(content, 1) == ["a"]
+
+
+@pytest.mark.parametrize("content", [
+    "",
+    "not json at all",
+    '{"translations": [{"id": 0, "text": "a"}',
+    '{"result": []}',
+    '{"translations": {"0": "a"}}',
+    '["a"]',
+    reply(["a"]),
+    reply([{"id": 0, "text": 1}]),
+    reply([{"id": 0}]),
+])
+def test_parse_rejects_malformed_response(content):
+    assert parse_batch_response(content, 1) is None
+
+
+@pytest.mark.parametrize("items", [
+    [{"id": 0, "text": "a"}],
+    [{"id": 0, "text": "a"}, {"id": 1, "text": "b"}, {"id": 2, "text": "c"}],
+    [{"id": 0, "text": "a"}, {"id": 0, "text": "b"}],
+    [{"id": -1, "text": "a"}, {"id": 1, "text": "b"}],
+])
+def test_parse_rejects_wrong_segment_count(items):
+    assert parse_batch_response(reply(items), 2) is None
+
+
+class TestBatchTranslationWorker:
+    """回复无法解析时回退为逐段请求。"""
+
+    @pytest.fixture
+    def worker_factory(self, monkeypatch):
+        pytest.importorskip("PyQt5.QtCore")
+        pytest.importorskip("openai")
+        from core.types import LanguageInfo, TranslationRequest
+        from models.prompt_template import compile_prompt
+        from models.translation_service import BatchTranslationWorker
+
+        def create(responses):
+            request = TranslationRequest(
+                text="",
+                source_language=LanguageInfo("English", "English"),
+                target_language=LanguageInfo("Chinese", "中文"),
+                prompt_template="Translate into {target_language}:\n{text}",
+                api_key="key",
+                base_url="http://localhost/",
+                model="model",
+            )
+            worker = BatchTranslationWorker(request, ["one", "two", "three"])
+            calls = []
+
+            def fake_stream(base_url, messages, expected_output_tokens, on_text=None):
+                calls.append(messages[-1]["content"])
+                return responses.pop(0)
+
+            monkeypatch.setattr(worker, "_stream_completion", fake_stream)
+            return worker, compile_prompt(request.prompt_template), calls
+
+        return create
+
+    def test_batch_reply_is_split_in_id_order(self, worker_factory):
+        worker, prompt, calls = worker_factory([
+            reply([{"id": 1, "text": "二"}, {"id": 2, "text": "三"}, {"id": 0, "text": "一"}]),
+        ])
+        result = worker._translate_batch("http://localhost/", prompt, ["one", "two", "three"])
+        assert result == ["一", "二", "三"]
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("bad_reply", [
+        "sorry, I cannot help with that",
+        reply([{"id": 0, "text": "一"}, {"id": 1, "text": "二"}]),
+        reply([{"id": 0, "text": "一"}, {"id": 0, "text": "二"}, {"id": 1, "text": "三"}]),
+    ])
+    def test_unusable_reply_falls_back_to_single_requests(self, worker_factory, bad_reply):
+        worker, prompt, calls = worker_factory([bad_reply, "一", "二", "三"])
+        result = worker._translate_batch("http://localhost/", prompt, ["one", "two", "three"])
+        assert result == ["一", "二", "三"]
+        assert calls[1:] == ["one", "two", "three"]
+
+    def test_interrupted_fallback_returns_none(self, worker_factory):
+        worker, prompt, _ = worker_factory(["garbage", "一", None])
+        assert worker._translate_batch("http://localhost/", prompt, ["one", "two", "three"]) is None
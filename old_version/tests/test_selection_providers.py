@@ -0,0 +1,64 @@
+"""Tests for selected-text providers."""
+
+from typing import Optional
+
+import pytest
+
+pytest.importorskip("pyperclip")
+
+from utils.selection_providers import (  # noqa: E402
+    AdaptiveProvider, ClipboardCopyProvider, SelectionProvider,
+)
+
+
+class FakeProvider(SelectionProvider):
+    """返回固定文本并记录调用次数的后端。"""
+
+    def __init__(self, name: str, text: Optional[str], intrusive: bool = False):
+        super().__init__()
+        self.name = name
+        self.text = text
+        self.intrusive = intrusive
+        self.calls = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    def _read(self) -> Optional[str]:
+        self.calls += 1
+        return self.text
+
+
+def test_clipboard_copy_is_intrusive():
+    assert ClipboardCopyProvider.intrusive
+    assert not ClipboardCopyProvider().can_capture_passively()
+    assert ClipboardCopyProvider().capture_passive() is None
+
+
+def test_adaptive_passive_capture_skips_intrusive_providers():
+    accessibility = FakeProvider("uia", None)
+    clipboard = FakeProvider("clipboard", "copied", intrusive=True)
+    provider = AdaptiveProvider([accessibility, clipboard])
+
+    assert provider.can_capture_passively()
+    assert provider.capture_passive() is None
+    assert accessibility.calls == 1
+    assert clipboard.calls == 0
+
+    # 确认热键后的正常获取仍可回退到剪贴板
+    assert provider.capture() == "copied"
+    assert clipboard.calls == 1
+
+
+def test_adaptive_passive_capture_uses_harmless_provider():
+    primary = FakeProvider("xclip", "selected")
+    clipboard = FakeProvider("clipboard", "copied", intrusive=True)
+    provider = AdaptiveProvider([clipboard, primary])
+
+    assert provider.capture_passive() == "selected"
+    assert clipboard.calls == 0
+
+
+def test_adaptive_without_harmless_provider_cannot_capture_passively():
+    provider = AdaptiveProvider([FakeProvider("clipboard", "copied", intrusive=True)])
+    assert not provider.can_capture_passively()
@@ -0,0 +1,78 @@
+"""Tests for speculative translation handling in the translation service."""
+
+import time
+
+import pytest
+
+pytest.importorskip("PyQt5.QtCore")
+pytest.importorskip("openai")
+
+from core.types import LanguageInfo, TranslationRequest  # noqa: E402
+from models.translation_service import TranslationService, TranslationWorker  # noqa: E402
+
+
+class IdleWorker(TranslationWorker):
+    """不发起请求、直到被中断才退出的工作线程。"""
+
+    def _translate(self) -> None:
+        deadline = time.monotonic() + 5
+        while not self.isInterruptionRequested() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+
+def make_request(text: str) -> TranslationRequest:
+    return TranslationRequest(
+        text=text,
+        source_language=LanguageInfo("English", "English"),
+        target_language=LanguageInfo("Chinese", "中文"),
+        prompt_template="Translate into {target_language}:\n{text}",
+        api_key="key",
+        base_url="http://localhost/",
+        model="model",
+    )
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = TranslationService()
+    created = []
+
+    def create_worker(request, priority, segments=None, contexts=None):
+        worker = IdleWorker(request, None, None, service.scheduler, priority)
+        created.append(worker)
+        return worker
+
+    monkeypatch.setattr(service, "_create_worker", create_worker)
+    service.created = created
+    yield service
+    for worker in created:
+        worker.requestInterruption()
+        worker.wait(2000)
+
+
+def test_has_speculation_matches_only_the_same_request(service):
+    service.speculate(make_request("First paragraph."))
+    assert service.has_speculation(make_request("First paragraph."))
+    assert not service.has_speculation(make_request("Other text."))
+
+
+def test_segment_translation_cancels_running_speculation(service):
+    service.speculate(make_request("First paragraph.\n\nSecond paragraph."))
+    speculative = service.created[0]
+
+    service.translate(make_request("First paragraph.\n\nSecond paragraph."), segments=["Second paragraph."])
+
+    assert speculative.wait(2000) and speculative.isFinished()
+    assert not service.has_speculation(make_request("First paragraph.\n\nSecond paragraph."))
+
+
+def test_full_translation_adopts_matching_speculation(service):
+    service.speculate(make_request("First paragraph."))
+    speculative = service.created[0]
+    speculative.wait(50)
+
+    adopted = service.translate(make_request("First paragraph."))
+
+    assert adopted is speculative
+    assert not speculative.isInterruptionRequested()
+    assert len(service.created) == 1
@@ -0,0 +1,112 @@
+"""Batched background write thread module."""
+
+import threading
+import time
+from typing import Callable, List, Optional
+
+from core.logger import get_logger
+
+logger = get_logger("BackgroundWriter")
+
+
+class BackgroundWriter:
+    """后台写入线程。
+
+    写入任务按提交顺序在同一个常驻线程中执行，提交方只入队，不做文件
+    I/O。一批中第一个任务提交后等待 delay 秒，期间提交的任务合并到同一批；
+    每批执行完后调用 on_batch（如同步到磁盘）。flush() 跳过等待，立即
+    执行所有已提交的任务并等待完成。
+    """
+
+    def __init__(self, name: str, delay: float, on_batch: Optional[Callable[[], None]] = None):
+        """
+        初始化写入线程（首次提交任务时才启动）。
+
+        Args:
+            name: 线程名
+            delay: 合并写入的等待时间（秒）
+            on_batch: 每批任务执行完后调用的函数
+        """
+        self._name = name
+        self._delay = delay
+        self._on_batch = on_batch
+        self._condition = threading.Condition()
+        self._tasks: List[Callable[[], None]] = []
+        self._deadline = 0.0
+        self._urgent = False
+        self._submitted = 0
+        self._completed = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def pending(self) -> int:
+        """尚未完成的任务数。"""
+        with self._condition:
+            return self._submitted - self._completed
+
+    def submit(self, task: Callable[[], None]) -> None:
+        """
+        提交写入任务。
+
+        Args:
+            task: 在写入线程中执行的函数
+        """
+        with self._condition:
+            if not self._tasks:
+                self._deadline = time.monotonic() + self._delay
+            self._tasks.append(task)
+            self._submitted += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        立即执行所有已提交的任务并等待完成。
+
+        Args:
+            timeout: 最长等待时间（秒），None 表示一直等待
+
+        Returns:
+            是否在超时前全部完成
+        """
+        if threading.current_thread() is self._thread:
+            return False
+        with self._condition:
+            target = self._submitted
+            if self._completed >= target:
+                return True
+            self._urgent = True
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: self._completed >= target, timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if not self._tasks:
+                        self._condition.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if self._urgent or remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch, self._tasks = self._tasks, []
+
+            for task in batch:
+                try:
+                    task()
+                except Exception as e:
+                    logger.error(f"{self._name} 执行写入任务出错: {e}")
+            if self._on_batch is not None:
+                try:
+                    self._on_batch()
+                except Exception as e:
+                    logger.error(f"{self._name} 同步出错: {e}")
+
+            with self._condition:
+                self._completed += len(batch)
+                if self._completed >= self._submitted:
+                    self._urgent = False
+                self._condition.notify_all()
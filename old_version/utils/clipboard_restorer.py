@@ -0,0 +1,106 @@
+"""Deferred clipboard restore module."""
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from core.logger import get_logger
+
+logger = get_logger("ClipboardRestorer")
+
+
+class ClipboardRestorer:
+    """剪贴板恢复线程。
+
+    获取选中文本后需要延迟恢复原剪贴板内容。所有恢复请求由同一个常驻
+    线程执行，并以代数区分：连续多次获取时只保留最早的原始内容和最新一次
+    的写入参数，到期后只执行一次恢复，不会因为多个恢复交错而写回中间结果。
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._generation = 0
+        self._snapshot: Any = None
+        self._writer: Optional[Callable[[Any], None]] = None
+        self._deadline = 0.0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def generation(self) -> int:
+        """已安排的恢复次数。"""
+        with self._condition:
+            return self._generation
+
+    @property
+    def pending(self) -> bool:
+        """是否有尚未执行的恢复。"""
+        with self._condition:
+            return self._writer is not None
+
+    def schedule(self, snapshot: Any, writer: Callable[[Any], None], delay: float) -> int:
+        """
+        安排一次恢复。
+
+        已有未执行的恢复时保留其原始内容（当前剪贴板只是上一次获取的结果），
+        只更新写入函数并推迟执行时间。
+
+        Args:
+            snapshot: 要恢复的剪贴板内容
+            writer: 执行恢复的函数，接收 snapshot
+            delay: 延迟时间（秒）
+
+        Returns:
+            本次恢复的代数
+        """
+        with self._condition:
+            self._generation += 1
+            if self._writer is None:
+                self._snapshot = snapshot
+            self._writer = writer
+            self._deadline = time.monotonic() + delay
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ClipboardRestorer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+            return self._generation
+
+    def cancel(self) -> None:
+        """放弃尚未执行的恢复。"""
+        with self._condition:
+            self._generation += 1
+            self._snapshot = None
+            self._writer = None
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if self._writer is None:
+                        self._condition.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    # 等待期间有新的安排会更新截止时间
+                    self._condition.wait(remaining)
+                snapshot, writer = self._snapshot, self._writer
+                generation = self._generation
+                self._snapshot = None
+                self._writer = None
+
+            try:
+                writer(snapshot)
+                logger.debug(f"已恢复剪贴板（第 {generation} 代）")
+            except Exception as e:
+                logger.error(f"恢复剪贴板时出错: {e}")
+
+
+_restorer = ClipboardRestorer()
+
+
+def get_clipboard_restorer() -> ClipboardRestorer:
+    """获取全局剪贴板恢复线程。"""
+    return _restorer
@@ -0,0 +1,158 @@
+"""Event-driven clipboard access module."""
+
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from PyQt5.QtCore import QMimeData, QObject, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+
+from core.logger import get_logger
+
+logger = get_logger("ClipboardWatcher")
+
+# 自身写入在该时间内未触发变化通知则不再等待（秒）
+_SELF_WRITE_TTL: float = 1.0
+
+
+def copy_mime_data(source: QMimeData) -> QMimeData:
+    """逐格式复制剪贴板数据（保留原始字节，不重新编码）。"""
+    result = QMimeData()
+    for fmt in source.formats():
+        result.setData(fmt, source.data(fmt))
+    if source.hasImage():
+        result.setImageData(source.imageData())
+    return result
+
+
+class ClipboardWatcher(QObject):
+    """剪贴板监视器。
+
+    在 Qt 主线程中监听 QClipboard.dataChanged 并缓存最新文本，其他线程
+    通过序号等待剪贴板变化，无需轮询，也不会为每次读取启动子进程。
+    写入剪贴板会被转发到主线程执行。
+
+    每次变化时保存一份包含全部格式（文本、HTML、图片等）的快照，
+    用于在获取选中文本后原样恢复剪贴板。
+    """
+
+    _write_requested = pyqtSignal(str)
+    _restore_requested = pyqtSignal(object, int)
+
+    def __init__(self, app: QApplication):
+        """
+        初始化监视器（必须在主线程创建）。
+
+        Args:
+            app: Qt应用实例
+        """
+        super().__init__()
+        self._clipboard = app.clipboard()
+        self._condition = threading.Condition()
+        self._sequence = 0
+        self._text = self._clipboard.text()
+        self._snapshot = copy_mime_data(self._clipboard.mimeData())
+        self._pending_writes: List[Tuple[str, float]] = []
+
+        self._clipboard.dataChanged.connect(self._on_data_changed)
+        self._write_requested.connect(self._on_write_requested)
+        self._restore_requested.connect(self._on_restore_requested)
+
+    def _on_data_changed(self) -> None:
+        """剪贴板内容变化（主线程）。"""
+        text = self._clipboard.text()
+        with self._condition:
+            self._text = text
+            # 自身写入引起的变化不计入序号，避免被当作复制结果
+            now = time.monotonic()
+            self._pending_writes = [w for w in self._pending_writes if w[1] > now]
+            if self._pending_writes and self._pending_writes[0][0] == text:
+                self._pending_writes.pop(0)
+            else:
+                self._sequence += 1
+            self._condition.notify_all()
+        # 自身写入（包括恢复）后同样更新快照，之后的获取恢复的是当前内容而非更早的选中文本
+        snapshot = copy_mime_data(self._clipboard.mimeData())
+        with self._condition:
+            self._snapshot = snapshot
+
+    def _on_write_requested(self, text: str) -> None:
+        """执行剪贴板写入（主线程）。"""
+        self._clipboard.setText(text)
+
+    def _on_restore_requested(self, snapshot: QMimeData, expected_sequence: int) -> None:
+        """恢复剪贴板快照（主线程）。"""
+        with self._condition:
+            if self._sequence != expected_sequence:
+                # 之后剪贴板又被用户修改过，不再覆盖
+                logger.debug("剪贴板已被修改，跳过恢复")
+                return
+            self._pending_writes.append((snapshot.text(), time.monotonic() + _SELF_WRITE_TTL))
+        # setMimeData 会接管对象所有权，因此传入副本，快照本身可重复使用
+        self._clipboard.setMimeData(copy_mime_data(snapshot))
+
+    @property
+    def sequence(self) -> int:
+        """外部变化的序号。"""
+        with self._condition:
+            return self._sequence
+
+    @property
+    def text(self) -> str:
+        """最近一次已知的剪贴板文本。"""
+        with self._condition:
+            return self._text
+
+    def snapshot(self) -> QMimeData:
+        """最近一次变化后的剪贴板快照（只读）。"""
+        with self._condition:
+            return self._snapshot
+
+    def wait_for_change(self, after: int, timeout: float) -> Optional[str]:
+        """
+        等待剪贴板在指定序号之后发生变化。
+
+        Args:
+            after: 调用前读取的序号
+            timeout: 超时时间（秒）
+
+        Returns:
+            变化后的文本，超时返回None
+        """
+        with self._condition:
+            if self._condition.wait_for(lambda: self._sequence > after, timeout):
+                return self._text
+            return None
+
+    def set_text(self, text: str) -> None:
+        """写入剪贴板（可在任意线程调用）。"""
+        with self._condition:
+            self._pending_writes.append((text, time.monotonic() + _SELF_WRITE_TTL))
+        self._write_requested.emit(text)
+
+    def restore(self, snapshot: QMimeData, expected_sequence: int) -> None:
+        """
+        恢复剪贴板快照（可在任意线程调用）。
+
+        Args:
+            snapshot: snapshot() 返回的快照
+            expected_sequence: 期望的当前序号，剪贴板在此之后被修改过则放弃恢复
+        """
+        self._restore_requested.emit(snapshot, expected_sequence)
+
+
+_watcher: Optional[ClipboardWatcher] = None
+
+
+def install_clipboard_watcher(app: QApplication) -> ClipboardWatcher:
+    """创建全局剪贴板监视器（在主线程、QApplication创建之后调用）。"""
+    global _watcher
+    if _watcher is None:
+        _watcher = ClipboardWatcher(app)
+        logger.info("剪贴板监视器已启用")
+    return _watcher
+
+
+def get_clipboard_watcher() -> Optional[ClipboardWatcher]:
+    """获取全局剪贴板监视器，未安装时返回None。"""
+    return _watcher
@@ -1,78 +1,58 @@
 """Module for getting selected text from the system."""
 
-import time
-import threading
 from typing import Optional
 
-import pyperclip
-from win32api import keybd_event
-
 from core.logger import get_logger
+from utils.selection_providers import get_provider, is_injecting
 
 logger = get_logger("SelectedText")
 
-
-def get_selected_text_by_clipboard() -> Optional[str]:
-    """
-    通过剪贴板获取选中的文本。
-    
-    Returns:
-        选中的文本，如果没有选中文本则返回None
-    """
-    try:
-        old_clipboard = pyperclip.paste()
-        
-        # 清空剪贴板
-        pyperclip.copy("")
-        
-        # 发送 Ctrl+C 复制选中的文本
-        keybd_event(0x11, 0, 0, 0)  # Ctrl 按下
-        keybd_event(0x43, 0, 0, 0)  # C 按下
-        keybd_event(0x43, 0, 2, 0)  # C 释放
-        keybd_event(0x11, 0, 2, 0)  # Ctrl 释放
-        
-        # 等待剪贴板更新
-        text = ""
-        for _ in range(10):
-            time.sleep(0.02)
-            text = pyperclip.paste()
-            if text:
-                break
-        
-        # 恢复原始剪贴板
-        def restore(old_content: str) -> None:
-            time.sleep(0.2)
-            pyperclip.copy(old_content)
-        
-        threading.Thread(target=restore, args=(old_clipboard,), daemon=True).start()
-        
-        return text
-        
-    except Exception as e:
-        logger.error(f"剪贴板获取文本时出错: {e}")
-        return None
+__all__ = ["get_selected_text", "get_selected_text_passive", "can_capture_passively", "is_injecting"]
 
 
 def get_selected_text() -> str:
     """
     获取选中文本。
-    
+
     Returns:
         选中的文本，如果所有方法都失败则返回空字符串
     """
-    text = get_selected_text_by_clipboard()
-    
+    provider = get_provider()
+    text = provider.capture() if provider is not None else None
+
     if text:
         logger.debug(f"成功获取到 {len(text)} 个字符")
     else:
         logger.debug("未能获取到任何文本")
-    
+
     return text or ""
 
 
+def get_selected_text_passive() -> Optional[str]:
+    """
+    只通过无副作用的方式（PRIMARY 选区、辅助功能接口）获取选中文本，
+    不模拟按键，也不改动剪贴板。
+
+    Returns:
+        选中的文本；没有这类方式或未取到文本时返回None
+    """
+    provider = get_provider()
+    if provider is None or not provider.can_capture_passively():
+        return None
+    return provider.capture_passive() or None
+
+
+def can_capture_passively() -> bool:
+    """当前环境是否有无副作用的选中文本获取方式。"""
+    provider = get_provider()
+    return provider is not None and provider.can_capture_passively()
+
+
 if __name__ == "__main__":
     print("请选择一些文本并按回车键...")
     input()
     text = get_selected_text()
     print(f"选中的文本: {text}")
-
+    provider = get_provider()
+    if provider is not None:
+        print(f"获取方式: {provider.name}, 耗时 {provider.stats.last_ms:.1f} ms")
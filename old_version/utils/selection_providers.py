@@ -0,0 +1,565 @@
+"""Pluggable selected-text providers module."""
+
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+import pyperclip
+
+from core.logger import get_logger
+from utils.clipboard_restorer import get_clipboard_restorer
+from utils.clipboard_watcher import get_clipboard_watcher
+
+try:
+    from win32api import keybd_event
+    import win32gui
+except ImportError:  # 非 Windows 平台
+    keybd_event = None
+    win32gui = None
+
+logger = get_logger("SelectionProvider")
+
+# 等待复制结果写入剪贴板的超时时间（秒）
+COPY_TIMEOUT: float = 0.2
+# 恢复原剪贴板内容前的延迟（秒）
+RESTORE_DELAY: float = 0.2
+# 读取 PRIMARY 选区的子进程超时时间（秒）
+PRIMARY_TIMEOUT: float = 0.5
+# 查找 AT-SPI 焦点控件时最多遍历的节点数
+ATSPI_MAX_NODES: int = 300
+# 单次查找活动窗口或焦点控件的最长时间（秒），超时视为未找到
+ATSPI_SCAN_TIMEOUT: float = 0.05
+# app_id() 找到的活动窗口供随后的读取复用的时间（秒）
+ATSPI_WINDOW_TTL: float = 0.5
+# 某个方式在同一程序中连续失败达到该次数后排到最后
+APP_FAILURE_LIMIT: int = 3
+
+# 模拟按键的时间窗口，供热键监听器忽略自身注入的按键事件
+_INJECTION_GRACE: float = 0.05
+_injection_lock = threading.Lock()
+_injection_active: bool = False
+_injection_end: float = 0.0
+
+
+def is_injecting() -> bool:
+    """是否正在（或刚刚）模拟按键。"""
+    with _injection_lock:
+        return _injection_active or time.monotonic() - _injection_end < _INJECTION_GRACE
+
+
+def _send_copy_keystroke() -> None:
+    """发送 Ctrl+C，并标记注入时间窗口。"""
+    global _injection_active, _injection_end
+    with _injection_lock:
+        _injection_active = True
+    try:
+        keybd_event(0x11, 0, 0, 0)  # Ctrl 按下
+        keybd_event(0x43, 0, 0, 0)  # C 按下
+        keybd_event(0x43, 0, 2, 0)  # C 释放
+        keybd_event(0x11, 0, 2, 0)  # Ctrl 释放
+    finally:
+        with _injection_lock:
+            _injection_active = False
+            _injection_end = time.monotonic()
+
+
+class CaptureStats:
+    """单个后端的获取耗时统计。"""
+
+    def __init__(self):
+        self.count = 0
+        self.failures = 0
+        self.total_ms = 0.0
+        self.success_ms = 0.0   # 成功获取的累计耗时
+        self.last_ms = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    @property
+    def mean_success_ms(self) -> float:
+        """成功获取的平均耗时（不含失败的尝试）。"""
+        successes = self.count - self.failures
+        return self.success_ms / successes if successes else 0.0
+
+    def record(self, elapsed_ms: float, success: bool) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+        if success:
+            self.success_ms += elapsed_ms
+        else:
+            self.failures += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "mean_ms": round(self.mean_ms, 1),
+            "last_ms": round(self.last_ms, 1),
+        }
+
+
+class SelectionProvider(ABC):
+    """选中文本获取后端的基类。
+
+    子类实现 is_available() 与 _read()；capture() 负责计时并记录各后端的
+    获取耗时。
+    """
+
+    name: str = "base"
+    # 获取时会模拟按键或改写剪贴板（终端中 Ctrl+C 即中断信号），不能用于预获取
+    intrusive: bool = False
+
+    def __init__(self):
+        self.stats = CaptureStats()
+
+    def is_available(self) -> bool:
+        """当前环境能否使用该后端。"""
+        return False
+
+    def app_id(self) -> Optional[str]:
+        """当前前台程序的标识，无法识别时返回None。"""
+        return None
+
+    @abstractmethod
+    def _read(self) -> Optional[str]:
+        """读取选中文本，失败返回None。"""
+
+    def capture(self) -> Optional[str]:
+        """
+        获取选中文本并记录耗时。
+
+        Returns:
+            选中的文本，失败返回None
+        """
+        start = time.perf_counter()
+        try:
+            text = self._read()
+        except Exception as e:
+            logger.error(f"[{self.name}] 获取选中文本时出错: {e}")
+            text = None
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.stats.record(elapsed_ms, bool(text))
+        logger.debug(f"[{self.name}] 获取耗时 {elapsed_ms:.1f} ms")
+        return text
+
+    def can_capture_passively(self) -> bool:
+        """能否不模拟按键、不改写剪贴板地获取选中文本。"""
+        return not self.intrusive
+
+    def capture_passive(self) -> Optional[str]:
+        """
+        只使用无副作用的方式获取选中文本（用于尚未确认热键时的预获取）。
+
+        Returns:
+            选中的文本，失败或只有会产生副作用的方式时返回None
+        """
+        if self.intrusive:
+            return None
+        return self.capture()
+
+
+class ClipboardCopyProvider(SelectionProvider):
+    """模拟 Ctrl+C 后从剪贴板读取（Windows）。
+
+    已安装剪贴板监视器时等待变化通知，否则回退到轮询剪贴板。
+    """
+
+    name = "clipboard"
+    intrusive = True
+
+    def is_available(self) -> bool:
+        return keybd_event is not None
+
+    def _read(self) -> Optional[str]:
+        watcher = get_clipboard_watcher()
+        if watcher is not None:
+            return self._read_by_events(watcher)
+        return self._read_by_polling()
+
+    def _read_by_events(self, watcher) -> str:
+        snapshot = watcher.snapshot()
+        sequence = watcher.sequence
+
+        _send_copy_keystroke()
+        text = watcher.wait_for_change(sequence, COPY_TIMEOUT) or ""
+
+        # 恢复原始剪贴板（包含全部格式）；恢复前剪贴板再次被修改则放弃
+        if text:
+            expected = watcher.sequence
+            get_clipboard_restorer().schedule(
+                snapshot,
+                lambda content: watcher.restore(content, expected),
+                RESTORE_DELAY,
+            )
+
+        return text
+
+    def _read_by_polling(self) -> str:
+        old_clipboard = pyperclip.paste()
+
+        # 清空剪贴板
+        pyperclip.copy("")
+
+        # 发送 Ctrl+C 复制选中的文本
+        _send_copy_keystroke()
+
+        # 等待剪贴板更新
+        text = ""
+        for _ in range(10):
+            time.sleep(0.02)
+            text = pyperclip.paste()
+            if text:
+                break
+
+        # 恢复原始剪贴板（pyperclip 只支持文本）
+        get_clipboard_restorer().schedule(old_clipboard, pyperclip.copy, RESTORE_DELAY)
+
+        return text
+
+
+class CommandProvider(SelectionProvider):
+    """运行外部命令读取选区，无需模拟按键，也不改动剪贴板。"""
+
+    command: List[str] = []
+    env_var: str = ""
+
+    def is_available(self) -> bool:
+        if not sys.platform.startswith("linux"):
+            return False
+        if self.env_var and not os.environ.get(self.env_var):
+            return False
+        return shutil.which(self.command[0]) is not None
+
+    def _read(self) -> Optional[str]:
+        result = subprocess.run(
+            self.command,
+            capture_output=True,
+            timeout=PRIMARY_TIMEOUT,
+        )
+        if result.returncode != 0:
+            # 没有选区时命令返回非零，不视为错误
+            return None
+        return result.stdout.decode("utf-8", errors="replace")
+
+
+class WaylandPrimaryProvider(CommandProvider):
+    """读取 Wayland 的 PRIMARY 选区（wl-clipboard）。"""
+
+    name = "wl-paste"
+    command = ["wl-paste", "--primary", "--no-newline", "--type", "text"]
+    env_var = "WAYLAND_DISPLAY"
+
+
+class XclipPrimaryProvider(CommandProvider):
+    """读取 X11 的 PRIMARY 选区（xclip）。"""
+
+    name = "xclip"
+    command = ["xclip", "-selection", "primary", "-out"]
+    env_var = "DISPLAY"
+
+
+class XselPrimaryProvider(CommandProvider):
+    """读取 X11 的 PRIMARY 选区（xsel）。"""
+
+    name = "xsel"
+    command = ["xsel", "--primary", "--output"]
+    env_var = "DISPLAY"
+
+
+class UIAutomationProvider(SelectionProvider):
+    """通过 UI Automation 读取焦点控件的选中文本（Windows）。
+
+    不模拟按键、不改动剪贴板；控件不支持 TextPattern 时返回None。
+    """
+
+    name = "uiautomation"
+
+    def __init__(self):
+        super().__init__()
+        self._auto = None
+
+    def is_available(self) -> bool:
+        return win32gui is not None and importlib.util.find_spec("uiautomation") is not None
+
+    def app_id(self) -> Optional[str]:
+        hwnd = win32gui.GetForegroundWindow()
+        return win32gui.GetClassName(hwnd) if hwnd else None
+
+    def _read(self) -> Optional[str]:
+        if self._auto is None:
+            import uiautomation  # 导入较慢，首次使用时再加载
+            self._auto = uiautomation
+        auto = self._auto
+
+        # COM 需要在每个调用线程中初始化
+        with auto.UIAutomationInitializerInThread():
+            control = auto.GetFocusedControl()
+            if control is None:
+                return None
+            pattern = control.GetPattern(auto.PatternId.TextPattern)
+            if not pattern:
+                return None
+            return "".join(r.GetText(-1) for r in pattern.GetSelection()) or None
+
+
+class AtspiProvider(SelectionProvider):
+    """通过 AT-SPI（D-Bus 会话总线上的辅助功能接口）读取选中文本（Linux）。
+
+    在前台程序的活动窗口中查找焦点控件，读取其 Text 接口的选区。
+    """
+
+    name = "at-spi"
+
+    def __init__(self):
+        super().__init__()
+        self._atspi = None
+        self._focused = None  # 上一次找到的焦点控件，仍有焦点时直接复用
+        self._window: Optional[Tuple[float, Optional[Tuple[object, object]]]] = None  # (查找时间, 结果)
+
+    def is_available(self) -> bool:
+        if not sys.platform.startswith("linux") or not os.environ.get("DBUS_SESSION_BUS_ADDRESS"):
+            return False
+        if importlib.util.find_spec("gi") is None:
+            return False
+        try:
+            import gi
+            gi.require_version("Atspi", "2.0")
+            from gi.repository import Atspi
+        except (ImportError, ValueError):
+            return False
+        self._atspi = Atspi
+        return True
+
+    def _has_state(self, accessible, state) -> bool:
+        return accessible.get_state_set().contains(state)
+
+    def _active_window(self) -> Optional[Tuple[object, object]]:
+        """查找活动窗口，返回 (程序, 窗口)；超时返回None。"""
+        Atspi = self._atspi
+        deadline = time.monotonic() + ATSPI_SCAN_TIMEOUT
+        desktop = Atspi.get_desktop(0)
+        for i in range(desktop.get_child_count()):
+            if time.monotonic() > deadline:
+                logger.debug("查找 AT-SPI 活动窗口超时")
+                return None
+            app = desktop.get_child_at_index(i)
+            if app is None:
+                continue
+            for j in range(app.get_child_count()):
+                window = app.get_child_at_index(j)
+                if window is not None and self._has_state(window, Atspi.StateType.ACTIVE):
+                    return app, window
+        return None
+
+    def _find_focused(self, root):
+        """在窗口中广度优先查找焦点控件。"""
+        Atspi = self._atspi
+        focused = self._focused
+        if focused is not None:
+            try:
+                if self._has_state(focused, Atspi.StateType.FOCUSED):
+                    return focused
+            except Exception:
+                pass
+
+        deadline = time.monotonic() + ATSPI_SCAN_TIMEOUT
+        queue = [root]
+        visited = 0
+        while queue and visited < ATSPI_MAX_NODES:
+            if time.monotonic() > deadline:
+                logger.debug(f"查找 AT-SPI 焦点控件超时（已遍历 {visited} 个节点）")
+                return None
+            node = queue.pop(0)
+            visited += 1
+            if self._has_state(node, Atspi.StateType.FOCUSED):
+                self._focused = node
+                return node
+            for k in range(node.get_child_count()):
+                child = node.get_child_at_index(k)
+                if child is not None:
+                    queue.append(child)
+        return None
+
+    def app_id(self) -> Optional[str]:
+        try:
+            found = self._active_window()
+        except Exception:
+            return None
+        # 同一次获取中随后的 _read() 复用该结果，避免再次遍历
+        self._window = (time.monotonic(), found)
+        return found[0].get_name() if found else None
+
+    def _read(self) -> Optional[str]:
+        Atspi = self._atspi
+        cached, self._window = self._window, None
+        if cached is not None and time.monotonic() - cached[0] < ATSPI_WINDOW_TTL:
+            found = cached[1]
+        else:
+            found = self._active_window()
+        if found is None:
+            return None
+        node = self._find_focused(found[1])
+        if node is None or node.get_text_iface() is None:
+            return None
+
+        parts = []
+        for k in range(Atspi.Text.get_n_selections(node)):
+            selection = Atspi.Text.get_selection(node, k)
+            parts.append(Atspi.Text.get_text(node, selection.start_offset, selection.end_offset))
+        return "".join(parts) or None
+
+
+class AdaptiveProvider(SelectionProvider):
+    """组合多个后端，并按程序记住最快的可用方式。
+
+    默认先使用辅助功能接口，未取到文本时才回退到剪贴板等方式；每个程序
+    成功过的方式按成功获取的平均耗时排序（失败的尝试不计入，避免很快
+    失败的方式排在前面），以后直接从最快的方式开始尝试。
+    """
+
+    name = "adaptive"
+
+    def __init__(self, providers: List[SelectionProvider]):
+        """
+        Args:
+            providers: 按默认优先级排列的后端
+        """
+        super().__init__()
+        self.providers = providers
+        self._lock = threading.Lock()
+        # 程序标识 -> 方式名称 -> 该程序中的耗时统计
+        self._app_stats: Dict[str, Dict[str, CaptureStats]] = {}
+
+    def is_available(self) -> bool:
+        return any(p.is_available() for p in self.providers)
+
+    def app_id(self) -> Optional[str]:
+        for provider in self.providers:
+            try:
+                app = provider.app_id()
+            except Exception:
+                app = None
+            if app:
+                return app
+        return None
+
+    def _ordered(self, app: Optional[str]) -> List[SelectionProvider]:
+        """按该程序的历史结果排列后端。"""
+        with self._lock:
+            stats = dict(self._app_stats.get(app, {})) if app else {}
+
+        def rank(item: Tuple[int, SelectionProvider]) -> tuple:
+            index, provider = item
+            record = stats.get(provider.name)
+            if record is None:
+                return (1, index)
+            if record.count > record.failures:
+                return (0, record.mean_success_ms)
+            if record.failures >= APP_FAILURE_LIMIT:
+                return (2, index)
+            return (1, index)
+
+        return [p for _, p in sorted(enumerate(self.providers), key=rank)]
+
+    def _record(self, app: Optional[str], provider: SelectionProvider, success: bool) -> None:
+        if not app:
+            return
+        with self._lock:
+            stats = self._app_stats.setdefault(app, {})
+            record = stats.setdefault(provider.name, CaptureStats())
+            record.record(provider.stats.last_ms, success)
+
+    def can_capture_passively(self) -> bool:
+        return any(not p.intrusive for p in self.providers)
+
+    def capture_passive(self) -> Optional[str]:
+        app = self.app_id()
+        passive = [p for p in self._ordered(app) if not p.intrusive]
+        return self._capture_from(app, passive)
+
+    def _read(self) -> Optional[str]:
+        app = self.app_id()
+        return self._capture_from(app, self._ordered(app))
+
+    def _capture_from(self, app: Optional[str], providers: List[SelectionProvider]) -> Optional[str]:
+        """依次尝试各后端，返回第一个取到的文本。"""
+        for provider in providers:
+            text = provider.capture()
+            self._record(app, provider, bool(text))
+            if text:
+                logger.debug(f"[{app or '未知程序'}] 使用 {provider.name} 获取选中文本")
+                return text
+        return None
+
+
+# 后端按优先级排列：Wayland 会话下 X11 选区只包含 XWayland 程序，因此优先 wl-paste
+PROVIDER_CLASSES = [
+    WaylandPrimaryProvider,
+    XclipPrimaryProvider,
+    XselPrimaryProvider,
+    ClipboardCopyProvider,
+]
+
+# 辅助功能接口后端，可用时优先于上面的方式
+ACCESSIBILITY_PROVIDER_CLASSES = [
+    UIAutomationProvider,
+    AtspiProvider,
+]
+
+_provider: Optional[SelectionProvider] = None
+_provider_lock = threading.Lock()
+
+
+def detect_provider() -> Optional[SelectionProvider]:
+    """
+    选择当前环境下可用的后端。
+
+    有可用的辅助功能接口时返回组合后端（辅助功能优先，其余方式作为回退），
+    否则返回第一个可用的后端。
+    """
+    accessibility = [p for p in (cls() for cls in ACCESSIBILITY_PROVIDER_CLASSES) if p.is_available()]
+    fallback = next((p for p in (cls() for cls in PROVIDER_CLASSES) if p.is_available()), None)
+    providers = accessibility + ([fallback] if fallback is not None else [])
+    if not providers:
+        return None
+    if len(providers) == 1:
+        return providers[0]
+    return AdaptiveProvider(providers)
+
+
+def get_provider() -> Optional[SelectionProvider]:
+    """获取当前使用的后端（首次调用时自动检测）。"""
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            _provider = detect_provider()
+            if _provider is None:
+                logger.warning("没有可用的选中文本获取方式")
+            else:
+                logger.info(f"选中文本获取方式: {_provider.name}")
+        return _provider
+
+
+def set_provider(provider: Optional[SelectionProvider]) -> None:
+    """指定使用的后端，传None时重新自动检测。"""
+    global _provider
+    with _provider_lock:
+        _provider = provider
+
+
+def get_capture_stats() -> Dict[str, dict]:
+    """当前后端（组合后端时为各个方式）的获取耗时统计。"""
+    provider = _provider
+    if provider is None:
+        return {}
+    providers = provider.providers if isinstance(provider, AdaptiveProvider) else [provider]
+    return {p.name: p.stats.to_dict() for p in providers}
@@ -281,6 +281,7 @@ class SettingsDialog(QDialog):
         self._api_name_edit = QLineEdit()
         self._api_key_edit = QPlainTextEdit()
         self._api_key_edit.setFixedHeight(100)
+        self._api_key_edit.setPlaceholderText("每行一个密钥，填写多个密钥时将轮换使用")
         self._base_url_edit = QLineEdit()
         
         api_edit_inner_layout.addRow("配置名称:", self._api_name_edit)
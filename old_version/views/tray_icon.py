@@ -36,6 +36,7 @@ class TrayIconView:
         self._on_settings_click: Optional[Callable[[], None]] = None
         self._on_startup_toggle: Optional[Callable[[bool], None]] = None
         self._on_source_comparison_toggle: Optional[Callable[[bool], None]] = None
+        self._on_speculative_toggle: Optional[Callable[[bool], None]] = None
         self._on_quit_click: Optional[Callable[[], None]] = None
         self._on_tray_activated: Optional[Callable[[QSystemTrayIcon.ActivationReason], None]] = None
         
@@ -52,6 +53,10 @@ class TrayIconView:
         self._actions["source_comparison"].setCheckable(True)
         self._actions["source_comparison"].triggered.connect(self._handle_source_comparison_toggle)
         
+        self._actions["speculative"] = QAction("附加文本预翻译")
+        self._actions["speculative"].setCheckable(True)
+        self._actions["speculative"].triggered.connect(self._handle_speculative_toggle)
+        
         self._actions["startup"] = QAction("开机自启动")
         self._actions["startup"].setCheckable(True)
         self._actions["startup"].triggered.connect(self._handle_startup_toggle)
@@ -68,6 +73,7 @@ class TrayIconView:
         self._menu.addAction(self._actions["settings"])
         self._menu.addSeparator()
         self._menu.addAction(self._actions["source_comparison"])
+        self._menu.addAction(self._actions["speculative"])
         self._menu.addAction(self._actions["startup"])
         self._menu.addSeparator()
         self._menu.addAction(self._actions["about"])
@@ -93,6 +99,10 @@ class TrayIconView:
         if self._on_source_comparison_toggle:
             self._on_source_comparison_toggle(checked)
     
+    def _handle_speculative_toggle(self, checked: bool) -> None:
+        if self._on_speculative_toggle:
+            self._on_speculative_toggle(checked)
+    
     def _handle_quit_click(self) -> None:
         if self._on_quit_click:
             self._on_quit_click()
@@ -118,6 +128,10 @@ class TrayIconView:
         """设置原文对照选项的选中状态。"""
         self._actions["source_comparison"].setChecked(checked)
     
+    def set_speculative_checked(self, checked: bool) -> None:
+        """设置附加文本预翻译选项的选中状态。"""
+        self._actions["speculative"].setChecked(checked)
+    
     # 回调设置
     def set_on_settings_click(self, callback: Callable[[], None]) -> None:
         self._on_settings_click = callback
@@ -128,6 +142,9 @@ class TrayIconView:
     def set_on_source_comparison_toggle(self, callback: Callable[[bool], None]) -> None:
         self._on_source_comparison_toggle = callback
     
+    def set_on_speculative_toggle(self, callback: Callable[[bool], None]) -> None:
+        self._on_speculative_toggle = callback
+    
     def set_on_quit_click(self, callback: Callable[[], None]) -> None:
         self._on_quit_click = callback
     